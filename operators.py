@@ -34,57 +34,185 @@ class luxmeter_OT_MeasureAll(bpy.types.Operator):
     bl_description = bpy.app.translations.pgettext_tip("Measures the illuminance (lux) for all sensors in the collection. This may take time as it involves rendering")
     bl_options = {'REGISTER', 'UNDO'}
 
-    def execute(self, context):
-        props = context.scene.analysis_toolkit_props
+    def get_sensors(self, context):
         collection_name = "LuxMeter Sensors"
         if collection_name not in bpy.data.collections:
             self.report({'WARNING'}, f"Collection '{collection_name}' not found.")
-            return {'CANCELLED'}
+            return None
 
         sensor_collection = bpy.data.collections[collection_name]
         sensors = [obj for obj in sensor_collection.objects if obj.type == 'EMPTY']
         if not sensors:
             self.report({'WARNING'}, "No sensors found in the collection.")
-            return {'CANCELLED'}
+            return None
+        return sensors
 
+    def prepare(self, context):
+        props = context.scene.analysis_toolkit_props
         props.lux_meter_results.clear()
-        lux_values = []
+        utils.update_lux_statistics(props)
+
+        self.scale = props.speedometer_props.scale_factor
+        if self.scale <= 0: self.scale = 1.0
+        self.ev_comp = props.lux_meter_ev_compensation
+        self.tolerance = props.lux_meter_tolerance / 100.0 if props.lux_meter_adaptive else None
+        self.max_samples = props.lux_meter_max_samples if props.lux_meter_adaptive else utils.LUX_SAMPLES
+
+    def add_result(self, props, name, measurement):
+        raw_cycles_lux, raw_cycles_error, samples = measurement
+        new_result = props.lux_meter_results.add()
+        new_result.name = name
+        new_result.samples = samples
         
-        scale = props.speedometer_props.scale_factor
-        if scale <= 0: scale = 1.0
-        ev_comp = props.lux_meter_ev_compensation
+        physical_lux = raw_cycles_lux / (self.scale**2)
+        new_result.raw_lux = physical_lux
         
+        display_lux = physical_lux * (2**self.ev_comp)
+        new_result.lux = display_lux
+
+        if raw_cycles_error >= 0.0:
+            new_result.raw_lux_error = raw_cycles_error / (self.scale**2)
+            new_result.lux_error = new_result.raw_lux_error * (2**self.ev_comp)
+
+    def measure_baked(self, context, props, sensors):
+        # One bake for all sensors (no error estimate). Adaptive sampling needs the renders.
+        # False if the renders should measure instead
+        if not props.lux_meter_use_bake or props.lux_meter_adaptive: return False
+        try: raw_values = utils.perform_lux_measurements_baked(context, sensors)
+        except RuntimeError as e:
+            self.report({'WARNING'}, f"{e}. Measuring each sensor with a render.")
+            return False
+        for sensor, raw_cycles_lux in zip(sensors, raw_values):
+            if raw_cycles_lux is not None: self.add_result(props, sensor.name, (raw_cycles_lux, -1.0, utils.LUX_SAMPLES))
+        return True
+
+    def report_done(self, props):
+        utils.update_lux_statistics(props)
+        if props.lux_meter_results:
+            self.report({'INFO'}, "All sensor measurements are complete.")
+        else:
+            self.report({'WARNING'}, "No valid measurements were obtained.")
+
+    def execute(self, context):
+        # Blocking measurement for scripts and redo; the panel button runs the modal version
+        sensors = self.get_sensors(context)
+        if sensors is None: return {'CANCELLED'}
+        self.prepare(context)
+        props = context.scene.analysis_toolkit_props
+
+        if not self.measure_baked(context, props, sensors):
+            wm = context.window_manager
+            wm.progress_begin(0, len(sensors))
+            # One rig for all renders
+            try:
+                with utils.LuxMeasurementSession(context) as session:
+                    for i, sensor in enumerate(sensors):
+                        self.report({'INFO'}, f"Measuring sensor '{sensor.name}'... ({i+1}/{len(sensors)})")
+                        measurement = session.measure(sensor, self.tolerance, self.max_samples)
+                        if measurement is not None: self.add_result(props, sensor.name, measurement)
+                        wm.progress_update(i + 1)
+            except RuntimeError as e:
+                self.report({'WARNING'}, str(e))
+            wm.progress_end()
+
+        self.report_done(props)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        sensors = self.get_sensors(context)
+        if sensors is None: return {'CANCELLED'}
+        self.prepare(context)
+        props = context.scene.analysis_toolkit_props
+
+        # One step per timer tick: the bake (if enabled) first, then one render per sensor.
+        # Scene, sensors and rig are looked up by name each tick; RNA references may not survive the modal
+        self.scene_name = context.scene.name
+        self.sensor_names = [sensor.name for sensor in sensors]
+        self.use_bake = props.lux_meter_use_bake and not props.lux_meter_adaptive
+        self.session = utils.LuxMeasurementSession(context, hold_scene=False)
+        self.index = 0
+        self.undo_count = utils.lux_undo_count
+
         wm = context.window_manager
-        wm.progress_begin(0, len(sensors))
+        wm.progress_begin(0, len(self.sensor_names))
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        self.update_status(context)
+        return {'RUNNING_MODAL'}
 
-        for i, sensor in enumerate(sensors):
-            self.report({'INFO'}, f"Measuring sensor '{sensor.name}'... ({i+1}/{len(sensors)})")
-            raw_cycles_lux = utils.perform_lux_measurement(context, sensor)
-            
-            if raw_cycles_lux is not None:
-                new_result = props.lux_meter_results.add()
-                new_result.name = sensor.name
-                
-                physical_lux = raw_cycles_lux / (scale**2)
-                new_result.raw_lux = physical_lux
-                
-                display_lux = physical_lux * (2**ev_comp)
-                new_result.lux = display_lux
-                
-                lux_values.append(display_lux)
-
-            wm.progress_update(i + 1)
+    def modal(self, context, event):
+        scene = bpy.data.scenes.get(self.scene_name)
+        if scene is None:
+            self.finish(context)
+            return {'CANCELLED'}
+        props = scene.analysis_toolkit_props
+        if utils.lux_undo_count != self.undo_count:
+            # The undone state has neither the rig nor the results measured so far
+            self.finish(context)
+            self.report({'WARNING'}, "Measurement stopped: undo removed the measurement and its results.")
+            return {'CANCELLED'}
+        if event.type == 'ESC' and event.value == 'PRESS':
+            # Keeps the sensors measured so far
+            self.finish(context)
+            self.report({'INFO'}, f"Measurement cancelled after {self.index}/{len(self.sensor_names)} sensors.")
+            return {'CANCELLED'}
+        # Undo would remove the rig and the results measured so far; other ways to undo are caught above
+        if event.type == 'Z' and (event.ctrl or event.oskey): return {'RUNNING_MODAL'}
+        if event.type != 'TIMER' or event.timer is not self._timer: return {'PASS_THROUGH'}
+
+        if self.use_bake:
+            self.use_bake = False
+            sensors = [obj for obj in (bpy.data.objects.get(name) for name in self.sensor_names) if obj is not None]
+            if self.measure_baked(context, props, sensors):
+                self.finish(context)
+                self.report_done(props)
+                return {'FINISHED'}
+            self.update_status(context)
+            return {'RUNNING_MODAL'}
+
+        name = self.sensor_names[self.index]
+        sensor = bpy.data.objects.get(name)
+        if sensor is not None:
+            try:
+                self.session.start()
+                measurement = self.session.measure(sensor, self.tolerance, self.max_samples)
+            except RuntimeError as e:
+                self.finish(context)
+                self.report({'WARNING'}, str(e))
+                return {'CANCELLED'}
+            if measurement is not None:
+                self.add_result(props, name, measurement)
+                utils.update_lux_statistics(props)
+
+        self.index += 1
+        context.window_manager.progress_update(self.index)
+        if self.index >= len(self.sensor_names):
+            self.finish(context)
+            self.report_done(props)
+            return {'FINISHED'}
+        self.update_status(context)
+        return {'RUNNING_MODAL'}
 
+    def update_status(self, context):
+        if self.use_bake: text = bpy.app.translations.pgettext_iface("Baking {count} sensors...").format(count=len(self.sensor_names))
+        else: text = bpy.app.translations.pgettext_iface("Measuring sensor {index}/{count}... (Esc to cancel)").format(index=self.index + 1, count=len(self.sensor_names))
+        if context.workspace: context.workspace.status_text_set(text)
+        if context.window:
+            for area in context.window.screen.areas: area.tag_redraw()
+
+    def finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
         wm.progress_end()
+        if context.workspace: context.workspace.status_text_set(None)
+        # Restores the window scene and removes the rig; does nothing after a file change
+        self.session.close()
+        if context.window:
+            for area in context.window.screen.areas: area.tag_redraw()
 
-        if lux_values:
-            props.lux_meter_avg_lux = sum(lux_values) / len(lux_values)
-            props.lux_meter_min_lux = min(lux_values)
-            props.lux_meter_max_lux = max(lux_values)
-            self.report({'INFO'}, "All sensor measurements are complete.")
-        else:
-            self.report({'WARNING'}, "No valid measurements were obtained.")
-        return {'FINISHED'}
+    def cancel(self, context):
+        # Blender ends the modal (e.g. a file is loaded; the load_pre handler has already detached the session)
+        self.finish(context)
 
 class luxmeter_OT_SaveResultsCSV(bpy.types.Operator):
     bl_idname = "scene_analysis.save_results_csv"
@@ -104,9 +232,14 @@ class luxmeter_OT_SaveResultsCSV(bpy.types.Operator):
             self.report({'WARNING'}, "No results to save.")
             return {'CANCELLED'}
 
-        csv_content = "Sensor Name,Lux Value\n"
+        # 95% confidence bounds are left empty when unknown (batched bake)
+        csv_content = "Sensor Name,Lux Value,95% CI Low,95% CI High,Samples\n"
         for result in results:
-            csv_content += f"{result.name},{result.lux:.2f}\n"
+            if result.lux_error >= 0.0:
+                bounds = f"{result.lux - result.lux_error:.2f},{result.lux + result.lux_error:.2f}"
+            else:
+                bounds = ","
+            csv_content += f"{result.name},{result.lux:.2f},{bounds},{result.samples}\n"
         
         try:
             with open(self.filepath, 'w', encoding='utf-8') as f:
@@ -210,14 +343,121 @@ class TEXELDENSITY_OT_Calculate(bpy.types.Operator):
     def poll(cls, context):
         if not hasattr(context.scene, 'analysis_toolkit_props'): return False
         props = context.scene.analysis_toolkit_props.texel_density_calculator
-        return props and props.target_object and props.target_object.data.uv_layers and context.scene.camera
+        if utils.is_multi_camera(props):
+            if not utils.get_texel_density_cameras(context, props): return False
+        elif not context.scene.camera: return False
+        if props.target_mode == 'COLLECTION': return props.target_collection is not None
+        if props.target_mode == 'SELECTION': return bool(context.selected_objects)
+        return props and props.target_object and utils.has_texel_uvs(props, props.target_object)
 
     def execute(self, context):
         result = utils.calculate_texel_density(context)
         if result == 'SUCCESS':
             self.report({'INFO'}, "Texel density calculated successfully.")
+        elif result == 'RUNNING':
+            self.report({'INFO'}, "Calculating texel density in the background.")
         else:
-            self.report({'WARNING'}, result)
+            self.report({'WARNING'}, utils.translate(result))
+        return {'FINISHED'}
+
+class TEXELDENSITY_OT_CalculateRange(bpy.types.Operator):
+    bl_idname = "scene_analysis.calculate_texel_density_range"
+    bl_label = "Calculate over Frame Range"
+    bl_description = bpy.app.translations.pgettext_tip("Finds the peak required texture resolution over the frame range. Frames where neither the camera nor the object moved are skipped")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        if not TEXELDENSITY_OT_Calculate.poll(context): return False
+        return context.scene.analysis_toolkit_props.texel_density_calculator.target_mode == 'OBJECT'
+
+    def execute(self, context):
+        result, evaluated, skipped = utils.calculate_texel_density_range(context)
+        if result != 'SUCCESS':
+            self.report({'WARNING'}, utils.translate(result))
+            return {'CANCELLED'}
+        props = context.scene.analysis_toolkit_props.texel_density_calculator
+        self.report({'INFO'}, utils.translate("Peak at frame {frame} ({evaluated} frames evaluated, {skipped} unchanged frames skipped).", frame=props.result_peak_frame, evaluated=evaluated, skipped=skipped))
+        return {'FINISHED'}
+
+class TEXELDENSITY_OT_WriteHeatmap(bpy.types.Operator):
+    bl_idname = "scene_analysis.texel_density_heatmap"
+    bl_label = "Write Heatmap Attribute"
+    bl_description = bpy.app.translations.pgettext_tip("Writes each face's required resolution to a face attribute and a color attribute of the target mesh")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        if not TEXELDENSITY_OT_Calculate.poll(context): return False
+        return context.scene.analysis_toolkit_props.texel_density_calculator.target_mode == 'OBJECT'
+
+    def execute(self, context):
+        result = utils.write_texel_density_heatmap(context)
+        if result != 'SUCCESS':
+            self.report({'WARNING'}, utils.translate(result))
+            return {'CANCELLED'}
+        self.report({'INFO'}, utils.translate("Heatmap written to '{attr}' and '{color}'.", attr=utils.HEATMAP_ATTRIBUTE, color=utils.HEATMAP_COLOR_ATTRIBUTE))
+        return {'FINISHED'}
+
+class TEXELDENSITY_OT_SaveTextureReportCSV(bpy.types.Operator):
+    bl_idname = "scene_analysis.save_texture_report_csv"
+    bl_label = "Save Texture Report as CSV"
+    bl_description = bpy.app.translations.pgettext_tip("Saves the required and actual size of every assigned image texture to a CSV file")
+
+    filepath: StringProperty(subtype="FILE_PATH")
+
+    def invoke(self, context, event):
+        self.filepath = "texture_report.csv"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        props = context.scene.analysis_toolkit_props.texel_density_calculator
+        if not props.texture_results:
+            self.report({'WARNING'}, "No results to save.")
+            return {'CANCELLED'}
+
+        csv_content = "Image,Materials,Width,Height,Required Resolution,Recommended Resolution,Status,Savings (MB)\n"
+        for item in props.texture_results:
+            target_resolution, final_resolution = utils.required_texel_resolution(item.density_ratio, props.pixel_ratio_percentage)
+            status = utils.texel_texture_status(item, props.pixel_ratio_percentage)
+            csv_content += f"\"{item.name}\",\"{item.materials}\",{item.width},{item.height},{target_resolution:.0f},{final_resolution},{status},{item.saved_bytes / 2**20:.2f}\n"
+
+        try:
+            with open(self.filepath, 'w', encoding='utf-8') as f:
+                f.write(csv_content)
+            self.report({'INFO'}, f"Results saved to {self.filepath}")
+        except Exception as e:
+            self.report({'ERROR'}, f"Failed to save file: {e}")
+            return {'CANCELLED'}
+
+        return {'FINISHED'}
+
+class TESSELLATION_OT_Calculate(bpy.types.Operator):
+    bl_idname = "scene_analysis.tessellation_density"
+    bl_label = "Analyze Tessellation"
+    bl_description = bpy.app.translations.pgettext_tip("Measures how many triangles each target draws per screen pixel, per object and per frame region")
+
+    @classmethod
+    def poll(cls, context):
+        if not hasattr(context.scene, 'analysis_toolkit_props') or not context.scene.camera: return False
+        return bool(utils.get_tessellation_targets(context, context.scene.analysis_toolkit_props.texel_density_calculator))
+
+    def execute(self, context):
+        result = utils.calculate_tessellation_density(context)
+        if result != 'SUCCESS':
+            self.report({'WARNING'}, utils.translate(result))
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+class TEXELDENSITY_OT_SetSceneRange(bpy.types.Operator):
+    bl_idname = "scene_analysis.texel_density_scene_range"; bl_label = "Use Scene Frame Range"
+    bl_description = bpy.app.translations.pgettext_tip("Set the analysis range to the scene's start and end frames")
+    bl_options = {'REGISTER', 'UNDO'}
+    def execute(self, context):
+        props = context.scene.analysis_toolkit_props.texel_density_calculator
+        props.range_start_frame = context.scene.frame_start
+        props.range_end_frame = context.scene.frame_end
         return {'FINISHED'}
 
 # --- SPEEDO Operator ---
@@ -441,6 +681,11 @@ classes = (
     luxmeter_OT_SaveResultsCSV,
     luxmeter_OT_CorrectSun,
     TEXELDENSITY_OT_Calculate,
+    TEXELDENSITY_OT_CalculateRange,
+    TEXELDENSITY_OT_SetSceneRange,
+    TEXELDENSITY_OT_WriteHeatmap,
+    TEXELDENSITY_OT_SaveTextureReportCSV,
+    TESSELLATION_OT_Calculate,
     SPEEDO_OT_CalculateRangeSpeed,
     SPEEDO_OT_SetFrameA,
     SPEEDO_OT_SetFrameB,
@@ -24,30 +24,258 @@ class luxmeterResultItem(bpy.types.PropertyGroup):
     name: bpy.props.StringProperty()
     lux: bpy.props.FloatProperty()
     raw_lux: bpy.props.FloatProperty()
+    # 95% confidence half-width; negative when unknown (batched bake)
+    lux_error: bpy.props.FloatProperty(default=-1.0)
+    raw_lux_error: bpy.props.FloatProperty(default=-1.0)
+    samples: bpy.props.IntProperty()
+
+class TexelDensityResultItem(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty()
+    density_ratio: bpy.props.FloatProperty()
+    face_count: bpy.props.IntProperty()
+
+class TexelDensityTileItem(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty()
+    density_ratio: bpy.props.FloatProperty()
+    coverage: bpy.props.FloatProperty()
+
+class TexelDensityHistogramItem(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty()
+    share: bpy.props.FloatProperty()
+
+class TexelDensityIslandItem(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty()
+    face_count: bpy.props.IntProperty()
+    density_ratio: bpy.props.FloatProperty()
+    screen_coverage: bpy.props.FloatProperty()
+    wasted_share: bpy.props.FloatProperty()
+
+class TexelDensityTextureItem(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty()
+    materials: bpy.props.StringProperty()
+    width: bpy.props.IntProperty()
+    height: bpy.props.IntProperty()
+    density_ratio: bpy.props.FloatProperty()
+    saved_bytes: bpy.props.FloatProperty()
+
+class TessellationResultItem(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty()
+    triangle_count: bpy.props.IntProperty()
+    screen_area: bpy.props.FloatProperty()
+    subpixel_count: bpy.props.IntProperty()
+    frame: bpy.props.IntProperty(default=-1)
 
 class TexelDensityPropertyGroup(bpy.types.PropertyGroup):
+    target_mode: EnumProperty(
+        name="Target Mode",
+        items=[
+            ('OBJECT', "Object", bpy.app.translations.pgettext_tip("Analyze a single mesh object")),
+            ('COLLECTION', "Collection", bpy.app.translations.pgettext_tip("Analyze every mesh with a UV map in a collection")),
+            ('SELECTION', "Selection", bpy.app.translations.pgettext_tip("Analyze every selected mesh with a UV map"))
+        ],
+        default='OBJECT',
+        update=utils.on_texel_density_property_change
+    )
+    target_collection: PointerProperty(name="Target Collection", type=bpy.types.Collection)
+    use_instances: BoolProperty(
+        name="Include Instances",
+        description=bpy.app.translations.pgettext_tip("Also evaluate collection instances, particles and geometry node instances of the targets. Each unique mesh is read once and its instances are projected together"),
+        default=False,
+        update=utils.on_texel_density_property_change
+    )
+    use_process_pool: BoolProperty(
+        name="Use Process Pool",
+        description=bpy.app.translations.pgettext_tip("Evaluate objects in parallel worker processes when at least two targets have 1,000,000 faces or more. Copying a mesh to the workers costs about as much as evaluating it, so this only helps with several large objects on many cores. The workers start on first use and are reused for the session. Falls back to in-process evaluation if workers cannot be started"),
+        default=False
+    )
     target_object: PointerProperty(
         name="Target Object",
         type=bpy.types.Object,
         poll=lambda self, object: object.type == 'MESH',
         update=utils.on_texel_density_property_change
     )
+    uv_source: EnumProperty(
+        name="UV Source",
+        items=[
+            ('UV_MAP', "UV Map", bpy.app.translations.pgettext_tip("Measure the active UV map of the object")),
+            ('PROJECTOR', "Projector", bpy.app.translations.pgettext_tip("A projector camera defines the texture space (camera projection). The result is the projection image resolution the render camera needs"))
+        ],
+        default='UV_MAP',
+        update=utils.on_texel_density_property_change
+    )
+    projector_camera: PointerProperty(
+        name="Projector Camera",
+        type=bpy.types.Object,
+        poll=lambda self, object: object.type == 'CAMERA',
+        update=utils.on_texel_density_property_change
+    )
+    camera_source: EnumProperty(
+        name="Cameras",
+        items=[
+            ('ACTIVE', "Active", bpy.app.translations.pgettext_tip("Evaluate the active scene camera")),
+            ('COLLECTION', "Collection", bpy.app.translations.pgettext_tip("Evaluate every camera in a collection")),
+            ('MARKERS', "Markers", bpy.app.translations.pgettext_tip("Evaluate every camera bound to a timeline marker"))
+        ],
+        default='ACTIVE',
+        update=utils.on_texel_density_property_change
+    )
+    camera_collection: PointerProperty(name="Camera Collection", type=bpy.types.Collection, update=utils.on_texel_density_property_change)
     pixel_ratio_percentage: IntProperty(
         name="Target Pixel Ratio",
         description=bpy.app.translations.pgettext_tip("How many texture pixels to assign per 1 screen pixel. The slider goes up to 100%, but higher values can be entered manually"),
         default=100, min=10, max=400, soft_min=10, soft_max=100, subtype='PERCENTAGE',
-        update=utils.on_texel_density_property_change
+        update=utils.on_texel_density_derived_change
     )
     udim_resolution: EnumProperty(
         name="UDIM Base Resolution",
         items=[('1024', '1024x1024', ''), ('2048', '2048x2048', ''), ('4096', '4096x4096', ''), ('8192', '8192x8192', '')],
         default='2048',
+        update=utils.on_texel_density_derived_change
+    )
+    resolution_basis: EnumProperty(
+        name="Resolution Basis",
+        description=bpy.app.translations.pgettext_tip("Which face density the recommendation is based on. Percentiles are weighted by screen area, so a few sliver faces do not drive the result"),
+        items=[
+            ('MAX', "Maximum", bpy.app.translations.pgettext_tip("Every visible face gets at least the target pixel ratio")),
+            ('P99', "99th Percentile", bpy.app.translations.pgettext_tip("99% of the visible screen area gets at least the target pixel ratio")),
+            ('P95', "95th Percentile", bpy.app.translations.pgettext_tip("95% of the visible screen area gets at least the target pixel ratio"))
+        ],
+        default='MAX',
+        update=utils.on_texel_density_derived_change
+    )
+    engine: EnumProperty(
+        name="Engine",
+        description=bpy.app.translations.pgettext_tip("NumPy evaluates all faces at once. Streaming keeps compact copies of the mesh and evaluates it in fixed-size chunks, so the working memory does not grow with the mesh. BMesh is the original per-face implementation, kept as a reference"),
+        items=[('NUMPY', "NumPy (Fast)", ""), ('STREAMING', "NumPy (Streaming)", ""), ('BMESH', "BMesh (Reference)", "")],
+        default='NUMPY',
         update=utils.on_texel_density_property_change
     )
+    density_mode: EnumProperty(
+        name="Density",
+        items=[
+            ('AREA', "Area", bpy.app.translations.pgettext_tip("Screen area divided by UV area. Stretching averages out")),
+            ('ANISOTROPIC', "Max Axis", bpy.app.translations.pgettext_tip("Density along the most stretched direction, from the singular values of each triangle's UV to screen Jacobian"))
+        ],
+        default='AREA',
+        update=utils.on_texel_density_property_change
+    )
+    use_background: BoolProperty(
+        name="Background Calculation",
+        description=bpy.app.translations.pgettext_tip("Run the NumPy calculation of a single object on a worker thread so the viewport never freezes. The result appears when it is ready; a newer calculation discards an unfinished one"),
+        default=True
+    )
+    use_progressive: BoolProperty(
+        name="Progressive",
+        description=bpy.app.translations.pgettext_tip("Show an estimate from a stratified random sample of faces within about 50 ms, with a 95% confidence band, and refine it in short slices until every face is processed. The final result is exact"),
+        default=False
+    )
+    use_occlusion: BoolProperty(
+        name="Occlusion",
+        description=bpy.app.translations.pgettext_tip("Ignore faces hidden behind other geometry or behind the object itself. Uses a software depth buffer, so it also works without a GPU"),
+        default=False,
+        update=utils.on_texel_density_property_change
+    )
+    occlusion_scale: FloatProperty(
+        name="Depth Buffer Scale",
+        description=bpy.app.translations.pgettext_tip("Depth buffer resolution as a fraction of the render resolution. Lower is faster but may miss thin occluders"),
+        default=0.25, min=0.05, max=1.0, subtype='FACTOR',
+        update=utils.on_texel_density_property_change
+    )
+    occluder_source: EnumProperty(
+        name="Occluders",
+        items=[
+            ('SCENE', "Scene", bpy.app.translations.pgettext_tip("All visible mesh objects in the scene can occlude")),
+            ('COLLECTION', "Collection", bpy.app.translations.pgettext_tip("Only the mesh objects of a collection, and the targets themselves, can occlude"))
+        ],
+        default='SCENE',
+        update=utils.on_texel_density_property_change
+    )
+    occluder_collection: PointerProperty(name="Occluder Collection", type=bpy.types.Collection, update=utils.on_texel_density_property_change)
+    calc_mode: EnumProperty(
+        name="Calculation Mode",
+        items=[
+            ('CURRENT', "Current Frame", bpy.app.translations.pgettext_tip("Evaluates the camera and object at the current frame")),
+            ('RANGE', "Frame Range", bpy.app.translations.pgettext_tip("Finds the frame that requires the highest resolution within a frame range"))
+        ],
+        default='CURRENT',
+        update=utils.on_texel_density_property_change
+    )
+    live_update: BoolProperty(
+        name="Live Update",
+        description=bpy.app.translations.pgettext_tip("Recalculate automatically while the camera or the target object moves. Mesh data is cached, so only the projection is redone"),
+        default=False
+    )
+    range_start_frame: IntProperty(name="Range Start Frame", default=1)
+    range_end_frame: IntProperty(name="Range End Frame", default=250)
+    heatmap_mode: EnumProperty(
+        name="Heatmap Value",
+        items=[
+            ('RESOLUTION', "Required Resolution", bpy.app.translations.pgettext_tip("Write each face's required texture resolution in pixels")),
+            ('RATIO', "Ratio to Texture Size", bpy.app.translations.pgettext_tip("Write each face's required resolution divided by the texture size. 1.0 means the texture is exactly enough"))
+        ],
+        default='RESOLUTION'
+    )
+    heatmap_texture_size: EnumProperty(
+        name="Texture Size",
+        items=[('1024', '1024x1024', ''), ('2048', '2048x2048', ''), ('4096', '4096x4096', ''), ('8192', '8192x8192', '')],
+        default='2048',
+        update=utils.on_texel_density_derived_change
+    )
+    heatmap_panel_expanded: BoolProperty(name="Expand Heatmap", default=False)
+    analyze_islands: BoolProperty(
+        name="UV Islands",
+        description=bpy.app.translations.pgettext_tip("Also report the required resolution, screen coverage and wasted texture budget of each UV island"),
+        default=False,
+        update=utils.on_texel_density_property_change
+    )
+    island_panel_expanded: BoolProperty(name="Expand UV Islands", default=False)
+    analyze_textures: BoolProperty(
+        name="Assigned Textures",
+        description=bpy.app.translations.pgettext_tip("Compare the required resolution of each material with the size of the image textures it uses"),
+        default=False,
+        update=utils.on_texel_density_property_change
+    )
+    texture_panel_expanded: BoolProperty(name="Expand Assigned Textures", default=False)
+    statistics_panel_expanded: BoolProperty(name="Expand Statistics", default=False)
     result_effective_resolution: StringProperty(name="Effective Resolution", default="N/A")
     result_resolution: StringProperty(name="Recommended Resolution", default="N/A")
     result_udim_tiles: IntProperty(name="UDIM Tiles", default=-1)
     result_coverage: StringProperty(name="Coverage", default="")
+    result_peak_frame: IntProperty(name="Peak Frame", default=-1)
+    result_projection_resolution: StringProperty(name="Projection Image Resolution", default="")
+    result_progress: FloatProperty(name="Progress", default=0.0, subtype='PERCENTAGE')
+    result_confidence: StringProperty(name="Confidence Band", default="")
+    result_density_ratio: FloatProperty(name="Max Density Ratio", default=0.0, options={'HIDDEN'})
+    result_cull_faces: IntProperty(name="Evaluated Faces", default=-1)
+    result_cull_object: IntProperty(name="Faces Culled by Object Bounds", default=0)
+    result_cull_chunk: IntProperty(name="Faces Culled by Chunk Bounds", default=0)
+    result_cull_face: IntProperty(name="Faces Culled per Face", default=0)
+    result_p50: StringProperty(name="P50 Resolution", default="N/A")
+    result_p95: StringProperty(name="P95 Resolution", default="N/A")
+    result_p99: StringProperty(name="P99 Resolution", default="N/A")
+    object_results: CollectionProperty(type=TexelDensityResultItem)
+    camera_results: CollectionProperty(type=TexelDensityResultItem)
+    tile_results: CollectionProperty(type=TexelDensityTileItem)
+    histogram_results: CollectionProperty(type=TexelDensityHistogramItem)
+    mip_results: CollectionProperty(type=TexelDensityHistogramItem)
+    tessellation_panel_expanded: BoolProperty(name="Expand Tessellation", default=False)
+    tessellation_use_range: BoolProperty(
+        name="Use Frame Range",
+        description=bpy.app.translations.pgettext_tip("Evaluate every frame of the frame range and keep the densest frame of each object and region"),
+        default=False
+    )
+    tessellation_target_pixels: FloatProperty(
+        name="Target Triangle Size",
+        description=bpy.app.translations.pgettext_tip("Screen area in pixels an average triangle should cover. Used for the decimation and subdivision suggestions"),
+        default=8.0, min=0.1, soft_max=100.0
+    )
+    result_tessellation: StringProperty(name="Triangles per Pixel", default="")
+    tessellation_results: CollectionProperty(type=TessellationResultItem)
+    tessellation_region_results: CollectionProperty(type=TessellationResultItem)
+    result_island_count: IntProperty(name="UV Island Count", default=-1)
+    island_results: CollectionProperty(type=TexelDensityIslandItem)
+    result_texture_savings: FloatProperty(name="Texture Memory Savings", default=-1.0)
+    texture_results: CollectionProperty(type=TexelDensityTextureItem)
 
 class SpeedometerPropertyGroup(bpy.types.PropertyGroup):
     scale_factor: FloatProperty(
@@ -112,6 +340,26 @@ class AnalysisToolkitPropertyGroup(bpy.types.PropertyGroup):
         precision=2,
         update=utils.on_ev_compensation_change
     )
+    lux_meter_use_bake: BoolProperty(
+        name="Batched Bake",
+        description=bpy.app.translations.pgettext_tip("Measure all sensors with a single Cycles bake of a probe mesh (one tiny face per sensor) instead of one render per sensor"),
+        default=False
+    )
+    lux_meter_adaptive: BoolProperty(
+        name="Adaptive Samples",
+        description=bpy.app.translations.pgettext_tip("Render each sensor in growing sample batches until the standard error of its mean luminance is within the tolerance. Takes precedence over the batched bake"),
+        default=False
+    )
+    lux_meter_tolerance: FloatProperty(
+        name="Tolerance",
+        description=bpy.app.translations.pgettext_tip("Relative standard error of the measurement at which sampling stops"),
+        default=2.0, min=0.1, max=50.0, precision=1, subtype='PERCENTAGE'
+    )
+    lux_meter_max_samples: IntProperty(
+        name="Max Samples",
+        description=bpy.app.translations.pgettext_tip("Sample limit of an adaptive measurement"),
+        default=4096, min=32, max=65536
+    )
     lux_meter_sun_object: PointerProperty(name="Sun Object", description=bpy.app.translations.pgettext_tip("Select the Sun Light object you want to adjust"), type=bpy.types.Object, poll=utils.poll_sun_lights)
     lux_meter_target_lux: FloatProperty(name="Target Lux", description=bpy.app.translations.pgettext_tip("The desired illuminance value that the Basis Sensor should receive from the Sun Light"), default=100000.0, min=0.0)
     lux_meter_correction_sensor: EnumProperty(name="Basis Sensor", description=bpy.app.translations.pgettext_tip("The sensor to use as a reference for adjusting the sun's strength"), items=get_sensor_items)
@@ -151,14 +399,16 @@ class AnalysisToolkitPropertyGroup(bpy.types.PropertyGroup):
     conv_inches: FloatProperty(name="Inches", default=10.0, min=0.0, max=11.999, update=utils.imperial_to_metric)
     conv_metric_val: FloatProperty(name="", default=177.8, min=0.0, update=utils.metric_to_imperial)
 
-    # --- Internal Properties for Texel Density Handler ---
-    td_last_res_x: IntProperty(options={'HIDDEN'})
-    td_last_res_y: IntProperty(options={'HIDDEN'})
-
 
 classes = (
     EVPropertyGroup,
     luxmeterResultItem,
+    TexelDensityResultItem,
+    TexelDensityTileItem,
+    TexelDensityHistogramItem,
+    TexelDensityIslandItem,
+    TexelDensityTextureItem,
+    TessellationResultItem,
     TexelDensityPropertyGroup,
     SpeedometerPropertyGroup,
     AnalysisToolkitPropertyGroup,
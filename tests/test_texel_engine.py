@@ -0,0 +1,163 @@
+"""Checks the vectorized texel density engine against the per-face reference and NumPy.
+texel_engine does not import bpy, so these run outside Blender: python -m pytest tests"""
+import ast
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ADDON_DIR)
+import texel_engine  # noqa: E402
+
+
+def load_reference_clipper():
+    # utils imports bpy, so only the reference clipper is compiled from its source
+    with open(os.path.join(ADDON_DIR, "utils.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    node = next(n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == "sutherland_hodgman_clipper_with_uvs")
+    namespace = {}
+    exec(compile(ast.Module(body=[node], type_ignores=[]), "utils.py", "exec"), namespace)
+    return namespace["sutherland_hodgman_clipper_with_uvs"]
+
+sutherland_hodgman_clipper_with_uvs = load_reference_clipper()
+
+
+def polygon_area(points):
+    return abs(sum(points[i - 1][0] * points[i][1] - points[i][0] * points[i - 1][1] for i in range(len(points)))) / 2.0
+
+def reference_clip_areas(polygons, clip_rect):
+    # (screen areas, UV areas) as texel_density_bmesh computes them
+    screen_areas, uv_areas = [], []
+    for polygon in polygons:
+        clipped = sutherland_hodgman_clipper_with_uvs([tuple(p) for p in polygon], clip_rect)
+        if len(clipped) < 3:
+            screen_areas.append(0.0); uv_areas.append(0.0)
+            continue
+        screen_areas.append(polygon_area([(p[0], p[1]) for p in clipped]))
+        uv_areas.append(polygon_area([(p[2], p[3]) for p in clipped]))
+    return np.array(screen_areas), np.array(uv_areas)
+
+def random_convex_polygons(rng, count, corners):
+    # Convex polygons of (x, y, u, v) around the frame, many of them crossing its border
+    angles = np.sort(rng.uniform(0, 2 * np.pi, (count, corners)), axis=1)
+    radius = rng.uniform(5, 60, (count, 1))
+    center = rng.uniform(-30, 130, (count, 1, 2))
+    screen = center + radius[..., None] * np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    uv = rng.uniform(0, 1, (count, corners, 2))
+    return np.concatenate([screen, uv], axis=-1)
+
+def grid(n, size=100.0, z=-10.0, tilt=0.0, seed=None):
+    """Quad grid in the z = const plane (tilted along y), UVs from x and y. With a seed, the
+    vertices are jittered so that the faces differ."""
+    xs = np.linspace(-size, size, n + 1)
+    x, y = np.meshgrid(xs, xs)
+    positions = np.stack([x.ravel(), y.ravel(), z + tilt * y.ravel()], axis=1)
+    uvs_per_vertex = (positions[:, :2] + size) / (2 * size)
+    if seed is not None:
+        rng = np.random.default_rng(seed)
+        positions[:, :2] += rng.uniform(-0.3, 0.3, (len(positions), 2)) * (size / n)
+    corner = (np.arange(n)[:, None] * (n + 1) + np.arange(n)[None, :]).ravel()
+    quads = np.stack([corner, corner + 1, corner + n + 2, corner + n + 1], axis=1)
+    face_count = len(quads)
+    loop_verts = quads.ravel()
+    loop_start = np.arange(face_count) * 4
+    loop_total = np.full(face_count, 4)
+    normals = np.tile([0.0, 0.0, 1.0], (face_count, 1))
+    tri_loops = np.concatenate([np.stack([loop_start, loop_start + 1, loop_start + 2], 1), np.stack([loop_start, loop_start + 2, loop_start + 3], 1)])
+    tri_polys = np.concatenate([np.arange(face_count)] * 2)
+    return texel_engine.MeshArrays(positions, loop_verts, loop_start, loop_total, uvs_per_vertex[loop_verts], normals, tri_loops, tri_polys)
+
+# Perspective camera looking down -z onto a 100 x 100 px frame
+PERSPECTIVE = np.array([[50.0, 0, -50, 0], [0, 50, -50, 0], [0, 0, -1, 0], [0, 0, -1, 0]])
+VIEW_DIR = np.array([0.0, 0.0, -1.0])
+RESOLUTION = (100, 100)
+CLIP_RECT = (0, 100, 0, 100)
+
+
+# --- Clipping ---
+def test_clip_triangles_matches_reference():
+    triangles = random_convex_polygons(np.random.default_rng(1), 2000, 3)
+    screen, uv = texel_engine.clip_triangles_to_rect(triangles, CLIP_RECT)
+    ref_screen, ref_uv = reference_clip_areas(triangles, CLIP_RECT)
+    np.testing.assert_allclose(screen, ref_screen, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(uv, ref_uv, rtol=1e-12, atol=1e-12)
+
+@pytest.mark.parametrize("corners", [4, 7, 12])
+def test_clip_polygons_matches_reference(corners):
+    rng = np.random.default_rng(corners)
+    polygons = random_convex_polygons(rng, 500, corners)
+    # Fewer corners in use than the buffer holds; the rest is padding
+    counts = rng.integers(3, corners + 1, len(polygons))
+    screen, uv = texel_engine.clip_polygons_to_rect(polygons, counts, CLIP_RECT)
+    ref_screen, ref_uv = reference_clip_areas([p[:c] for p, c in zip(polygons, counts)], CLIP_RECT)
+    np.testing.assert_allclose(screen, ref_screen, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(uv, ref_uv, rtol=1e-12, atol=1e-12)
+
+def test_clip_outside_and_inside():
+    inside = np.array([[[10, 10, 0, 0], [20, 10, 1, 0], [10, 20, 0, 1]]], dtype=float)
+    outside = inside + [200, 0, 0, 0]
+    screen, uv = texel_engine.clip_triangles_to_rect(np.concatenate([inside, outside]), CLIP_RECT)
+    np.testing.assert_allclose(screen, [50.0, 0.0])
+    np.testing.assert_allclose(uv, [0.5, 0.0])
+
+
+# --- Anisotropy ---
+def test_jacobian_singular_values_match_svd():
+    rng = np.random.default_rng(2)
+    tri_screen, tri_uv = rng.normal(size=(1000, 3, 2)) * 40, rng.uniform(size=(1000, 3, 2))
+    major, minor = texel_engine.jacobian_singular_values(tri_screen, tri_uv)
+    edges = np.stack([tri_screen[:, 1] - tri_screen[:, 0], tri_screen[:, 2] - tri_screen[:, 0]], axis=-1)
+    uv_edges = np.stack([tri_uv[:, 1] - tri_uv[:, 0], tri_uv[:, 2] - tri_uv[:, 0]], axis=-1)
+    expected = np.linalg.svd(edges @ np.linalg.inv(uv_edges), compute_uv=False)
+    np.testing.assert_allclose(major, expected[:, 0], rtol=1e-9)
+    np.testing.assert_allclose(minor, expected[:, 1], rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(major * minor, np.abs(np.linalg.det(edges)) / np.abs(np.linalg.det(uv_edges)), rtol=1e-9)
+
+def test_jacobian_degenerate_uvs():
+    tri_screen = np.array([[[0, 0], [10, 0], [0, 10]]], dtype=float)
+    tri_uv = np.array([[[0, 0], [1, 1], [2, 2]]], dtype=float)
+    major, minor = texel_engine.jacobian_singular_values(tri_screen, tri_uv)
+    assert major[0] == 0.0 and minor[0] == 0.0
+
+
+# --- Progressive evaluation ---
+@pytest.mark.parametrize("anisotropic", [False, True])
+def test_progressive_density_equals_face_density(anisotropic):
+    arrays = grid(120, tilt=0.3, seed=3)
+    face_mask = np.random.default_rng(4).random(arrays.face_count) > 0.2
+    stats = {}
+    ratios, areas = texel_engine.face_density(arrays, PERSPECTIVE, VIEW_DIR, RESOLUTION, face_mask, stats, anisotropic=anisotropic)
+    progressive_stats = {}
+    progressive = texel_engine.ProgressiveDensity(arrays, PERSPECTIVE, VIEW_DIR, RESOLUTION, face_mask, progressive_stats, anisotropic=anisotropic)
+    while not progressive.run(0.01): pass
+    assert progressive.finished
+    np.testing.assert_array_equal(progressive.ratios, ratios)
+    np.testing.assert_array_equal(progressive.areas, areas)
+    assert progressive_stats == stats
+    # The frame border crosses the grid, so the clipping path is covered
+    assert 0 < np.count_nonzero(ratios) < arrays.face_count
+
+
+# --- Streaming ---
+def test_streaming_matches_face_density():
+    arrays = grid(120, tilt=0.3, seed=5)
+    # Streaming reads float32 buffers, so the reference gets the same rounded values
+    for name in ("positions", "uvs"):
+        setattr(arrays, name, getattr(arrays, name).astype(np.float32).astype(np.float64))
+    arrays.uv_areas = texel_engine.polygon_areas(arrays.uvs, arrays.loop_next, arrays.loop_start)
+    stats = {}
+    ratios, areas = texel_engine.face_density(arrays, PERSPECTIVE, VIEW_DIR, RESOLUTION, cull_stats=stats)
+    accumulator, stream_stats = texel_engine.DensityAccumulator(), {}
+    int32 = lambda name: getattr(arrays, name).astype(np.int32)
+    texel_engine.stream_face_density(arrays.positions.astype(np.float32), int32("loop_verts"), int32("loop_start"), int32("loop_total"),
+                                     arrays.uvs.astype(np.float32), arrays.normals.astype(np.float32), PERSPECTIVE, VIEW_DIR, RESOLUTION,
+                                     accumulator, chunk_faces=1000, cull_stats=stream_stats, tri_loops=int32("tri_loops"), tri_polys=int32("tri_polys"))
+    peaks, weights = accumulator.samples()
+    assert peaks.max() == ratios.max()
+    assert weights.sum() == pytest.approx(areas[ratios > 0].sum(), rel=1e-12)
+    assert accumulator.face_count == np.count_nonzero(ratios)
+    # Chunks outside the frame are chunk culls, never object culls
+    assert stream_stats["faces"] == stats["faces"] and stream_stats["object"] == 0 and stream_stats["chunk"] > 0
+    assert stream_stats["chunk"] + stream_stats["face"] == stats["chunk"] + stats["face"]
@@ -0,0 +1,923 @@
+# Vectorized NumPy kernels for the UV SS Resolution tool.
+# This module must not import bpy: it only works on plain arrays so that the
+# same code can run inside the add-on and in worker processes.
+import os
+import sys
+import math
+import time
+import importlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+
+# --- Mesh Arrays ---
+class MeshArrays:
+    """Flat copy of the mesh data used by the texel density engine (local space)"""
+    def __init__(self, positions, loop_verts, loop_start, loop_total, uvs, normals, tri_loops, tri_polys, chunks=None, material_index=None):
+        self.positions = positions      # (V, 3) float
+        self.loop_verts = loop_verts    # (L,) int
+        self.loop_start = loop_start    # (F,) int
+        self.loop_total = loop_total    # (F,) int
+        self.uvs = uvs                  # (L, 2) float
+        self.normals = normals          # (F, 3) float
+        self.tri_loops = tri_loops      # (T, 3) int, from mesh.loop_triangles
+        self.tri_polys = tri_polys      # (T,) int
+        # (F,) int material slot per face
+        self.material_index = material_index if material_index is not None else np.zeros(len(loop_start), dtype=np.int32)
+        self.loop_next = polygon_next_loops(loop_start, loop_total)
+        self.uv_areas = polygon_areas(uvs, self.loop_next, loop_start)
+        self.tiles = face_tiles(uvs, loop_start, loop_total)
+        self._chunks = (positions, chunks) if chunks is not None else None
+        self._islands = None
+        # The lazy caches are filled from the texel worker thread as well as the main thread
+        self._cache_lock = threading.Lock()
+
+    @property
+    def face_count(self):
+        return len(self.loop_start)
+
+    @property
+    def chunks(self):
+        # Spatial index for frustum culling, rebuilt when the positions are replaced (deformation)
+        with self._cache_lock:
+            positions = self.positions
+            if self._chunks is None or self._chunks[0] is not positions:
+                self._chunks = (positions, build_face_chunks(positions, self.loop_verts, self.loop_start))
+            return self._chunks[1]
+
+    @property
+    def islands(self):
+        # (face island ids, island count); UVs never change for cached arrays
+        with self._cache_lock:
+            if self._islands is None:
+                self._islands = uv_islands(self.loop_verts, self.uvs, self.loop_next, self.loop_total)
+            return self._islands
+
+    def subset(self, faces):
+        """MeshArrays of the given faces only (shares the vertex positions)"""
+        loop_total = self.loop_total[faces]
+        loop_start = np.cumsum(loop_total) - loop_total
+        loops = np.repeat(self.loop_start[faces] - loop_start, loop_total) + np.arange(int(loop_total.sum()))
+        loop_map = np.full(len(self.loop_verts), -1, dtype=np.int64); loop_map[loops] = np.arange(len(loops))
+        face_map = np.full(self.face_count, -1, dtype=np.int64); face_map[faces] = np.arange(len(faces))
+        tri_sel = np.flatnonzero(face_map[self.tri_polys] >= 0)
+        return MeshArrays(self.positions, self.loop_verts[loops], loop_start, loop_total, self.uvs[loops],
+                          self.normals[faces], loop_map[self.tri_loops[tri_sel]], face_map[self.tri_polys[tri_sel]],
+                          material_index=self.material_index[faces])
+
+def polygon_next_loops(loop_start, loop_total):
+    # Index of the following loop inside the same polygon (wraps to the first loop)
+    loop_next = np.arange(1, int(loop_total.sum()) + 1)
+    if len(loop_start):
+        loop_next[loop_start + loop_total - 1] = loop_start
+    return loop_next
+
+def polygon_areas(points, loop_next, loop_start):
+    # Shoelace formula for every polygon at once; points are per-loop (L, 2)
+    if len(loop_start) == 0: return np.zeros(0)
+    cross = points[:, 0] * points[loop_next, 1] - points[loop_next, 0] * points[:, 1]
+    return np.abs(np.add.reduceat(cross, loop_start)) / 2.0
+
+def face_tiles(uvs, loop_start, loop_total):
+    # UDIM tile (u, v) of each face, from the floor of its UV centroid
+    if len(loop_start) == 0: return np.zeros((0, 2), dtype=np.int64)
+    centroid = np.add.reduceat(uvs, loop_start, axis=0) / loop_total[:, None]
+    return np.floor(centroid).astype(np.int64)
+
+# --- UV Islands ---
+UV_MERGE_PRECISION = 1e-5
+
+def connected_components(count, u, v):
+    """Vectorized union-find over count nodes and (u, v) edges: each round hooks every root to the
+    smallest root it touches, then compresses paths by pointer jumping. Returns (labels, n)"""
+    parent = np.arange(count)
+    while True:
+        pu, pv = parent[u], parent[v]
+        cross = pu != pv
+        if not cross.any(): break
+        # Edges inside one component stay inside it
+        u, v, pu, pv = u[cross], v[cross], pu[cross], pv[cross]
+        np.minimum.at(parent, np.maximum(pu, pv), np.minimum(pu, pv))
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent): break
+            parent = grand
+    roots, labels = np.unique(parent, return_inverse=True)
+    return labels.reshape(-1), len(roots)
+
+def _row_ids(*columns):
+    # Dense ids of equal rows over several integer columns
+    order = np.lexsort(columns[::-1])
+    changed = np.zeros(len(order), dtype=bool)
+    changed[:1] = True
+    for column in columns:
+        values = column[order]
+        changed[1:] |= values[1:] != values[:-1]
+    ids = np.empty(len(order), dtype=np.int64)
+    ids[order] = np.cumsum(changed) - 1
+    return ids, int(changed.sum())
+
+def uv_islands(loop_verts, uvs, loop_next, loop_total):
+    """Face island ids: faces belong together when they share an edge whose UVs match on both
+    sides (like UV Select Linked). Returns (face island ids, island count)"""
+    face_count = len(loop_total)
+    if face_count == 0: return np.zeros(0, dtype=np.int64), 0
+    quantized = np.round(uvs / UV_MERGE_PRECISION).astype(np.int64)
+    uv_vert, uv_vert_count = _row_ids(loop_verts.astype(np.int64), quantized[:, 0], quantized[:, 1])
+    # A UV edge seen from two faces is traversed in opposite directions: key it unordered
+    a, b = uv_vert, uv_vert[loop_next]
+    _keys, edge = np.unique(np.minimum(a, b) * uv_vert_count + np.maximum(a, b), return_inverse=True)
+    edge = edge.reshape(-1)
+    loop_face = np.repeat(np.arange(face_count), loop_total)
+    edge_face = np.empty(len(_keys), dtype=np.int64); edge_face[edge] = loop_face
+    return connected_components(face_count, loop_face, edge_face[edge])
+
+def island_statistics(ratios, weights, face_island, island_count, percentile=100.0):
+    # Per island: (density ratio of the resolution basis, screen area)
+    return (grouped_statistic(ratios, weights, face_island, island_count, percentile),
+            np.bincount(face_island, weights=weights, minlength=island_count))
+
+# --- Frustum Culling ---
+FACES_PER_CHUNK = 1024
+CHUNK_FIELDS = ('chunk_order', 'chunk_starts', 'chunk_min', 'chunk_max')
+
+def build_face_chunks(positions, loop_verts, loop_start):
+    """Groups faces into a uniform grid over their local bounding boxes, sized for about
+    FACES_PER_CHUNK faces per cell. Returns (face order, chunk starts, chunk min, chunk max)"""
+    if len(loop_start) == 0:
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp), np.zeros((0, 3)), np.zeros((0, 3))
+    loop_points = positions[loop_verts]
+    face_min = np.minimum.reduceat(loop_points, loop_start, axis=0)
+    face_max = np.maximum.reduceat(loop_points, loop_start, axis=0)
+    low, extent = face_min.min(axis=0), face_max.max(axis=0) - face_min.min(axis=0)
+    # Cell size from the non-flat axes, so planar environments still get square cells
+    axes = extent > extent.max() * 1e-6
+    target_cells = max(1.0, len(loop_start) / FACES_PER_CHUNK)
+    cell_size = (np.prod(extent[axes]) / target_cells) ** (1.0 / axes.sum()) if axes.any() else 1.0
+    cells = np.where(axes, np.clip(np.ceil(extent / cell_size), 1, 1024), 1).astype(np.int64)
+    cell = np.clip(((face_min + face_max) * 0.5 - low) / np.where(axes, extent, 1.0) * cells, 0, cells - 1).astype(np.int64)
+    cell_id = (cell[:, 0] * cells[1] + cell[:, 1]) * cells[2] + cell[:, 2]
+    order = np.argsort(cell_id, kind='stable')
+    starts = np.flatnonzero(np.diff(cell_id[order], prepend=-1))
+    return order, starts, np.minimum.reduceat(face_min[order], starts, axis=0), np.maximum.reduceat(face_max[order], starts, axis=0)
+
+def boxes_outside(box_min, box_max, matrix, resolution):
+    """True for local AABBs that cannot contain a counted face: entirely behind the camera, or
+    entirely in front of it and beyond one frame edge. Uses the same criteria as classify_faces.
+    A (K, 4, 4) stack of matrices tests one box for K instances."""
+    corners = np.stack([np.where([(i >> axis) & 1 for axis in range(3)], box_max, box_min) for i in range(8)], axis=1)
+    hom = corners @ np.swapaxes(matrix[..., :3], -1, -2) + matrix[..., None, :, 3]
+    x, y, depth, w = hom[..., 0], hom[..., 1], hom[..., 2], hom[..., 3]
+    beyond_edge = ((x < 0).all(axis=1) | (x > resolution[0] * w).all(axis=1) |
+                   (y < 0).all(axis=1) | (y > resolution[1] * w).all(axis=1))
+    return (depth <= 0).all(axis=1) | ((depth > 0).all(axis=1) & beyond_edge)
+
+def frustum_faces(arrays, matrix, resolution):
+    """Hierarchical pre-pass: object bounds, then grid chunks.
+    Returns (candidate faces, faces culled by the object test, faces culled by the chunk test)"""
+    order, starts, chunk_min, chunk_max = arrays.chunks
+    face_count = arrays.face_count
+    if face_count == 0: return order, 0, 0
+    if boxes_outside(chunk_min.min(axis=0)[None], chunk_max.max(axis=0)[None], matrix, resolution)[0]:
+        return order[:0], face_count, 0
+    outside = boxes_outside(chunk_min, chunk_max, matrix, resolution)
+    faces = order[np.repeat(~outside, np.diff(np.append(starts, face_count)))]
+    return faces, 0, face_count - len(faces)
+
+def add_cull_stats(cull_stats, faces, objects=0, chunks=0, face_level=0):
+    if cull_stats is None: return
+    for key, count in (('faces', faces), ('object', objects), ('chunk', chunks), ('face', face_level)):
+        cull_stats[key] = cull_stats.get(key, 0) + int(count)
+
+# --- Projection ---
+def project_points(positions, matrix, resolution):
+    """Projects local positions with a 4x4 (X, Y, depth, W) matrix into render pixels.
+    Mirrors world_to_camera_view: a point on the camera plane maps to the frame center.
+    A (K, 4, 4) stack of matrices projects for K cameras in one product: (K, N, 2), (K, N)."""
+    hom = positions @ np.swapaxes(matrix[..., :3], -1, -2) + matrix[..., None, :, 3]
+    w = hom[..., 3]
+    on_plane = w == 0.0
+    screen = hom[..., :2] / np.where(on_plane, 1.0, w)[..., None]
+    if on_plane.any():
+        screen[on_plane] = (resolution[0] * 0.5, resolution[1] * 0.5)
+    return screen, hom[..., 2]
+
+# --- Face Classification ---
+def local_view_direction(view_dir, world=None):
+    """The world-space view direction in the object space of world (4x4 or 3x3; None = identity).
+    Normals are local and a world normal is W^-T n, so n_world . d = n_local . (W^-1 d)"""
+    view_dir = np.asarray(view_dir, dtype=np.float64)
+    if world is None: return view_dir
+    return np.linalg.pinv(np.asarray(world, dtype=np.float64)[:3, :3]) @ view_dir
+
+def classify_faces(arrays, loop_screen, loop_depth, view_dir, resolution):
+    """Returns (visible, inside) face masks. view_dir is in the object space of the normals
+    (see local_view_direction).
+    visible: front facing, not fully behind the camera and not trivially outside the frame.
+    inside: visible faces that lie completely in the frame and need no clipping."""
+    ls = arrays.loop_start
+    if len(ls) == 0:
+        empty = np.zeros(0, dtype=bool)
+        return empty, empty
+    res_x, res_y = resolution
+    x, y = loop_screen[:, 0], loop_screen[:, 1]
+    front = arrays.normals @ np.asarray(view_dir, dtype=np.float64) <= 0
+    in_front = np.maximum.reduceat(loop_depth, ls) > 0
+    outside = (np.logical_and.reduceat(x < 0, ls) | np.logical_and.reduceat(x > res_x, ls) |
+               np.logical_and.reduceat(y < 0, ls) | np.logical_and.reduceat(y > res_y, ls))
+    visible = front & in_front & ~outside
+    inside = np.logical_and.reduceat((x >= 0) & (x <= res_x) & (y >= 0) & (y <= res_y), ls)
+    return visible, visible & inside
+
+# --- Batched Clipping ---
+MAX_CLIP_VERTS = 7 # A triangle clipped by the 4 frame edges has at most 7 vertices
+
+def clip_polygons_to_rect(points, counts, clip_rect):
+    """Clips (P, N, 4) polygons of (x, y, u, v), each using its first counts[i] rows, against
+    clip_rect = (min_x, max_x, min_y, max_y). Same edge order and UV interpolation as
+    sutherland_hodgman_clipper_with_uvs, but for all polygons at once in fixed-size buffers.
+    Returns (screen areas, UV areas) per polygon."""
+    n_polys = len(points)
+    if n_polys == 0: return np.zeros(0), np.zeros(0)
+    rows = np.arange(n_polys)
+    count = np.asarray(counts, dtype=np.intp).copy()
+    # A pass adds at most one intersection per input vertex; convex polygons gain at most one per edge
+    width = max(MAX_CLIP_VERTS, points.shape[1] + 4)
+    buf = np.zeros((n_polys, width, 4)); buf[:, :points.shape[1]] = points
+    out = np.zeros_like(buf)
+
+    for axis, is_max_edge in ((0, False), (0, True), (1, False), (1, True)):
+        needed = 2 * int(count.max())
+        if needed > buf.shape[1]:
+            buf = np.concatenate([buf, np.zeros((n_polys, needed - buf.shape[1], 4))], axis=1); out = np.zeros_like(buf)
+        bound = clip_rect[axis * 2 + (1 if is_max_edge else 0)]
+        out_count = np.zeros(n_polys, dtype=np.intp)
+        for i in range(int(count.max())):
+            active = i < count
+            p1 = buf[:, i]; p2 = buf[rows, np.where(i + 1 < count, i + 1, 0)]
+            c1 = p1[:, axis]; c2 = p2[:, axis]
+            p1_inside = (c1 <= bound) if is_max_edge else (c1 >= bound)
+            p2_inside = (c2 <= bound) if is_max_edge else (c2 >= bound)
+            delta = c2 - c1
+            t = (bound - c1) / np.where(delta != 0, delta, 1.0)
+            # The reference appends the intersection first, then p2 if it is inside
+            sel = np.flatnonzero(active & (p1_inside != p2_inside) & (delta != 0))
+            out[sel, out_count[sel]] = p1[sel] + t[sel, None] * (p2[sel] - p1[sel]); out_count[sel] += 1
+            sel = np.flatnonzero(active & p2_inside)
+            out[sel, out_count[sel]] = p2[sel]; out_count[sel] += 1
+        buf, out = out, buf
+        count = out_count
+        if not count.any(): break
+
+    # Shoelace over the valid part of each buffer
+    idx = np.arange(buf.shape[1])
+    valid = idx < count[:, None]
+    nxt = np.where(idx + 1 < count[:, None], idx + 1, 0)
+    q = np.take_along_axis(buf, nxt[:, :, None], axis=1)
+    screen_cross = np.where(valid, buf[..., 0] * q[..., 1] - q[..., 0] * buf[..., 1], 0.0)
+    uv_cross = np.where(valid, buf[..., 2] * q[..., 3] - q[..., 2] * buf[..., 3], 0.0)
+    degenerate = count < 3
+    screen_areas = np.abs(screen_cross.sum(axis=1)) / 2.0; screen_areas[degenerate] = 0.0
+    uv_areas = np.abs(uv_cross.sum(axis=1)) / 2.0; uv_areas[degenerate] = 0.0
+    return screen_areas, uv_areas
+
+def clip_triangles_to_rect(tri_points, clip_rect):
+    # (T, 3, 4) triangles; see clip_polygons_to_rect
+    return clip_polygons_to_rect(tri_points, np.full(len(tri_points), 3), clip_rect)
+
+def clip_faces_to_rect(arrays, faces, loop_screen, clip_rect):
+    """(screen areas, UV areas) of whole faces clipped like the reference, which clips each polygon
+    rather than its triangles. Faces are batched by size class (up to 4, 8, 16... corners), so a
+    few large n-gons do not pad the buffers of every quad."""
+    screen_areas, uv_areas = np.zeros(len(faces)), np.zeros(len(faces))
+    totals = arrays.loop_total[faces]
+    classes = np.maximum(np.ceil(np.log2(np.maximum(totals, 4))), 2).astype(np.intp)
+    for size_class in np.unique(classes):
+        sel = np.flatnonzero(classes == size_class)
+        corners = np.arange(1 << int(size_class))
+        loops = arrays.loop_start[faces[sel], None] + np.minimum(corners, totals[sel, None] - 1)
+        points = np.concatenate([loop_screen[loops], arrays.uvs[loops]], axis=2)
+        screen_areas[sel], uv_areas[sel] = clip_polygons_to_rect(points, totals[sel], clip_rect)
+    return screen_areas, uv_areas
+
+# --- Density ---
+def density_ratios(screen_areas, uv_areas):
+    # Screen pixels per unit UV area; faces below the reference thresholds get 0
+    valid = (screen_areas > 1e-6) & (uv_areas > 1e-9)
+    ratios = np.zeros(len(screen_areas))
+    np.divide(screen_areas, uv_areas, out=ratios, where=valid)
+    return ratios
+
+def face_density(arrays, matrix, view_dir, resolution, face_mask=None, cull_stats=None, projected=None, anisotropic=False, world=None):
+    """Returns per-face (density ratio, clipped screen area in px) for one camera.
+    view_dir is the camera direction in world space and world the object's world matrix; the
+    normals are tested against it in object space.
+    Faces fully inside the frame use their polygon areas; faces crossing the frame
+    border are clipped as whole polygons (see clip_faces_to_rect).
+    face_mask (e.g. from DepthBuffer.visible_faces) excludes further faces.
+    Faces outside the frustum are rejected by frustum_faces before any per-face work;
+    cull_stats (dict) accumulates the culled face count of each level.
+    projected: optional per-vertex (screen, depth) from project_points for this matrix.
+    anisotropic: the ratio becomes the squared major-axis density (see face_major_axes)."""
+    view_dir = local_view_direction(view_dir, world)
+    faces, object_culled, chunk_culled = frustum_faces(arrays, matrix, resolution)
+    add_cull_stats(cull_stats, arrays.face_count, object_culled, chunk_culled)
+    if len(faces) == arrays.face_count:
+        return _face_density(arrays, matrix, view_dir, resolution, face_mask, cull_stats, projected, anisotropic)
+    ratios, screen_areas = np.zeros(arrays.face_count), np.zeros(arrays.face_count)
+    if len(faces):
+        subset_mask = None if face_mask is None else face_mask[faces]
+        ratios[faces], screen_areas[faces] = _face_density(arrays.subset(faces), matrix, view_dir, resolution, subset_mask, cull_stats, projected, anisotropic)
+    return ratios, screen_areas
+
+def _face_density(arrays, matrix, view_dir, resolution, face_mask, cull_stats, projected, anisotropic):
+    if projected is not None:
+        loop_screen = projected[0][arrays.loop_verts]; loop_depth = projected[1][arrays.loop_verts]
+    elif len(arrays.loop_verts) < len(arrays.positions):
+        # Subsets only project the vertices they use
+        loop_screen, loop_depth = project_points(arrays.positions[arrays.loop_verts], matrix, resolution)
+    else:
+        screen, depth = project_points(arrays.positions, matrix, resolution)
+        loop_screen = screen[arrays.loop_verts]; loop_depth = depth[arrays.loop_verts]
+    visible, inside = classify_faces(arrays, loop_screen, loop_depth, view_dir, resolution)
+    if face_mask is not None:
+        visible &= face_mask; inside &= face_mask
+    add_cull_stats(cull_stats, 0, face_level=arrays.face_count - visible.sum())
+    screen_areas = np.where(inside, polygon_areas(loop_screen, arrays.loop_next, arrays.loop_start), 0.0)
+    uv_areas = np.where(inside, arrays.uv_areas, 0.0)
+
+    # Faces crossing the frame border are clipped as whole polygons, like the reference
+    border = np.flatnonzero(visible & ~inside)
+    if len(border):
+        screen_areas[border], uv_areas[border] = clip_faces_to_rect(arrays, border, loop_screen, (0, resolution[0], 0, resolution[1]))
+
+    ratios = density_ratios(screen_areas, uv_areas)
+    if anisotropic:
+        ratios = np.where(ratios > 0, face_major_axes(arrays, loop_screen, ratios > 0)**2, 0.0)
+    return ratios, np.where(ratios > 0, screen_areas, 0.0)
+
+# --- Anisotropic Density ---
+def jacobian_singular_values(tri_screen, tri_uv):
+    """Singular values (major, minor) of the 2x2 UV -> screen Jacobian of (T, 3, 2) triangles, in
+    pixels per UV unit. major * minor is the area ratio; major is the density along the most
+    stretched direction. Triangles with degenerate UVs give 0."""
+    e1, e2 = tri_screen[:, 1] - tri_screen[:, 0], tri_screen[:, 2] - tri_screen[:, 0]
+    u1, u2 = tri_uv[:, 1] - tri_uv[:, 0], tri_uv[:, 2] - tri_uv[:, 0]
+    det = u1[:, 0] * u2[:, 1] - u2[:, 0] * u1[:, 1]
+    valid = np.abs(det) > 1e-12
+    inv_det = 1.0 / np.where(valid, det, 1.0)
+    # J = [e1 e2] @ inverse([u1 u2])
+    a = (e1[:, 0] * u2[:, 1] - e2[:, 0] * u1[:, 1]) * inv_det
+    b = (e2[:, 0] * u1[:, 0] - e1[:, 0] * u2[:, 0]) * inv_det
+    c = (e1[:, 1] * u2[:, 1] - e2[:, 1] * u1[:, 1]) * inv_det
+    d = (e2[:, 1] * u1[:, 0] - e1[:, 1] * u2[:, 0]) * inv_det
+    # Closed form for 2x2 matrices
+    p, q = np.hypot(a + d, c - b), np.hypot(a - d, c + b)
+    return np.where(valid, (p + q) * 0.5, 0.0), np.where(valid, np.abs(p - q) * 0.5, 0.0)
+
+def face_major_axes(arrays, loop_screen, faces_mask):
+    # Highest major-axis density over the loop triangles of each selected face
+    tri_sel = np.flatnonzero(faces_mask[arrays.tri_polys])
+    tri_loops = arrays.tri_loops[tri_sel]
+    major, _minor = jacobian_singular_values(loop_screen[tri_loops], arrays.uvs[tri_loops])
+    axes = np.zeros(arrays.face_count)
+    np.maximum.at(axes, arrays.tri_polys[tri_sel], major)
+    return axes
+
+def mip_levels(ratios, texture_size):
+    """Mip level log2(texels per pixel) for a texture_size texture at the density sqrt(ratio).
+    The ratios are whatever the calculation stored: with Max Axis, the major-axis density (the level
+    of an unbounded anisotropic filter; a real one, capped at e.g. 16x, samples coarser on faces
+    stretched beyond that); with Area, the isotropic average density. Below 0 the texture is
+    magnified (undersampled)."""
+    return np.log2(texture_size / np.sqrt(np.maximum(ratios, 1e-300)))
+
+# --- Multiple Cameras ---
+CAMERA_BATCH_BYTES = 1 << 26 # Size of the projected vertices of one camera batch
+
+def camera_face_densities(arrays, matrices, view_dirs, resolution, face_masks=None, cull_stats=None, anisotropic=False, worlds=None):
+    """Per-face (density ratios, screen areas) of one mesh for each of K cameras.
+    The vertices are projected for a batch of cameras in one matrix product; each camera is then
+    culled, classified and clipped on its own. matrices: (K, 4, 4) local -> camera pixels;
+    view_dirs: K world directions; worlds: K object world matrices (see face_density)."""
+    if face_masks is None: face_masks = [None] * len(matrices)
+    if worlds is None: worlds = [None] * len(matrices)
+    batch = max(1, CAMERA_BATCH_BYTES // max(1, len(arrays.positions) * 56))
+    results = []
+    for start in range(0, len(matrices), batch):
+        block = np.asarray(matrices[start:start + batch])
+        screen, depth = project_points(arrays.positions, block, resolution)
+        for i, matrix in enumerate(block):
+            results.append(face_density(arrays, matrix, view_dirs[start + i], resolution, face_masks[start + i], cull_stats, (screen[i], depth[i]), anisotropic, worlds[start + i]))
+    return results
+
+# --- Instances ---
+def instance_face_densities(arrays, matrices, view_dirs, resolution, face_masks=None, cull_stats=None, anisotropic=False, worlds=None):
+    """Contributing faces of K instances of one mesh. Instances outside the frustum are rejected on
+    the mesh bounds in one batched test; the rest are projected in camera-sized batches.
+    face_masks(instance) returns a face mask or None. Yields (instance, faces, ratios, areas) for
+    instances with faces on screen, keeping only those faces so memory follows the visible result.
+    view_dirs and worlds are per instance, as for camera_face_densities."""
+    matrices = np.asarray(matrices)
+    face_count = arrays.face_count
+    if face_count == 0 or len(matrices) == 0: return
+    order, starts, chunk_min, chunk_max = arrays.chunks
+    outside = boxes_outside(chunk_min.min(axis=0)[None], chunk_max.max(axis=0)[None], matrices, resolution)
+    add_cull_stats(cull_stats, face_count * len(matrices), objects=face_count * int(outside.sum()))
+    instances = np.flatnonzero(~outside)
+    batch = max(1, CAMERA_BATCH_BYTES // max(1, len(arrays.positions) * 56))
+    for start in range(0, len(instances), batch):
+        block = instances[start:start + batch]
+        masks = [face_masks(instance) for instance in block] if face_masks else None
+        # The instances were already counted above
+        stats = {} if cull_stats is not None else None
+        results = camera_face_densities(arrays, matrices[block], view_dirs[block], resolution, masks, stats, anisotropic,
+                                        None if worlds is None else worlds[block])
+        if stats: add_cull_stats(cull_stats, 0, chunks=stats.get('chunk', 0), face_level=stats.get('face', 0))
+        for instance, (ratios, areas) in zip(block.tolist(), results):
+            faces = np.flatnonzero(ratios > 0)
+            if len(faces): yield instance, faces, ratios[faces], areas[faces]
+
+# --- Tessellation ---
+REGION_GRID = 4 # The frame is split into REGION_GRID x REGION_GRID regions
+
+def triangle_screen_areas(positions, matrix, tri_verts, resolution):
+    """Screen area in px (clipped to the frame) of every front-facing triangle in front of the
+    camera, 0 for the others, and the frame region of each triangle's centroid.
+    Facing comes from the projected winding, as the GPU decides it."""
+    if len(tri_verts) == 0: return np.zeros(0), np.zeros(0, dtype=np.int64)
+    screen, depth = project_points(positions, matrix, resolution)
+    tri = screen[tri_verts]
+    x, y = tri[..., 0], tri[..., 1]
+    res_x, res_y = resolution
+    signed = (x[:, 1] - x[:, 0]) * (y[:, 2] - y[:, 0]) - (x[:, 2] - x[:, 0]) * (y[:, 1] - y[:, 0])
+    outside = ((x < 0).all(axis=1) | (x > res_x).all(axis=1) | (y < 0).all(axis=1) | (y > res_y).all(axis=1))
+    counted = (depth[tri_verts] > 0).all(axis=1) & (signed > 0) & ~outside
+    inside = counted & ((x >= 0) & (x <= res_x) & (y >= 0) & (y <= res_y)).all(axis=1)
+    areas = np.where(inside, signed * 0.5, 0.0)
+    border = np.flatnonzero(counted & ~inside)
+    if len(border):
+        tri_points = np.concatenate([tri[border], np.zeros((len(border), 3, 2))], axis=2)
+        areas[border] = clip_triangles_to_rect(tri_points, (0, res_x, 0, res_y))[0]
+    centroid = tri.mean(axis=1)
+    column = np.clip((centroid[:, 0] / res_x * REGION_GRID).astype(np.int64), 0, REGION_GRID - 1)
+    row = np.clip((centroid[:, 1] / res_y * REGION_GRID).astype(np.int64), 0, REGION_GRID - 1)
+    return areas, row * REGION_GRID + column
+
+def tessellation_statistics(areas, groups, group_count):
+    """Per group: (triangles on screen, their screen area in px, triangles below one pixel),
+    from one bincount pass over all triangles of all objects"""
+    counted = areas > 0
+    groups, areas = groups[counted], areas[counted]
+    return (np.bincount(groups, minlength=group_count), np.bincount(groups, weights=areas, minlength=group_count),
+            np.bincount(groups[areas < 1.0], minlength=group_count))
+
+def tessellation_advice(triangle_count, screen_area, target_pixels):
+    """Returns (decimate ratio, subdivision levels) that bring the average triangle to about
+    target_pixels px: a ratio below 1 when over-tessellated, levels above 0 when coarser than 4x"""
+    if triangle_count == 0 or screen_area <= 0: return 1.0, 0
+    pixels_per_triangle = screen_area / triangle_count
+    if pixels_per_triangle < target_pixels: return pixels_per_triangle / target_pixels, 0
+    # Each subdivision level splits a triangle into four
+    return 1.0, int(math.floor(math.log(pixels_per_triangle / target_pixels, 4)))
+
+# --- Streaming ---
+STREAM_CHUNK_FACES = 1 << 18 # Faces per chunk; bounds the per-chunk working memory
+STREAM_MIN_EXP = -8          # Histogram range of sqrt(density ratio), in octaves
+STREAM_MAX_EXP = 24
+STREAM_BINS_PER_OCTAVE = 16  # Percentiles from the histogram are within 1/16 octave (~4%)
+STREAM_BINS = (STREAM_MAX_EXP - STREAM_MIN_EXP) * STREAM_BINS_PER_OCTAVE
+
+def fan_triangles(loop_start, loop_total):
+    # (T, 3) loops and (T,) faces of a fan triangulation (exact for convex faces)
+    tri_counts = np.maximum(loop_total - 2, 0)
+    tri_faces = np.repeat(np.arange(len(loop_start)), tri_counts)
+    corner = np.arange(len(tri_faces)) - np.repeat(np.cumsum(tri_counts) - tri_counts, tri_counts) + 1
+    first = loop_start[tri_faces]
+    return np.stack([first, first + corner, first + corner + 1], axis=1), tri_faces
+
+class DensityAccumulator:
+    """Area-weighted histogram of density ratios in fine log2 bins, folded chunk by chunk so its
+    size does not depend on the face count. Each bin keeps the highest ratio it received, so the
+    top bin holds the exact maximum."""
+    def __init__(self):
+        self.weights = np.zeros(STREAM_BINS)
+        self.peaks = np.zeros(STREAM_BINS)
+        self.face_count = 0
+
+    def add(self, ratios, areas):
+        keep = ratios > 0
+        ratios, areas = ratios[keep], areas[keep]
+        bins = np.clip(np.floor((0.5 * np.log2(ratios) - STREAM_MIN_EXP) * STREAM_BINS_PER_OCTAVE), 0, STREAM_BINS - 1).astype(np.int64)
+        self.weights += np.bincount(bins, weights=areas, minlength=STREAM_BINS)
+        np.maximum.at(self.peaks, bins, ratios)
+        self.face_count += len(ratios)
+
+    def samples(self):
+        # (ratios, weights) of the used bins, usable wherever per-face ratios and areas are
+        used = self.weights > 0
+        return self.peaks[used], self.weights[used]
+
+def stream_face_density(positions, loop_verts, loop_start, loop_total, uvs, normals, matrix, view_dir, resolution,
+                        accumulator, chunk_faces=STREAM_CHUNK_FACES, cull_stats=None, anisotropic=False, world=None,
+                        tri_loops=None, tri_polys=None):
+    """face_density over consecutive face ranges, folded into accumulator. Takes the raw (float32)
+    mesh buffers, which the caller holds in full; only one chunk is ever converted to float64 and
+    projected, so the working memory on top of them is bounded by chunk_faces. Loops must be stored
+    in face order, as Blender does. A chunk that is entirely outside the frustum counts as culled
+    at chunk level in cull_stats.
+    tri_loops (T, 3) / tri_polys (T,) are the mesh tessellation (loop triangles, in face order);
+    each chunk uses its own range of them, so concave n-gons are measured like the NumPy engine.
+    Without them, faces are fan-triangulated (exact for convex faces only)."""
+    view_dir = local_view_direction(view_dir, world)
+    face_count = len(loop_start)
+    if tri_polys is not None and np.any(np.diff(tri_polys) < 0):
+        order = np.argsort(tri_polys, kind='stable')
+        tri_loops, tri_polys = tri_loops[order], tri_polys[order]
+    for start in range(0, face_count, chunk_faces):
+        end = min(face_count, start + chunk_faces)
+        first_loop = loop_start[start]
+        last_loop = loop_start[end - 1] + loop_total[end - 1]
+        chunk_start = loop_start[start:end] - first_loop
+        chunk_total = loop_total[start:end]
+        if tri_polys is None: tri_loops_chunk, tri_polys_chunk = fan_triangles(chunk_start, chunk_total)
+        else:
+            first_tri, last_tri = np.searchsorted(tri_polys, (start, end))
+            tri_loops_chunk = tri_loops[first_tri:last_tri].astype(np.int64) - first_loop
+            tri_polys_chunk = tri_polys[first_tri:last_tri].astype(np.int64) - start
+        chunk = MeshArrays(positions, loop_verts[first_loop:last_loop], chunk_start, chunk_total,
+                           uvs[first_loop:last_loop].astype(np.float64), normals[start:end].astype(np.float64), tri_loops_chunk, tri_polys_chunk)
+        chunk_stats = {} if cull_stats is not None else None
+        accumulator.add(*face_density(chunk, matrix, view_dir, resolution, cull_stats=chunk_stats, anisotropic=anisotropic))
+        # The chunk's own object-level test is a chunk cull for the mesh
+        if chunk_stats: add_cull_stats(cull_stats, chunk_stats.get('faces', 0), chunks=chunk_stats.get('object', 0) + chunk_stats.get('chunk', 0),
+                                       face_level=chunk_stats.get('face', 0))
+    return accumulator
+
+# --- Camera Projection ---
+def projector_arrays(arrays, matrix, resolution):
+    """MeshArrays whose UVs are a camera projection: all vertices projected at once with the
+    projector's (X, Y, depth, W) matrix, in units of the frame height (one UV unit is the image
+    height, u spans the aspect ratio). Faces with a vertex behind the projector get no UV area and
+    are skipped. Positions, topology and culling chunks are shared with arrays."""
+    screen, depth = project_points(arrays.positions, matrix, resolution)
+    uvs = screen[arrays.loop_verts] / resolution[1]
+    if arrays.face_count:
+        behind = ~np.logical_and.reduceat(depth[arrays.loop_verts] > 0.0, arrays.loop_start)
+        uvs[np.repeat(behind, arrays.loop_total)] = 0.0
+    projected = MeshArrays(arrays.positions, arrays.loop_verts, arrays.loop_start, arrays.loop_total, uvs, arrays.normals,
+                           arrays.tri_loops, arrays.tri_polys, chunks=arrays.chunks, material_index=arrays.material_index)
+    projected.tiles = np.zeros_like(projected.tiles) # A projection image has no UDIM tiles
+    return projected
+
+# --- Progressive Sampling ---
+PROGRESSIVE_FIRST_FACES = 4096 # Size of the first slice, before the throughput is known
+PROGRESSIVE_MIN_FACES = 1024
+
+def stratified_order(count, stratum_size, seed=0):
+    """Permutation of range(count) in which every prefix is a stratified random sample: the items
+    are split into consecutive strata of stratum_size, and each round takes one random item from
+    every stratum (strata in a random order, items by a shared permutation with a random rotation per stratum)."""
+    rng = np.random.default_rng(seed)
+    strata = -(-count // stratum_size)
+    rounds = rng.permutation(stratum_size)[:, None]
+    stratum = rng.permutation(strata)
+    index = stratum * stratum_size + (rounds + rng.integers(stratum_size, size=strata)[stratum]) % stratum_size
+    index = index.ravel()
+    return index[index < count]
+
+class ProgressiveDensity:
+    """face_density evaluated slice by slice in stratified random order. The strata are runs of the
+    frustum-culling chunk order, so they are spatially compact and the first slice touches all of
+    them. Every prefix is a random sample for estimates; once all faces are done, ratios, areas and
+    cull_stats equal a face_density call on the whole mesh."""
+    def __init__(self, arrays, matrix, view_dir, resolution, face_mask=None, cull_stats=None, anisotropic=False, seed=0, world=None):
+        self.arrays, self.matrix, self.view_dir, self.resolution = arrays, matrix, local_view_direction(view_dir, world), resolution
+        self.face_mask, self.cull_stats, self.anisotropic = face_mask, cull_stats, anisotropic
+        face_count = arrays.face_count
+        faces, object_culled, chunk_culled = frustum_faces(arrays, matrix, resolution)
+        add_cull_stats(cull_stats, face_count, object_culled, chunk_culled)
+        self.order = faces[stratified_order(len(faces), max(1, -(-len(faces) // PROGRESSIVE_FIRST_FACES)), seed)]
+        # Triangle range of every face, so that a slice is gathered without touching the whole mesh
+        self.tri_perm = None
+        if np.any(np.diff(arrays.tri_polys) < 0):
+            self.tri_perm = np.argsort(arrays.tri_polys, kind='stable')
+        self.tri_count = np.bincount(arrays.tri_polys, minlength=face_count)
+        self.tri_first = np.cumsum(self.tri_count) - self.tri_count
+        self.ratios, self.areas = np.zeros(face_count), np.zeros(face_count)
+        self.done = 0
+        self.rate = None # Faces per second of the last slice
+
+    @property
+    def finished(self):
+        return self.done >= len(self.order)
+
+    @property
+    def progress(self):
+        return self.done / len(self.order) if len(self.order) else 1.0
+
+    def step(self, face_count):
+        arrays = self.arrays
+        faces = np.sort(self.order[self.done:self.done + face_count])
+        loop_total, tri_count = arrays.loop_total[faces], self.tri_count[faces]
+        loop_start = np.cumsum(loop_total) - loop_total
+        loop_offset = arrays.loop_start[faces] - loop_start
+        loops = np.repeat(loop_offset, loop_total) + np.arange(int(loop_total.sum()))
+        tri_first = np.cumsum(tri_count) - tri_count
+        tris = np.repeat(self.tri_first[faces] - tri_first, tri_count) + np.arange(int(tri_count.sum()))
+        if self.tri_perm is not None: tris = self.tri_perm[tris]
+        tri_polys = np.repeat(np.arange(len(faces)), tri_count)
+        chunk = MeshArrays(arrays.positions, arrays.loop_verts[loops], loop_start, loop_total, arrays.uvs[loops], arrays.normals[faces],
+                           arrays.tri_loops[tris] - loop_offset[tri_polys, None], tri_polys)
+        mask = None if self.face_mask is None else self.face_mask[faces]
+        self.ratios[faces], self.areas[faces] = _face_density(chunk, self.matrix, self.view_dir, self.resolution,
+                                                              mask, self.cull_stats, None, self.anisotropic)
+        self.done += len(faces)
+
+    def run(self, seconds):
+        # Evaluates slices until the time budget is spent; slice sizes follow the measured throughput
+        deadline = time.perf_counter() + seconds
+        while not self.finished:
+            start = time.perf_counter()
+            count = PROGRESSIVE_FIRST_FACES if self.rate is None else max(PROGRESSIVE_MIN_FACES, int(self.rate * (deadline - start)))
+            self.step(count)
+            self.rate = count / max(time.perf_counter() - start, 1e-6)
+            if time.perf_counter() >= deadline: break
+        return self.finished
+
+    def estimate(self, percentile, z=1.96):
+        """(estimate, low, high) of the weighted percentile from the faces done so far. The band
+        comes from the normal approximation of the sample quantile's rank with the effective sample
+        size of the area weights; for the maximum it collapses to the sample maximum (a lower bound)."""
+        faces = self.order[:self.done]
+        ratios, weights = self.ratios[faces], self.areas[faces]
+        total = weights.sum()
+        if total <= 0: return 0.0, 0.0, 0.0
+        if percentile >= 100.0:
+            peak = ratios.max()
+            return peak, peak, peak
+        q = percentile / 100.0
+        half = z * math.sqrt(q * (1.0 - q) * (weights ** 2).sum()) / total
+        low, high = max(0.0, q - half), min(1.0, q + half)
+        return tuple(weighted_percentiles(ratios, weights, (percentile, low * 100.0, high * 100.0))[:, 0])
+
+# --- Occlusion ---
+MAX_FRAGMENTS = 1 << 19 # Pixel samples per rasterization chunk (bounds memory)
+NEAR_DEPTH = 1e-4
+DEPTH_BIAS = 1e-3 # Relative depth tolerance of the visibility test
+
+class DepthBuffer:
+    """Software z-buffer at a fraction of the render resolution (no GPU needed)"""
+    def __init__(self, resolution, scale):
+        self.scale = scale
+        self.width = max(1, int(round(resolution[0] * scale)))
+        self.height = max(1, int(round(resolution[1] * scale)))
+        self.depth = np.full(self.width * self.height, np.inf)
+
+    @classmethod
+    def build(cls, resolution, scale, meshes):
+        # Buffer with every (positions, matrix, triangle vertices) mesh rasterized
+        depth_buffer = cls(resolution, scale)
+        for positions, matrix, tri_verts in meshes:
+            depth_buffer.rasterize(positions, matrix, tri_verts)
+        return depth_buffer
+
+    def _project(self, positions, matrix, tri_verts):
+        # Buffer-space triangles with the perspective-correct interpolants 1/W and depth/W
+        hom = positions @ matrix[:, :3].T + matrix[:, 3]
+        front = hom[:, 2] > NEAR_DEPTH
+        inv_w = 1.0 / np.where(front, hom[:, 3], 1.0)
+        xy = hom[:, :2] * (inv_w * self.scale)[:, None]
+        return xy[tri_verts], inv_w[tri_verts], (hom[:, 2] * inv_w)[tri_verts], front[tri_verts].all(axis=1)
+
+    def _fragments(self, xy, inv_w, depth_w):
+        """Yields (triangle, pixel, depth) for every pixel center covered by a triangle, in chunks"""
+        x, y = xy[..., 0], xy[..., 1]
+        area2 = (x[:, 1] - x[:, 0]) * (y[:, 2] - y[:, 0]) - (x[:, 2] - x[:, 0]) * (y[:, 1] - y[:, 0])
+        x0 = np.clip(np.ceil(x.min(axis=1) - 0.5), 0, self.width).astype(np.int64)
+        x1 = np.clip(np.floor(x.max(axis=1) - 0.5) + 1, 0, self.width).astype(np.int64)
+        y0 = np.clip(np.ceil(y.min(axis=1) - 0.5), 0, self.height).astype(np.int64)
+        y1 = np.clip(np.floor(y.max(axis=1) - 0.5) + 1, 0, self.height).astype(np.int64)
+        span_x = np.maximum(x1 - x0, 0)
+        counts = np.where(area2 != 0, span_x * np.maximum(y1 - y0, 0), 0)
+        tris = np.flatnonzero(counts)
+        ends = np.cumsum(counts[tris])
+        start = 0
+        while start < len(tris):
+            base = ends[start - 1] if start else 0
+            stop = max(int(np.searchsorted(ends, base + MAX_FRAGMENTS, side='right')), start + 1)
+            chunk = tris[start:stop]; n = counts[chunk]
+            tri = np.repeat(chunk, n)
+            offset = np.arange(int(n.sum())) - np.repeat(np.cumsum(n) - n, n)
+            px = x0[tri] + offset % span_x[tri]; py = y0[tri] + offset // span_x[tri]
+            dx = px + 0.5 - x[tri, 0]; dy = py + 0.5 - y[tri, 0]
+            # Barycentric weights of the pixel centers
+            l1 = (dx * (y[tri, 2] - y[tri, 0]) - (x[tri, 2] - x[tri, 0]) * dy) / area2[tri]
+            l2 = ((x[tri, 1] - x[tri, 0]) * dy - dx * (y[tri, 1] - y[tri, 0])) / area2[tri]
+            l0 = 1.0 - l1 - l2
+            hit = (l0 >= 0) & (l1 >= 0) & (l2 >= 0)
+            tri, l0, l1, l2 = tri[hit], l0[hit], l1[hit], l2[hit]
+            depth = ((l0 * depth_w[tri, 0] + l1 * depth_w[tri, 1] + l2 * depth_w[tri, 2]) /
+                     (l0 * inv_w[tri, 0] + l1 * inv_w[tri, 1] + l2 * inv_w[tri, 2]))
+            yield tri, py[hit] * self.width + px[hit], depth
+            start = stop
+
+    def rasterize(self, positions, matrix, tri_verts):
+        # Triangles crossing the near plane are skipped, so they can only under-occlude
+        xy, inv_w, depth_w, front = self._project(positions, matrix, tri_verts)
+        sel = np.flatnonzero(front)
+        for _tri, pixel, depth in self._fragments(xy[sel], inv_w[sel], depth_w[sel]):
+            np.minimum.at(self.depth, pixel, depth)
+
+    def visible_triangles(self, positions, matrix, tri_verts):
+        """Triangles with at least one unoccluded sample. The samples are the triangle centroid,
+        so triangles smaller than a buffer pixel are still tested, and the covered pixel centers.
+        Triangles crossing the near plane or with the centroid off the buffer are kept."""
+        xy, inv_w, depth_w, front = self._project(positions, matrix, tri_verts)
+        visible = ~front
+        sel = np.flatnonzero(front)
+        center = xy[sel].mean(axis=1)
+        center_depth = depth_w[sel].sum(axis=1) / inv_w[sel].sum(axis=1)
+        px = np.floor(center[:, 0]).astype(np.int64); py = np.floor(center[:, 1]).astype(np.int64)
+        on_buffer = (px >= 0) & (px < self.width) & (py >= 0) & (py < self.height)
+        pixel = np.where(on_buffer, py * self.width + px, 0)
+        visible[sel] = ~on_buffer | (center_depth <= self.depth[pixel] * (1.0 + DEPTH_BIAS))
+
+        pending = sel[~visible[sel]]
+        for tri, pixel, depth in self._fragments(xy[pending], inv_w[pending], depth_w[pending]):
+            visible[pending[tri[depth <= self.depth[pixel] * (1.0 + DEPTH_BIAS)]]] = True
+        return visible
+
+    def visible_faces(self, arrays, matrix):
+        # Per-face mask for face_density: a polygon is visible if any of its triangles is
+        tri_visible = self.visible_triangles(arrays.positions, matrix, arrays.loop_verts[arrays.tri_loops])
+        return np.bincount(arrays.tri_polys, weights=tri_visible, minlength=arrays.face_count) > 0
+
+# --- Statistics ---
+HISTOGRAM_MIN_EXP, HISTOGRAM_MAX_EXP = 8, 14 # 256 px .. 16K px
+
+def weighted_percentiles(values, weights, percentiles, groups=None, group_count=1):
+    """Weighted percentiles: the value below which q% of the weight lies.
+    Returns (len(percentiles), group_count); with groups, each group is evaluated separately."""
+    result = np.zeros((len(percentiles), group_count))
+    if len(values) == 0: return result
+    if groups is None: groups = np.zeros(len(values), dtype=np.intp)
+    order = np.lexsort((values, groups))
+    values, weights, groups = values[order], weights[order], groups[order]
+    totals = np.bincount(groups, weights=weights, minlength=group_count)
+    before = np.concatenate(([0.0], np.cumsum(totals)[:-1]))
+    cumulative = np.cumsum(weights) - before[groups]
+    for row, q in enumerate(percentiles):
+        hits = np.flatnonzero(cumulative >= totals[groups] * (q / 100.0) * (1.0 - 1e-9))
+        hit_groups, first = np.unique(groups[hits], return_index=True)
+        result[row, hit_groups] = values[hits[first]]
+    return result
+
+def grouped_statistic(values, weights, groups, group_count, percentile=100.0):
+    # Per-group maximum (percentile 100) or weighted percentile
+    if percentile >= 100.0:
+        result = np.zeros(group_count)
+        np.maximum.at(result, groups, values)
+        return result
+    return weighted_percentiles(values, weights, (percentile,), groups, group_count)[0]
+
+def resolution_histogram(ratios, weights, scale):
+    """Share of the weight per power-of-two required resolution (clamped to 256 px .. 16K px).
+    Returns (exponents, shares)"""
+    exponents = np.arange(HISTOGRAM_MIN_EXP, HISTOGRAM_MAX_EXP + 1)
+    shares = np.zeros(len(exponents))
+    if len(ratios) == 0 or weights.sum() <= 0: return exponents, shares
+    resolution = np.maximum(np.sqrt(ratios) * scale, 1.0)
+    bins = np.clip(np.ceil(np.log2(resolution)), HISTOGRAM_MIN_EXP, HISTOGRAM_MAX_EXP).astype(np.intp) - HISTOGRAM_MIN_EXP
+    shares += np.bincount(bins, weights=weights, minlength=len(exponents))
+    return exponents, shares / weights.sum()
+
+def tile_statistics(ratios, weights, tiles, percentile=100.0):
+    """Per UDIM tile in one pass over the faces: (tiles (K, 2), density ratio (K,), weight (K,))"""
+    if len(ratios) == 0: return np.zeros((0, 2), dtype=np.int64), np.zeros(0), np.zeros(0)
+    keys, inverse = np.unique(tiles, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    values = grouped_statistic(ratios, weights, inverse, len(keys), percentile)
+    return keys, values, np.bincount(inverse, weights=weights, minlength=len(keys))
+
+# --- Process Pool ---
+SHARED_FIELDS = ('positions', 'loop_verts', 'loop_start', 'loop_total', 'uvs', 'normals', 'tri_loops', 'tri_polys')
+RESULT_FIELDS = ('ratios', 'screen_areas')
+# Copying a mesh into shared memory costs about as much per face as evaluating it in-process
+# (1M faces: 0.14 s each), so the pool can only gain on jobs running beside the largest one.
+# It is used when the second largest job has at least this many faces
+POOL_MIN_FACES = 1000000
+
+_pool = None
+_pool_workers = 0
+_worker_module = None
+
+def export_shared_arrays(arrays):
+    """Copies the mesh arrays and their chunk index into one shared memory block, followed by
+    room for the per-face results. Returns (block, layout)"""
+    fields = [(name, np.ascontiguousarray(getattr(arrays, name))) for name in SHARED_FIELDS]
+    fields += [(name, np.ascontiguousarray(data)) for name, data in zip(CHUNK_FIELDS, arrays.chunks)]
+    fields += [(name, np.zeros(arrays.face_count)) for name in RESULT_FIELDS]
+    layout, offset = [], 0
+    for name, data in fields:
+        offset = (offset + 7) & ~7
+        layout.append((name, data.dtype.str, data.shape, offset))
+        offset += data.nbytes
+    block = shared_memory.SharedMemory(create=True, size=max(offset, 8))
+    for (name, data), (_name, dtype, shape, start) in zip(fields, layout):
+        if name not in RESULT_FIELDS: np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=start)[...] = data
+    return block, layout
+
+def import_shared_results(block, layout):
+    # Copies (ratios, screen areas) out of the block before it is released
+    views = {name: np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=start) for name, dtype, shape, start in layout if name in RESULT_FIELDS}
+    return tuple(views[name].copy() for name in RESULT_FIELDS)
+
+def _shared_face_density(block, layout, matrix, view_dir, resolution, face_mask, anisotropic, world):
+    views = {name: np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=start) for name, dtype, shape, start in layout}
+    chunks = tuple(views.pop(name) for name in CHUNK_FIELDS)
+    outputs = tuple(views.pop(name) for name in RESULT_FIELDS)
+    cull_stats = {}
+    results = face_density(MeshArrays(**views, chunks=chunks), matrix, view_dir, resolution, face_mask, cull_stats, anisotropic=anisotropic, world=world)
+    for output, result in zip(outputs, results): output[...] = result
+    return cull_stats
+
+def shared_face_density(block_name, layout, matrix, view_dir, resolution, face_mask=None, anisotropic=False, world=None):
+    # Worker entry point: writes the results into the block and returns only the cull stats.
+    # Views into the shared block must be released before close()
+    block = shared_memory.SharedMemory(name=block_name)
+    try: return _shared_face_density(block, layout, matrix, view_dir, resolution, face_mask, anisotropic, world)
+    finally: block.close()
+
+def get_pool(workers):
+    """The session's worker pool, created on first use and kept until shutdown_pool().
+    Workers cannot import the add-on package (it imports bpy), so they load this file as a
+    top-level module. Its folder is on sys.path only while the workers are started, and the
+    top-level copy is dropped from sys.modules again by shutdown_pool()."""
+    global _pool, _pool_workers, _worker_module
+    if _pool is not None and _pool_workers >= workers: return _pool, _worker_module.shared_face_density
+    shutdown_pool()
+    module_dir, module_file = os.path.split(os.path.abspath(__file__))
+    added_path = module_dir not in sys.path
+    if added_path: sys.path.append(module_dir)
+    try:
+        _worker_module = importlib.import_module(os.path.splitext(module_file)[0])
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        _pool_workers = workers
+        # Spawned workers copy sys.path when they start, so start them all now; each submit
+        # starts one worker while none is idle
+        for future in [_pool.submit(time.sleep, 0.01) for _ in range(workers)]: future.result()
+    except Exception:
+        shutdown_pool()
+        raise
+    finally:
+        if added_path and module_dir in sys.path: sys.path.remove(module_dir)
+    return _pool, _worker_module.shared_face_density
+
+def shutdown_pool():
+    global _pool, _pool_workers, _worker_module
+    if _pool is not None: _pool.shutdown(wait=False, cancel_futures=True)
+    if _worker_module is not None and sys.modules.get(_worker_module.__name__) is _worker_module:
+        del sys.modules[_worker_module.__name__]
+    _pool, _pool_workers, _worker_module = None, 0, None
+
+def face_densities(jobs, view_dir, resolution, use_pool=True, max_workers=None, face_masks=None, cull_stats=None, anisotropic=False, warnings=None, worlds=None):
+    """Per-face (density ratios, screen areas) for each (arrays, matrix) job; worlds are the
+    jobs' object world matrices (see face_density).
+    With use_pool and at least two jobs of POOL_MIN_FACES faces, the work is spread over the worker
+    pool, which reads the arrays from and writes the results to shared memory. On any pool
+    failure it evaluates in this process and appends the reason to warnings."""
+    if face_masks is None: face_masks = [None] * len(jobs)
+    if worlds is None: worlds = [None] * len(jobs)
+    face_counts = sorted(arrays.face_count for arrays, _matrix in jobs)
+    if use_pool and len(jobs) > 1 and face_counts[-2] >= POOL_MIN_FACES:
+        try:
+            results = _face_densities_in_pool(jobs, view_dir, resolution, max_workers, face_masks, anisotropic, worlds)
+            for _ratios, _areas, job_stats in results:
+                add_cull_stats(cull_stats, job_stats.get('faces', 0), job_stats.get('object', 0), job_stats.get('chunk', 0), job_stats.get('face', 0))
+            return [(ratios, areas) for ratios, areas, _job_stats in results]
+        except Exception as e:
+            # A broken pool is not reused
+            shutdown_pool()
+            if warnings is not None: warnings.append(f"Process pool unavailable, evaluated in-process ({e})")
+    return [face_density(arrays, matrix, view_dir, resolution, face_mask, cull_stats, anisotropic=anisotropic, world=world)
+            for (arrays, matrix), face_mask, world in zip(jobs, face_masks, worlds)]
+
+def _face_densities_in_pool(jobs, view_dir, resolution, max_workers, face_masks, anisotropic, worlds):
+    pool, worker = get_pool(max_workers or min(len(jobs), os.cpu_count() or 1))
+    blocks, results = [], []
+    try:
+        futures = []
+        for (arrays, matrix), face_mask, world in zip(jobs, face_masks, worlds):
+            block, layout = export_shared_arrays(arrays)
+            blocks.append((block, layout))
+            futures.append(pool.submit(worker, block.name, layout, matrix, view_dir, resolution, face_mask, anisotropic, world))
+        for (block, layout), future in zip(blocks, futures):
+            job_stats = future.result()
+            results.append(import_shared_results(block, layout) + (job_stats,))
+        return results
+    finally:
+        for block, _layout in blocks:
+            block.close(); block.unlink()
@@ -0,0 +1,43 @@
+"""Micro-benchmark of the lux meter's render readback, for development. Run it in Blender's
+Python console with the add-on enabled:
+
+    exec(open(path_to_this_file).read()); benchmark_lux_readback()
+
+It compares the former path (list copy into a temporary image, then np.array) with
+utils.LuxReadback on a synthetic float image, and returns the seconds per readback
+(former, current) and the luminance difference between the two."""
+import sys
+import time
+
+import bpy
+import numpy as np
+
+
+def addon_utils_module():
+    # The add-on's package name depends on how it was installed
+    for name, module in list(sys.modules.items()):
+        if name.endswith(".utils") and hasattr(module, "LuxReadback"): return module
+    raise RuntimeError("Enable the Analysis Toolkit add-on first")
+
+def benchmark_lux_readback(iterations=500, size=None):
+    utils = addon_utils_module()
+    size = size or utils.LUX_RENDER_SIZE
+    source = bpy.data.images.new("SA_Toolkit_Bench_Source", width=size, height=size, alpha=True, float_buffer=True)
+    source.pixels.foreach_set(np.random.default_rng(0).random(size * size * 4, dtype=np.float32))
+    readback = utils.LuxReadback(size, size)
+    try:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            temp_image = bpy.data.images.new("SA_Toolkit_Temp_Result", width=size, height=size, alpha=True, float_buffer=True)
+            temp_image.pixels[:] = source.pixels[:]
+            pixels = np.array(temp_image.pixels[:])
+            bpy.data.images.remove(temp_image)
+            former_value = np.mean(pixels.reshape(-1, 4)[:, :3] @ utils.LUMINANCE_WEIGHTS)
+        former = (time.perf_counter() - start) / iterations
+        start = time.perf_counter()
+        for _ in range(iterations):
+            current_value = readback.mean_luminance(source)
+        current = (time.perf_counter() - start) / iterations
+    finally:
+        bpy.data.images.remove(source)
+    return former, current, abs(former_value - current_value)
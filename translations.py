@@ -45,6 +45,8 @@ translation_dict = {
         ("*" , "Target Pixel Ratio:"): "目標ピクセル比率:",
         ("*" , "How many texture pixels to assign per 1 screen pixel. The slider goes up to 100%, but higher values can be entered manually"): "1スクリーンピクセルに割り当てるテクスチャピクセル数。スライダーは100%まで上がりますが、それ以上の値を手動で入力することもできます",
         ("*" , "UDIM Base Resolution:"): "UDIM基準解像度:",
+        ("*" , "Engine:"): "計算エンジン:",
+        ("*" , "NumPy evaluates all faces at once. Streaming keeps compact copies of the mesh and evaluates it in fixed-size chunks, so the working memory does not grow with the mesh. BMesh is the original per-face implementation, kept as a reference"): "NumPyは全ての面を一括で計算します。ストリーミングはメッシュのコンパクトなコピーを保持し、一定サイズのチャンクごとに計算するため、作業メモリがメッシュの大きさに応じて増えません。BMeshは従来の面ごとの実装で、参照用に残しています",
         ("*" , "Select an object"): "オブジェクトを選択",
         ("*" , "Object has no UV map!"): "オブジェクトにUVマップがありません！",
         ("*" , "No active camera in scene"): "シーンにアクティブカメラがありません",
@@ -62,6 +64,137 @@ translation_dict = {
         ("*" , "Calculate the optimal texture size based on the active camera view"): "アクティブカメラ視点での最適なテクスチャサイズを計算します",
         ("*" , "Calculation failed (off-screen)"): "計算不可 (画面外)",
         ("*" , "{num} tiles required"): "{num} 枚のタイルが必要です",
+        ("*" , "Object"): "オブジェクト",
+        ("*" , "Collection"): "コレクション",
+        ("*" , "Selection"): "選択",
+        ("*" , "Collection:"): "コレクション:",
+        ("*" , "Analyze a single mesh object"): "単一のメッシュオブジェクトを解析します",
+        ("*" , "Analyze every mesh with a UV map in a collection"): "コレクション内のUVマップを持つ全てのメッシュを解析します",
+        ("*" , "Analyze every selected mesh with a UV map"): "選択中のUVマップを持つ全てのメッシュを解析します",
+        ("*" , "Use Process Pool"): "プロセスプールを使用",
+        ("*" , "Evaluate objects in parallel worker processes when at least two targets have 1,000,000 faces or more. Copying a mesh to the workers costs about as much as evaluating it, so this only helps with several large objects on many cores. The workers start on first use and are reused for the session. Falls back to in-process evaluation if workers cannot be started"): "面数が1,000,000以上の対象が2つ以上ある場合、オブジェクトを並列のワーカープロセスで計算します。メッシュをワーカーへコピーする処理は計算とほぼ同じ時間がかかるため、多コア環境で大きなオブジェクトが複数ある場合にのみ効果があります。ワーカーは初回使用時に起動し、セッション中は再利用されます。ワーカーを起動できない場合は通常の処理に切り替わります",
+        ("*" , "No mesh objects with UV maps"): "UVマップを持つメッシュオブジェクトがありません",
+        ("*" , "Ready ({num} objects)"): "準備OK ({num} オブジェクト)",
+        ("*" , "Per-Object Results"): "オブジェクトごとの結果",
+        ("*" , "Off-screen"): "画面外",
+        ("*" , "Live Update"): "ライブ更新",
+        ("*" , "Recalculate automatically while the camera or the target object moves. Mesh data is cached, so only the projection is redone"): "カメラや対象オブジェクトを動かすと自動で再計算します。メッシュデータはキャッシュされ、投影のみが再計算されます",
+        ("*" , "Heatmap"): "ヒートマップ",
+        ("*" , "Statistics"): "統計",
+        ("*" , "Occlusion"): "オクルージョン",
+        ("*" , "Cameras:"): "カメラ:",
+        ("*" , "Markers"): "マーカー",
+        ("*" , "Evaluate the active scene camera"): "シーンのアクティブカメラを評価します",
+        ("*" , "Evaluate every camera in a collection"): "コレクション内のすべてのカメラを評価します",
+        ("*" , "Evaluate every camera bound to a timeline marker"): "タイムラインマーカーにバインドされたすべてのカメラを評価します",
+        ("*" , "No cameras found"): "カメラが見つかりません",
+        ("*" , "Ready ({num} cameras)"): "準備完了 ({num} 台のカメラ)",
+        ("*" , "Per-Camera Results"): "カメラごとの結果",
+        ("*" , "UV Islands"): "UVアイランド",
+        ("*" , "Also report the required resolution, screen coverage and wasted texture budget of each UV island"): "各UVアイランドの必要解像度、画面占有率、無駄になるテクスチャ容量も表示します",
+        ("*" , "UV Islands: {count}"): "UVアイランド: {count}",
+        ("*" , "Island / Required / Screen / Wasted Texture:"): "アイランド / 必要解像度 / 画面 / 無駄なテクスチャ:",
+        ("*" , "Top {count} by wasted texture"): "無駄なテクスチャの多い上位 {count} 件",
+        ("*" , "Assigned Textures"): "割り当て済みテクスチャ",
+        ("*" , "Include Instances"): "インスタンスを含める",
+        ("*" , "Density:"): "密度:",
+        ("*" , "Tessellation"): "テッセレーション",
+        ("*" , "{value} tris/px"): "{value} 三角形/px",
+        ("*" , "Target Triangle Size (px):"): "目標三角形サイズ (px):",
+        ("*" , "Screen area in pixels an average triangle should cover. Used for the decimation and subdivision suggestions"): "平均的な三角形が占めるべき画面上のピクセル面積。ポリゴン削減と細分化の提案に使われます",
+        ("*" , "Use Frame Range"): "フレーム範囲を使用",
+        ("*" , "Evaluate every frame of the frame range and keep the densest frame of each object and region"): "フレーム範囲の全フレームを評価し、オブジェクトと領域ごとに最も密なフレームを記録します",
+        ("*" , "Analyze Tessellation"): "テッセレーションを解析",
+        ("*" , "Measures how many triangles each target draws per screen pixel, per object and per frame region"): "各対象が画面の1ピクセルあたり何個の三角形を描画するかを、オブジェクトごと・フレーム領域ごとに測定します",
+        ("*" , "Object / Tris per px / Sub-pixel / Suggestion:"): "オブジェクト / 三角形/px / サブピクセル / 提案:",
+        ("*" , "Triangles per Pixel by Frame Region:"): "フレーム領域ごとの1ピクセルあたりの三角形:",
+        ("*" , "Decimate to {percent}%"): "{percent}% に削減",
+        ("*" , "Subdivide +{levels}"): "細分化 +{levels}",
+        ("*" , "OK"): "OK",
+        ("*" , "Background Calculation"): "バックグラウンド計算",
+        ("*" , "Run the NumPy calculation of a single object on a worker thread so the viewport never freezes. The result appears when it is ready; a newer calculation discards an unfinished one"): "単一オブジェクトのNumPy計算をワーカースレッドで実行し、ビューポートが固まらないようにします。結果は準備ができ次第表示され、新しい計算が始まると未完了の計算は破棄されます",
+        ("*" , "Calculating..."): "計算中...",
+        ("*" , "Progressive"): "プログレッシブ",
+        ("*" , "Show an estimate from a stratified random sample of faces within about 50 ms, with a 95% confidence band, and refine it in short slices until every face is processed. The final result is exact"): "面の層化ランダムサンプルから約50msで推定値を95%信頼区間とともに表示し、すべての面を処理するまで短い区切りで精度を高めます。最終結果は厳密な値です",
+        ("*" , "Estimate ({progress}%)"): "推定中 ({progress}%)",
+        ("*" , "Batched Bake"): "一括ベイク",
+        ("*" , "Measure all sensors with a single Cycles bake of a probe mesh (one tiny face per sensor) instead of one render per sensor"): "センサーごとにレンダリングする代わりに、プローブメッシュ（センサーごとに小さな面を1つ）を1回のCyclesベイクで測定します",
+        ("*" , "Adaptive Samples"): "適応サンプリング",
+        ("*" , "Render each sensor in growing sample batches until the standard error of its mean luminance is within the tolerance. Takes precedence over the batched bake"): "平均輝度の標準誤差が許容値に収まるまで、サンプル数を増やしながら各センサーをレンダリングします。一括ベイクより優先されます",
+        ("*" , "Tolerance"): "許容誤差",
+        ("*" , "Relative standard error of the measurement at which sampling stops"): "サンプリングを終了する測定値の相対標準誤差",
+        ("*" , "Max Samples"): "最大サンプル数",
+        ("*" , "Sample limit of an adaptive measurement"): "適応測定のサンプル数の上限",
+        ("*" , "Measuring sensor {index}/{count}... (Esc to cancel)"): "センサーを測定中 {index}/{count}... (Escでキャンセル)",
+        ("*" , "Baking {count} sensors..."): "{count}個のセンサーをベイク中...",
+        ("*" , "UV Source:"): "UVソース:",
+        ("*" , "UV Map"): "UVマップ",
+        ("*" , "Projector"): "プロジェクター",
+        ("*" , "Measure the active UV map of the object"): "オブジェクトのアクティブUVマップを測定します",
+        ("*" , "A projector camera defines the texture space (camera projection). The result is the projection image resolution the render camera needs"): "プロジェクターカメラがテクスチャ空間を定義します（カメラプロジェクション）。結果はレンダーカメラが必要とする投影画像の解像度です",
+        ("*" , "Projector Camera:"): "プロジェクターカメラ:",
+        ("*" , "Select a projector camera"): "プロジェクターカメラを選択してください",
+        ("*" , "Projector: {cam}"): "プロジェクター: {cam}",
+        ("*" , "Projection Image Resolution (Render Aspect):"): "投影画像の解像度（レンダーのアスペクト比）:",
+        ("*" , "95% Confidence: {band}"): "95%信頼区間: {band}",
+        ("*" , "At least {resolution}"): "{resolution} 以上",
+        ("*" , "Max Axis"): "最大軸",
+        ("*" , "Screen area divided by UV area. Stretching averages out"): "画面上の面積をUV面積で割った値。引き伸ばしは平均化されます",
+        ("*" , "Density along the most stretched direction, from the singular values of each triangle's UV to screen Jacobian"): "各三角形のUVから画面へのヤコビアンの特異値から求めた、最も引き伸ばされた方向の密度",
+        ("*" , "Magnified"): "拡大表示",
+        ("*" , "Screen Area by Mip Level at:"): "ミップレベル別の画面面積:",
+        ("*" , "Also evaluate collection instances, particles and geometry node instances of the targets. Each unique mesh is read once and its instances are projected together"): "対象のコレクションインスタンス、パーティクル、ジオメトリノードのインスタンスも評価します。固有のメッシュごとに一度だけ読み込み、そのインスタンスをまとめて投影します",
+        ("*" , "Compare the required resolution of each material with the size of the image textures it uses"): "各マテリアルの必要解像度と、使用している画像テクスチャのサイズを比較します",
+        ("*" , "Savings: {size} MB"): "削減量: {size} MB",
+        ("*" , "No image textures found"): "画像テクスチャが見つかりません",
+        ("*" , "Save Texture Report as CSV"): "テクスチャレポートをCSVで保存",
+        ("*" , "Saves the required and actual size of every assigned image texture to a CSV file"): "割り当てられた各画像テクスチャの必要サイズと実際のサイズをCSVファイルに保存します",
+        ("*" , "Culled Faces (of {total}):"): "カリングされた面 ({total} 面中):",
+        ("*" , "Object: {count}"): "オブジェクト: {count}",
+        ("*" , "Chunk: {count}"): "チャンク: {count}",
+        ("*" , "Face: {count}"): "面: {count}",
+        ("*" , "Ignore faces hidden behind other geometry or behind the object itself. Uses a software depth buffer, so it also works without a GPU"): "他のジオメトリやオブジェクト自身に隠れた面を無視します。ソフトウェア深度バッファを使うため、GPUがなくても動作します",
+        ("*" , "Depth Buffer Scale:"): "深度バッファの倍率:",
+        ("*" , "Depth buffer resolution as a fraction of the render resolution. Lower is faster but may miss thin occluders"): "レンダー解像度に対する深度バッファ解像度の割合。低いほど高速ですが、細い遮蔽物を見逃すことがあります",
+        ("*" , "Occluders:"): "遮蔽物:",
+        ("*" , "All visible mesh objects in the scene can occlude"): "シーン内の表示中のすべてのメッシュオブジェクトが遮蔽物になります",
+        ("*" , "Only the mesh objects of a collection, and the targets themselves, can occlude"): "コレクション内のメッシュオブジェクトと対象自身のみが遮蔽物になります",
+        ("*" , "Resolution Basis:"): "解像度の基準:",
+        ("*" , "Maximum"): "最大値",
+        ("*" , "99th Percentile"): "99パーセンタイル",
+        ("*" , "95th Percentile"): "95パーセンタイル",
+        ("*" , "Which face density the recommendation is based on. Percentiles are weighted by screen area, so a few sliver faces do not drive the result"): "推奨解像度の基準にする面密度。パーセンタイルは画面上の面積で重み付けされるため、少数の細長い面に結果が左右されません",
+        ("*" , "Every visible face gets at least the target pixel ratio"): "すべての可視面が目標ピクセル比以上になります",
+        ("*" , "99% of the visible screen area gets at least the target pixel ratio"): "可視画面面積の99%が目標ピクセル比以上になります",
+        ("*" , "95% of the visible screen area gets at least the target pixel ratio"): "可視画面面積の95%が目標ピクセル比以上になります",
+        ("*" , "Area-Weighted Percentiles:"): "面積加重パーセンタイル:",
+        ("*" , "Screen Area by Required Resolution:"): "必要解像度別の画面面積:",
+        ("*" , "Required Resolution per UDIM Tile:"): "UDIMタイルごとの必要解像度:",
+        ("*" , "Required Resolution"): "必要解像度",
+        ("*" , "Ratio to Texture Size"): "テクスチャサイズとの比率",
+        ("*" , "Write each face's required texture resolution in pixels"): "各面に必要なテクスチャ解像度(ピクセル)を書き込みます",
+        ("*" , "Write each face's required resolution divided by the texture size. 1.0 means the texture is exactly enough"): "各面の必要解像度をテクスチャサイズで割った値を書き込みます。1.0でちょうど足りる解像度です",
+        ("*" , "Texture Size:"): "テクスチャサイズ:",
+        ("*" , "Write Heatmap Attribute"): "ヒートマップ属性を書き込み",
+        ("*" , "Writes each face's required resolution to a face attribute and a color attribute of the target mesh"): "各面の必要解像度を対象メッシュの面属性とカラー属性に書き込みます",
+        ("*" , "Heatmap written to '{attr}' and '{color}'."): "ヒートマップを「{attr}」と「{color}」に書き込みました。",
+        ("*" , "Leave Edit Mode to write the heatmap."): "ヒートマップを書き込むには編集モードを終了してください。",
+        ("*" , "Modifiers change the face count. Apply them to write a heatmap."): "モディファイアーで面数が変わっています。ヒートマップを書き込むには適用してください。",
+        ("*" , "Current Frame"): "現在のフレーム",
+        ("*" , "Frame Range"): "フレーム範囲",
+        ("*" , "Evaluates the camera and object at the current frame"): "現在のフレームのカメラとオブジェクトで計算します",
+        ("*" , "Finds the frame that requires the highest resolution within a frame range"): "フレーム範囲内で最も高い解像度が必要なフレームを探します",
+        ("*" , "Start"): "開始",
+        ("*" , "End"): "終了",
+        ("*" , "Calculate over Frame Range"): "フレーム範囲で計算",
+        ("*" , "Finds the peak required texture resolution over the frame range. Frames where neither the camera nor the object moved are skipped"): "フレーム範囲内で必要なテクスチャ解像度の最大値を求めます。カメラもオブジェクトも動いていないフレームはスキップされます",
+        ("*" , "Set the analysis range to the scene's start and end frames"): "解析範囲をシーンの開始・終了フレームに設定します",
+        ("*" , "Peak Frame: {frame}"): "最大フレーム: {frame}",
+        ("*" , "Peak at frame {frame} ({evaluated} frames evaluated, {skipped} unchanged frames skipped)."): "フレーム {frame} で最大 ({evaluated} フレームを計算、変化のない {skipped} フレームをスキップ)。",
+        ("*" , "Invalid frame range."): "フレーム範囲が無効です。",
+        ("*" , "Prerequisites not met."): "計算の前提条件を満たしていません。",
+        ("*" , "Process pool unavailable; objects were evaluated in-process."): "プロセスプールを使用できないため、通常の処理で計算しました。",
+        ("*" , "Active UV layer not found."): "アクティブなUVレイヤーが見つかりません。",
 
         # Lux EV Converter
         ("*" , "EV Lux Converter"): "EV Lux 換算",
@@ -20,6 +20,14 @@ def draw_luxmeter_panel(layout, scene, context, _):
     box = layout.box()
     box.label(text=_("3. Measurement & Results"))
     box.operator("scene_analysis.measure_all", text=_("Illuminance measurement"), icon='PLAY')
+    row = box.row(align=True)
+    row.active = not props.lux_meter_adaptive
+    row.prop(props, "lux_meter_use_bake", text=_("Batched Bake"))
+    box.prop(props, "lux_meter_adaptive", text=_("Adaptive Samples"))
+    if props.lux_meter_adaptive:
+        col = box.column(align=True)
+        col.prop(props, "lux_meter_tolerance", text=_("Tolerance"))
+        col.prop(props, "lux_meter_max_samples", text=_("Max Samples"))
     
     col = box.column(align=True)
     row = col.row(align=True)
@@ -41,7 +49,7 @@ def draw_luxmeter_panel(layout, scene, context, _):
         for result in props.lux_meter_results:
             row = res_box.row()
             row.label(text=f"{result.name}:")
-            row.label(text=f"{result.lux:.2f} lx")
+            row.label(text=f"{result.lux:.2f} ± {result.lux_error:.2f} lx" if result.lux_error >= 0.0 else f"{result.lux:.2f} lx")
             
             op = row.operator("scene_analysis.copy_value", text="", icon='COPYDOWN', emboss=False)
             op.value_to_copy = f"{result.lux:.2f}"
@@ -67,9 +75,38 @@ def draw_texeldensity_panel(layout, scene, context, _):
     
     box = layout.box()
     box.label(text=_("Target"), icon='OBJECT_DATA')
-    split = box.split(factor=0.4)
-    split.label(text=_("Target Object:"))
-    split.prop(props, "target_object", text="")
+    row_target = box.row(align=True)
+    row_target.prop_enum(props, "target_mode", 'OBJECT'); row_target.prop_enum(props, "target_mode", 'COLLECTION'); row_target.prop_enum(props, "target_mode", 'SELECTION')
+    is_multi = props.target_mode != 'OBJECT'
+    if props.target_mode == 'COLLECTION':
+        split = box.split(factor=0.4)
+        split.label(text=_("Collection:"))
+        split.prop(props, "target_collection", text="")
+    elif props.target_mode == 'OBJECT':
+        split = box.split(factor=0.4)
+        split.label(text=_("Target Object:"))
+        split.prop(props, "target_object", text="")
+        split = box.split(factor=0.4)
+        split.label(text=_("UV Source:"))
+        split.row().prop(props, "uv_source", expand=True)
+        if props.uv_source == 'PROJECTOR':
+            split = box.split(factor=0.4)
+            split.label(text=_("Projector Camera:"))
+            split.prop(props, "projector_camera", text="")
+        split = box.split(factor=0.4)
+        split.active = props.calc_mode == 'CURRENT'
+        split.label(text=_("Cameras:"))
+        split.row().prop(props, "camera_source", expand=True)
+        if props.camera_source == 'COLLECTION':
+            split = box.split(factor=0.4)
+            split.active = props.calc_mode == 'CURRENT'
+            split.label(text=_("Collection:"))
+            split.prop(props, "camera_collection", text="")
+    if is_multi:
+        box.prop(props, "use_instances", text=_("Include Instances"))
+        row = box.row()
+        row.active = not props.use_instances
+        row.prop(props, "use_process_pool", text=_("Use Process Pool"))
 
     box = layout.box()
     box.label(text=_("Settings"), icon='SETTINGS')
@@ -79,17 +116,72 @@ def draw_texeldensity_panel(layout, scene, context, _):
     split = box.split(factor=0.4)
     split.label(text=_("UDIM Base Resolution:"))
     split.prop(props, "udim_resolution", text="")
+    split = box.split(factor=0.4)
+    split.label(text=_("Resolution Basis:"))
+    split.prop(props, "resolution_basis", text="")
+    split = box.split(factor=0.4)
+    split.label(text=_("Density:"))
+    split.row().prop(props, "density_mode", expand=True)
+    split = box.split(factor=0.4)
+    split.label(text=_("Engine:"))
+    split.prop(props, "engine", text="")
+    col = box.column()
+    col.active = props.engine == 'NUMPY'
+    row = col.row()
+    row.prop(props, "use_progressive", text=_("Progressive"))
+    sub = row.row()
+    sub.active = not props.use_progressive
+    sub.prop(props, "use_background", text=_("Background Calculation"))
+    col.prop(props, "use_occlusion", text=_("Occlusion"))
+    if props.use_occlusion:
+        split = col.split(factor=0.4)
+        split.label(text=_("Depth Buffer Scale:"))
+        split.prop(props, "occlusion_scale", text="")
+        split = col.split(factor=0.4)
+        split.label(text=_("Occluders:"))
+        split.row().prop(props, "occluder_source", expand=True)
+        if props.occluder_source == 'COLLECTION':
+            split = col.split(factor=0.4)
+            split.label(text=_("Collection:"))
+            split.prop(props, "occluder_collection", text="")
+    row = col.row()
+    row.active = not is_multi
+    row.prop(props, "analyze_islands", text=_("UV Islands"))
+    col.prop(props, "analyze_textures", text=_("Assigned Textures"))
 
     warning_box = layout.box()
     is_ready = True
     active_cam = scene.camera
-    if not obj:
+    if is_multi:
+        target_count = len(utils.get_texel_density_targets(context, props))
+        if target_count == 0:
+            warning_box.label(text=_("No mesh objects with UV maps"), icon='ERROR')
+            is_ready = False
+        elif not active_cam:
+            warning_box.alert = True
+            warning_box.label(text=_("No active camera in scene"), icon='ERROR')
+            is_ready = False
+        else:
+            warning_box.label(text=_("Ready ({num} objects)", num=target_count), icon='CHECKMARK')
+    elif not obj:
         warning_box.label(text=_("Select an object"), icon='ERROR')
         is_ready = False
-    elif not obj.data.uv_layers:
+    elif utils.uses_projector(props) and not props.projector_camera:
+        warning_box.alert = True
+        warning_box.label(text=_("Select a projector camera"), icon='ERROR')
+        is_ready = False
+    elif not utils.uses_projector(props) and not obj.data.uv_layers:
         warning_box.alert = True
         warning_box.label(text=_("Object has no UV map!"), icon='ERROR')
         is_ready = False
+    elif utils.is_multi_camera(props):
+        camera_count = len(utils.get_texel_density_cameras(context, props))
+        if camera_count == 0:
+            warning_box.alert = True
+            warning_box.label(text=_("No cameras found"), icon='ERROR')
+            is_ready = False
+        else:
+            warning_box.label(text=_("Ready ({num} cameras)", num=camera_count), icon='CHECKMARK')
     elif not active_cam:
         warning_box.alert = True
         warning_box.label(text=_("No active camera in scene"), icon='ERROR')
@@ -97,28 +189,61 @@ def draw_texeldensity_panel(layout, scene, context, _):
     else:
         warning_box.label(text=_("Ready"), icon='CHECKMARK')
 
+    row_mode = layout.row(align=True)
+    row_mode.enabled = not is_multi
+    row_mode.prop_enum(props, "calc_mode", 'CURRENT'); row_mode.prop_enum(props, "calc_mode", 'RANGE')
+    if props.calc_mode == 'RANGE' and not is_multi:
+        row_frames = layout.row(align=True)
+        row_frames.prop(props, "range_start_frame", text=_("Start"))
+        row_frames.prop(props, "range_end_frame", text=_("End"))
+        row_frames.operator("scene_analysis.texel_density_scene_range", text="", icon='PREVIEW_RANGE')
+
     row = layout.row()
     row.scale_y = 1.5
     row.enabled = is_ready
-    row.operator("scene_analysis.calculate_texel_density", text=_("Recalculate at Current Position"), icon='FILE_REFRESH')
+    if props.calc_mode == 'RANGE' and not is_multi:
+        row.operator("scene_analysis.calculate_texel_density_range", text=_("Calculate over Frame Range"), icon='PLAY')
+    else:
+        row.operator("scene_analysis.calculate_texel_density", text=_("Recalculate at Current Position"), icon='FILE_REFRESH')
+    if props.calc_mode == 'CURRENT' and not is_multi:
+        layout.prop(props, "live_update", text=_("Live Update"))
     
     info_box = layout.box()
     info_box.label(text=_("Info"), icon='INFO')
-    render = scene.render
     cam_name = active_cam.name if active_cam else _("None")
     info_box.label(text=_( "Active Camera: {cam}", cam=cam_name))
-    info_box.label(text=_( "Render Resolution: {x} x {y} px", x=render.resolution_x, y=render.resolution_y))
-    if obj and obj.data.uv_layers and obj.data.uv_layers.active:
+    res_x, res_y = utils.render_resolution(scene)
+    info_box.label(text=_( "Render Resolution: {x} x {y} px", x=res_x, y=res_y))
+    if utils.uses_projector(props) and props.projector_camera:
+        info_box.label(text=_( "Projector: {cam}", cam=props.projector_camera.name))
+    elif not is_multi and obj and obj.data.uv_layers and obj.data.uv_layers.active:
         info_box.label(text=_( "Active UV: {uv}", uv=obj.data.uv_layers.active.name))
+    if props.result_cull_faces >= 0:
+        col = info_box.column(align=True)
+        col.label(text=_("Culled Faces (of {total}):", total=f"{props.result_cull_faces:,}"))
+        row = col.row(align=True)
+        row.label(text=_("Object: {count}", count=f"{props.result_cull_object:,}"))
+        row.label(text=_("Chunk: {count}", count=f"{props.result_cull_chunk:,}"))
+        row.label(text=_("Face: {count}", count=f"{props.result_cull_face:,}"))
         
     result_box = layout.box()
-    result_box.label(text=_("Calculation Results"), icon='TEXTURE')
+    row = result_box.row()
+    row.label(text=_("Calculation Results"), icon='TEXTURE')
+    progressive = utils.is_texel_progressive_running()
+    if progressive: row.label(text=_("Estimate ({progress}%)", progress=f"{props.result_progress:.0f}"), icon='SORTTIME')
+    elif utils.is_texel_job_running(): row.label(text=_("Calculating..."), icon='SORTTIME')
     col = result_box.column(align=True)
+    if props.result_peak_frame >= 0:
+        col.label(text=_("Peak Frame: {frame}", frame=props.result_peak_frame), icon='TIME')
     col.label(text=_("Effective Resolution (Calculated):"))
     row = col.row()
     row.alignment = 'CENTER'
     row.scale_y = 1.2
     row.label(text=props.result_effective_resolution)
+    if progressive:
+        row = col.row()
+        row.alignment = 'CENTER'
+        row.label(text=_("95% Confidence: {band}", band=props.result_confidence))
     
     col.label(text=_("Recommended Single Texture Resolution:"))
     row = col.row()
@@ -127,6 +252,12 @@ def draw_texeldensity_panel(layout, scene, context, _):
     row.label(text=props.result_resolution)
     if props.result_coverage:
         row.label(text=_( "({coverage:.1f}% Coverage)", coverage=float(props.result_coverage)))
+    if props.result_projection_resolution:
+        col.label(text=_("Projection Image Resolution (Render Aspect):"))
+        row = col.row()
+        row.alignment = 'CENTER'
+        row.scale_y = 1.2
+        row.label(text=props.result_projection_resolution)
 
     col.separator()
     enum_items_dict = {item.identifier: item.name for item in props.bl_rna.properties['udim_resolution'].enum_items}
@@ -141,6 +272,155 @@ def draw_texeldensity_panel(layout, scene, context, _):
     else:
         row.label(text="N/A")
 
+    if props.histogram_results or props.tile_results:
+        stats_box = layout.box()
+        row = stats_box.row()
+        row.prop(props, "statistics_panel_expanded", icon="TRIA_DOWN" if props.statistics_panel_expanded else "TRIA_RIGHT", icon_only=True, emboss=False)
+        row.label(text=_("Statistics"), icon='GRAPH')
+        if props.statistics_panel_expanded:
+            col = stats_box.column(align=True)
+            col.label(text=_("Area-Weighted Percentiles:"))
+            row = col.row(align=True)
+            row.label(text=f"P50: {props.result_p50}")
+            row.label(text=f"P95: {props.result_p95}")
+            row.label(text=f"P99: {props.result_p99}")
+
+            col.separator()
+            col.label(text=_("Screen Area by Required Resolution:"))
+            for item in props.histogram_results:
+                row = col.row(align=True)
+                row.label(text=item.name)
+                row.label(text=f"{item.share * 100:.1f}%")
+
+            if props.mip_results:
+                col.separator()
+                split = col.split(factor=0.6)
+                split.label(text=_("Screen Area by Mip Level at:"))
+                split.prop(props, "heatmap_texture_size", text="")
+                for item in props.mip_results:
+                    row = col.row(align=True)
+                    row.label(text=item.name)
+                    row.label(text=f"{item.share * 100:.1f}%")
+
+            if props.tile_results:
+                col.separator()
+                col.label(text=_("Required Resolution per UDIM Tile:"))
+                for item in props.tile_results:
+                    target_resolution, final_resolution = utils.required_texel_resolution(item.density_ratio, props.pixel_ratio_percentage)
+                    row = col.row(align=True)
+                    row.label(text=item.name)
+                    row.label(text=f"{target_resolution:.0f} px")
+                    row.label(text=f"{final_resolution} px")
+                    row.label(text=f"{item.coverage:.1f}%")
+
+    if props.result_island_count >= 0:
+        island_box = layout.box()
+        row = island_box.row()
+        row.prop(props, "island_panel_expanded", icon="TRIA_DOWN" if props.island_panel_expanded else "TRIA_RIGHT", icon_only=True, emboss=False)
+        row.label(text=_("UV Islands: {count}", count=props.result_island_count), icon='UV_ISLANDSEL')
+        if props.island_panel_expanded:
+            col = island_box.column(align=True)
+            col.label(text=_("Island / Required / Screen / Wasted Texture:"))
+            for item in props.island_results:
+                target_resolution, _final_resolution = utils.required_texel_resolution(item.density_ratio, props.pixel_ratio_percentage)
+                row = col.row(align=True)
+                row.label(text=f"#{item.name} ({item.face_count})")
+                row.label(text=f"{target_resolution:.0f} px" if target_resolution > 0 else _("Off-screen"))
+                row.label(text=f"{item.screen_coverage:.1f}%")
+                row.label(text=f"{item.wasted_share:.1f}%")
+            if props.result_island_count > len(props.island_results):
+                col.label(text=_("Top {count} by wasted texture", count=len(props.island_results)))
+
+    if props.result_texture_savings >= 0:
+        texture_box = layout.box()
+        row = texture_box.row()
+        row.prop(props, "texture_panel_expanded", icon="TRIA_DOWN" if props.texture_panel_expanded else "TRIA_RIGHT", icon_only=True, emboss=False)
+        row.label(text=_("Assigned Textures"), icon='IMAGE_DATA')
+        row.label(text=_("Savings: {size} MB", size=f"{props.result_texture_savings / 2**20:.1f}"))
+        if props.texture_panel_expanded:
+            col = texture_box.column(align=True)
+            if not props.texture_results: col.label(text=_("No image textures found"))
+            status_icons = {'UNDER': 'ERROR', 'OVER': 'SORT_DESC', 'OK': 'CHECKMARK', 'UNSEEN': 'HIDE_ON'}
+            for item in props.texture_results:
+                target_resolution, final_resolution = utils.required_texel_resolution(item.density_ratio, props.pixel_ratio_percentage)
+                row = col.row(align=True)
+                row.label(text=item.name, icon=status_icons[utils.texel_texture_status(item, props.pixel_ratio_percentage)])
+                row.label(text=f"{item.width} x {item.height}")
+                row.label(text=f"{final_resolution} px" if final_resolution > 0 else _("Off-screen"))
+                row.label(text=f"-{item.saved_bytes / 2**20:.1f} MB" if item.saved_bytes > 0 else "")
+            texture_box.operator("scene_analysis.save_texture_report_csv", text=_("Save Texture Report as CSV"), icon='FILE_TICK')
+
+    if not is_multi:
+        heat_box = layout.box()
+        row = heat_box.row()
+        row.prop(props, "heatmap_panel_expanded", icon="TRIA_DOWN" if props.heatmap_panel_expanded else "TRIA_RIGHT", icon_only=True, emboss=False)
+        row.label(text=_("Heatmap"), icon='COLOR')
+        if props.heatmap_panel_expanded:
+            heat_box.prop(props, "heatmap_mode", text="")
+            if props.heatmap_mode == 'RATIO':
+                split = heat_box.split(factor=0.4)
+                split.label(text=_("Texture Size:"))
+                split.prop(props, "heatmap_texture_size", text="")
+            heat_box.operator("scene_analysis.texel_density_heatmap", text=_("Write Heatmap Attribute"), icon='BRUSH_DATA')
+
+    tess_box = layout.box()
+    row = tess_box.row()
+    row.prop(props, "tessellation_panel_expanded", icon="TRIA_DOWN" if props.tessellation_panel_expanded else "TRIA_RIGHT", icon_only=True, emboss=False)
+    row.label(text=_("Tessellation"), icon='MOD_DECIM')
+    if props.result_tessellation: row.label(text=_("{value} tris/px", value=props.result_tessellation))
+    if props.tessellation_panel_expanded:
+        split = tess_box.split(factor=0.6)
+        split.label(text=_("Target Triangle Size (px):"))
+        split.prop(props, "tessellation_target_pixels", text="")
+        tess_box.prop(props, "tessellation_use_range", text=_("Use Frame Range"))
+        if props.tessellation_use_range:
+            row_frames = tess_box.row(align=True)
+            row_frames.prop(props, "range_start_frame", text=_("Start"))
+            row_frames.prop(props, "range_end_frame", text=_("End"))
+            row_frames.operator("scene_analysis.texel_density_scene_range", text="", icon='PREVIEW_RANGE')
+        tess_box.operator("scene_analysis.tessellation_density", text=_("Analyze Tessellation"), icon='PLAY')
+        if props.tessellation_results:
+            col = tess_box.column(align=True)
+            col.label(text=_("Object / Tris per px / Sub-pixel / Suggestion:"))
+            for item in props.tessellation_results:
+                row = col.row(align=True)
+                row.label(text=item.name if item.frame < 0 else f"{item.name} ({item.frame})")
+                row.label(text=f"{item.triangle_count / item.screen_area:.3f}" if item.screen_area > 0 else "-")
+                row.label(text=f"{item.subpixel_count / item.triangle_count * 100:.0f}%" if item.triangle_count else "-")
+                row.label(text=utils.tessellation_advice_text(item, props.tessellation_target_pixels))
+        if props.tessellation_region_results:
+            col = tess_box.column(align=True)
+            col.label(text=_("Triangles per Pixel by Frame Region:"))
+            grid = col.grid_flow(row_major=True, columns=int(len(props.tessellation_region_results)**0.5), even_columns=True, align=True)
+            for item in props.tessellation_region_results:
+                grid.label(text=f"{item.name}: {item.triangle_count / item.screen_area:.2f}" if item.screen_area > 0 else f"{item.name}: -")
+
+    if utils.is_multi_camera(props) and props.camera_results:
+        table_box = layout.box()
+        table_box.label(text=_("Per-Camera Results"), icon='OUTLINER_OB_CAMERA')
+        for item in props.camera_results:
+            target_resolution, final_resolution = utils.required_texel_resolution(item.density_ratio, props.pixel_ratio_percentage)
+            row = table_box.row(align=True)
+            row.label(text=item.name)
+            if final_resolution > 0:
+                row.label(text=f"{target_resolution:.0f} px")
+                row.label(text=f"{final_resolution} px")
+            else:
+                row.label(text=_("Off-screen"))
+
+    if is_multi and props.object_results:
+        table_box = layout.box()
+        table_box.label(text=_("Per-Object Results"), icon='OUTLINER_OB_MESH')
+        for item in props.object_results:
+            target_resolution, final_resolution = utils.required_texel_resolution(item.density_ratio, props.pixel_ratio_percentage)
+            row = table_box.row(align=True)
+            row.label(text=item.name)
+            if final_resolution > 0:
+                row.label(text=f"{target_resolution:.0f} px")
+                row.label(text=f"{final_resolution} px")
+            else:
+                row.label(text=_("Off-screen"))
+
 def draw_luxev_panel(layout, scene, context, _):
     """Draws the Lux <> EV Converter panel with a reference table"""
     props = scene.analysis_toolkit_props
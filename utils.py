@@ -6,6 +6,8 @@ import mathutils
 from mathutils import Vector
 from bpy_extras.object_utils import world_to_camera_view
 from bpy.app.handlers import persistent
+from concurrent.futures import ThreadPoolExecutor
+from . import texel_engine
 
 # --- Translate ---
 def translate(text, *args, **kwargs):
@@ -55,89 +57,294 @@ ISO_ITEMS = [('CUSTOM', "Custom", "")] + [(str(i), f"ISO {i}", "") for i in [100
 ND_ITEMS = [('1', "None (0 Stop)", ""), ('CUSTOM', "Custom", "")] + [(str(2**i), f"ND{2**i} ({i} Stop)", "") for i in range(1, 11)]
 
 # --- Lux Meter ---
-def perform_lux_measurement(context, sensor_obj):
-    if not sensor_obj:
-        print("Sensor object not provided to measurement function.")
-        return None
-    original_scene = context.scene
-    original_window_scene = context.window.scene
-    original_engine = original_scene.render.engine
+LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722]) # Rec. 709
+LUMINANCE_WEIGHTS_RGBA = np.array([0.2126, 0.7152, 0.0722, 0.0], dtype=np.float32)
+LUX_RENDER_SIZE = 16 # Render resolution of a single measurement
+LUX_SAMPLES = 256 # Cycles samples of a fixed measurement, rendered as two batches
+LUX_ADAPTIVE_FIRST_SAMPLES = 32 # First batch of an adaptive measurement; later batches double the total
+LUX_CONFIDENCE_Z = 1.96 # 95% confidence interval
+LUX_CALIBRATION = 1.03 # Empirical correction of the Cycles measurement
+LUX_PROBE_SIZE = 0.01 # Edge length of the measured surface
+
+def lux_from_luminance(luminance):
+    # A white Lambertian surface reflects E / pi
+    return luminance * math.pi * LUX_CALIBRATION
+
+def new_lux_scene(original_scene):
+    # Temporary scene with the original content; linking collections instead of every object
+    # keeps this cheap in scenes with very many objects
     temp_scene = bpy.data.scenes.new(name="SA_Toolkit_Temp_Scene")
-    for obj in original_scene.objects:
+    for obj in original_scene.collection.objects:
         temp_scene.collection.objects.link(obj)
+    for child in original_scene.collection.children:
+        temp_scene.collection.children.link(child)
     temp_scene.world = original_scene.world
-    context.window.scene = temp_scene
-    
-    temp_plane, temp_camera, temp_mat, temp_comp_tree = None, None, None, None
-    final_lux = None
-    try:
-        sensor_matrix = sensor_obj.matrix_world
-        sensor_location = sensor_matrix.translation
-        plane_normal = sensor_matrix.to_3x3() @ mathutils.Vector((0.0, 0.0, 1.0)); plane_normal.normalize()
-        bpy.ops.mesh.primitive_plane_add(size=0.01, enter_editmode=False, align='WORLD', location=sensor_location)
-        temp_plane = context.active_object; temp_plane.name = "Temp_luxmeter_Plane"; temp_plane.rotation_euler = sensor_obj.rotation_euler
+    return temp_scene
+
+class LuxReadback:
+    """Reads rendered pixels with foreach_get into one reused float32 buffer and reduces them to
+    the mean luminance in place: no Python lists and no intermediate image"""
+    def __init__(self, width=LUX_RENDER_SIZE, height=LUX_RENDER_SIZE):
+        self.buffer = np.empty(width * height * 4, dtype=np.float32)
+        self.luminance = np.empty(width * height, dtype=np.float32)
+
+    def read(self, image):
+        # Per-pixel luminance (the reused array), or None if the image has no pixels of the expected size
+        if image is None or not image.has_data or image.size[0] * image.size[1] * image.channels != len(self.buffer): return None
+        image.pixels.foreach_get(self.buffer)
+        np.dot(self.buffer.reshape(-1, 4), LUMINANCE_WEIGHTS_RGBA, out=self.luminance)
+        return self.luminance
+
+    def mean_luminance(self, image):
+        luminance = self.read(image)
+        return float(luminance.mean()) if luminance is not None else None
+
+_lux_sessions = set() # Open sessions, detached when another file is loaded
+lux_undo_count = 0 # Undo and redo steps so far; a modal measurement stops when it changes
+
+class LuxMeasurementSession:
+    """Measurement rig built once for any number of sensors: a temporary scene sharing the
+    original collections, a white probe plane, an orthographic camera and the compositor tree.
+    measure() only moves the plane and the camera, and persistent data lets Cycles keep the
+    synced scene between renders. The Viewer image is read through a LuxReadback (Python cannot
+    read the Render Result pixels directly). Use as a context manager, or call start() and
+    close(); both are safe to call twice. With hold_scene=False the window shows the temporary
+    scene only during each render, so a modal caller keeps the user's scene on screen between
+    measurements. The rig is looked up by name on every use, so an undo that removed it raises a
+    RuntimeError instead of touching freed data."""
+    def __init__(self, context, hold_scene=True):
+        self.window = context.window
+        self.original_scene_name = context.scene.name
+        self.hold_scene = hold_scene
+        self.original_window_scene_name = None
+        self.had_viewer_image = True
+        self.readback = LuxReadback()
+        self.names = {}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def start(self):
+        if self.names: return
+        self.original_window_scene_name = self.window.scene.name
+        self.had_viewer_image = 'Viewer Node' in bpy.data.images
+        _lux_sessions.add(self)
+        try:
+            temp_scene = new_lux_scene(bpy.data.scenes[self.original_scene_name])
+            self.names['scene'] = temp_scene.name
+            if self.hold_scene: self.window.scene = temp_scene
+            self._build_rig(temp_scene)
+        except Exception:
+            self.close()
+            raise
+
+    def _build_rig(self, temp_scene):
+        half = LUX_PROBE_SIZE * 0.5
+        plane_mesh = bpy.data.meshes.new("Temp_luxmeter_Plane")
+        self.names['mesh'] = plane_mesh.name
+        plane_mesh.from_pydata([(-half, -half, 0.0), (half, -half, 0.0), (half, half, 0.0), (-half, half, 0.0)], [], [(0, 1, 2, 3)])
+        temp_plane = bpy.data.objects.new("Temp_luxmeter_Plane", plane_mesh)
+        self.names['plane'] = temp_plane.name
+        temp_scene.collection.objects.link(temp_plane)
         temp_mat = bpy.data.materials.new(name="Temp_White_Material"); temp_mat.use_nodes = True
+        self.names['material'] = temp_mat.name
         nodes = temp_mat.node_tree.nodes; nodes.clear()
         node_diffuse = nodes.new(type='ShaderNodeBsdfDiffuse'); node_diffuse.inputs['Color'].default_value = (1.0, 1.0, 1.0, 1)
         node_output = nodes.new(type='ShaderNodeOutputMaterial')
         temp_mat.node_tree.links.new(node_diffuse.outputs['BSDF'], node_output.inputs['Surface'])
-        temp_plane.data.materials.append(temp_mat)
-        camera_location = sensor_location + plane_normal * 0.01
-        bpy.ops.object.camera_add(enter_editmode=False, align='VIEW', location=camera_location)
-        temp_camera = context.active_object; temp_camera.name = "Temp_luxmeter_Camera"
-        temp_camera.data.type = 'ORTHO'; temp_camera.data.ortho_scale = 0.01; temp_camera.data.clip_start = 0.001
+        plane_mesh.materials.append(temp_mat)
+
+        camera_data = bpy.data.cameras.new("Temp_luxmeter_Camera")
+        self.names['camera_data'] = camera_data.name
+        camera_data.type = 'ORTHO'; camera_data.ortho_scale = 0.01; camera_data.clip_start = 0.001
+        temp_camera = bpy.data.objects.new("Temp_luxmeter_Camera", camera_data)
+        self.names['camera'] = temp_camera.name
+        temp_scene.collection.objects.link(temp_camera)
         constraint = temp_camera.constraints.new(type='TRACK_TO'); constraint.target = temp_plane; constraint.track_axis = 'TRACK_NEGATIVE_Z'; constraint.up_axis = 'UP_Y'
         temp_scene.camera = temp_camera
         temp_scene.render.engine = 'CYCLES'
-        temp_scene.render.resolution_x = 16
-        temp_scene.render.resolution_y = 16
-        temp_scene.cycles.samples = 256
+        temp_scene.render.resolution_x = LUX_RENDER_SIZE
+        temp_scene.render.resolution_y = LUX_RENDER_SIZE
+        temp_scene.render.resolution_percentage = 100
+        temp_scene.render.use_persistent_data = True
+        temp_scene.cycles.samples = LUX_SAMPLES
         temp_scene.cycles.use_denoising = False
+        temp_scene.cycles.use_animated_seed = False
         temp_scene.render.film_transparent = True
-        
+
         tree = None
         if bpy.app.version >= (5, 0, 0):
-            comp_name = "SA_Toolkit_Temp_Compositor"
-            temp_comp_tree = bpy.data.node_groups.new(comp_name, 'CompositorNodeTree')
-            temp_scene.compositing_node_group = temp_comp_tree
-            tree = temp_comp_tree
+            tree = bpy.data.node_groups.new("SA_Toolkit_Temp_Compositor", 'CompositorNodeTree')
+            self.names['compositor'] = tree.name
+            temp_scene.compositing_node_group = tree
         else:
             temp_scene.use_nodes = True
             tree = temp_scene.node_tree
-        
-        if not tree:
-            print("Analysis Toolkit Error: Could not get or create a compositor node tree for the temporary scene.")
-            return None
-            
+        if not tree: raise RuntimeError("Could not get or create a compositor node tree for the temporary scene.")
         tree.nodes.clear()
         render_layers_node = tree.nodes.new(type='CompositorNodeRLayers')
         viewer_node = tree.nodes.new(type='CompositorNodeViewer')
         tree.links.new(render_layers_node.outputs[0], viewer_node.inputs[0])
-        bpy.ops.render.render(scene=temp_scene.name, write_still=False)
+
+    def _rig(self):
+        # (scene, plane, camera) of the running session; raises if any of it is gone
+        rig = (bpy.data.scenes.get(self.names.get('scene', "")), bpy.data.objects.get(self.names.get('plane', "")),
+               bpy.data.objects.get(self.names.get('camera', "")))
+        if None in rig: raise RuntimeError("The lux measurement rig no longer exists (undo or file change).")
+        return rig
+
+    def measure(self, sensor_obj, tolerance=None, max_samples=LUX_SAMPLES):
+        """(raw lux, 95% confidence half-width in lux, samples used) at the sensor, or None if the render
+        produced no pixels. Batches with new seeds are rendered and accumulated; the noise of each
+        pixel comes from how its batch means scatter around its overall mean, so a smooth irradiance
+        gradient across the plane does not count as error. With a relative tolerance, sampling
+        continues until the standard error is within tolerance of the mean or max_samples is
+        reached; without, max_samples are rendered as two equal batches."""
+        temp_scene, temp_plane, temp_camera = self._rig()
+        sensor_matrix = sensor_obj.matrix_world
+        sensor_location = sensor_matrix.translation
+        plane_normal = sensor_matrix.to_3x3() @ mathutils.Vector((0.0, 0.0, 1.0)); plane_normal.normalize()
+        temp_plane.location = sensor_location
+        temp_plane.rotation_euler = sensor_obj.rotation_euler
+        temp_camera.location = sensor_location + plane_normal * 0.01
+        cycles = temp_scene.cycles
+        batch = max_samples // 2 if tolerance is None else min(LUX_ADAPTIVE_FIRST_SAMPLES, max_samples // 2)
+        weighted, weighted_sq, total, batches = 0.0, 0.0, 0, 0
+        while True:
+            cycles.samples, cycles.seed = batch, total
+            if self.hold_scene: bpy.ops.render.render(scene=temp_scene.name, write_still=False)
+            else:
+                window_scene, self.window.scene = self.window.scene, temp_scene
+                try: bpy.ops.render.render(scene=temp_scene.name, write_still=False)
+                finally: self.window.scene = window_scene
+            luminance = self.readback.read(bpy.data.images.get('Viewer Node'))
+            if luminance is None: return None
+            # A batch mean of n samples has variance sigma^2 / n, so batches are weighted by their sample count
+            luminance = luminance.astype(np.float64)
+            weighted = weighted + batch * luminance
+            weighted_sq = weighted_sq + batch * luminance * luminance
+            total += batch; batches += 1
+            if batches >= 2:
+                pixels = weighted / total
+                # Per-sample variance of each pixel between batches, pooled over the independent pixels
+                variance = np.maximum(weighted_sq - total * pixels * pixels, 0.0) / (batches - 1)
+                mean, error = float(pixels.mean()), math.sqrt(float(variance.mean()) / total / len(pixels))
+                if tolerance is None or error <= tolerance * mean or total >= max_samples: break
+            batch = min(total, max_samples - total)
+        return lux_from_luminance(mean), lux_from_luminance(LUX_CONFIDENCE_Z * error), total
+
+    def close(self):
+        # Restores the window scene and removes whatever of the rig still exists
+        _lux_sessions.discard(self)
+        if self.hold_scene and self.original_window_scene_name:
+            original_window_scene = bpy.data.scenes.get(self.original_window_scene_name)
+            if original_window_scene: self.window.scene = original_window_scene
+        self.original_window_scene_name = None
+        names, self.names = self.names, {}
+        for key, collection in (('plane', bpy.data.objects), ('camera', bpy.data.objects), ('mesh', bpy.data.meshes),
+                                ('camera_data', bpy.data.cameras), ('material', bpy.data.materials),
+                                ('compositor', bpy.data.node_groups), ('scene', bpy.data.scenes)):
+            data = collection.get(names.get(key, ""))
+            if data is not None: collection.remove(data, do_unlink=True)
         viewer_image = bpy.data.images.get('Viewer Node')
-        if viewer_image is None or not viewer_image.has_data: return None
-        temp_image = bpy.data.images.new("SA_Toolkit_Temp_Result", width=16, height=16, alpha=True, float_buffer=True)
-        temp_image.pixels[:] = viewer_image.pixels[:]
-        pixels = np.array(temp_image.pixels[:])
-        bpy.data.images.remove(temp_image)
-        if pixels.size == 0: return None
-        pixels = pixels.reshape((16, 16, 4)); rgb_pixels = pixels[:, :, :3]
-        luminance_values = 0.2126 * rgb_pixels[:, :, 0] + 0.7152 * rgb_pixels[:, :, 1] + 0.0722 * rgb_pixels[:, :, 2]
-        average_luminance = np.mean(luminance_values)
-        measured_lux = average_luminance * math.pi
-        
-        final_lux = measured_lux * 1.03
-        
+        if viewer_image and not self.had_viewer_image: bpy.data.images.remove(viewer_image)
+        self.had_viewer_image = True
+
+    def detach(self):
+        # The file is being replaced: its data and windows go with it, so nothing is removed
+        _lux_sessions.discard(self)
+        self.names, self.original_window_scene_name, self.had_viewer_image = {}, None, True
+
+def perform_lux_measurement(context, sensor_obj):
+    # Single measurement; measure several sensors within one LuxMeasurementSession
+    if not sensor_obj:
+        print("Sensor object not provided to measurement function.")
+        return None
+    try:
+        with LuxMeasurementSession(context) as session:
+            result = session.measure(sensor_obj)
+            return result[0] if result is not None else None
+    except RuntimeError as e:
+        print(f"Analysis Toolkit Error: {e}")
+        return None
+
+# Batched measurement: one probe mesh with a face per sensor, baked once. Diffuse direct +
+# indirect light without color is what a white diffuse surface reflects, i.e. what the
+# per-sensor render above measures, with every sensor's value in its own texel.
+
+def build_lux_probe_mesh(sensors, side):
+    """Mesh with a LUX_PROBE_SIZE square per sensor, facing the sensor's +Z, whose UVs cover
+    texel (i % side, i // side) of a side x side image"""
+    count = len(sensors)
+    matrices = np.array([np.array(sensor.matrix_world.normalized()) for sensor in sensors])
+    half = LUX_PROBE_SIZE * 0.5
+    corners = np.array([[-half, -half, 0.0], [half, -half, 0.0], [half, half, 0.0], [-half, half, 0.0]])
+    positions = matrices[:, None, :3, 3] + corners @ np.swapaxes(matrices[:, :3, :3], 1, 2)
+    cells = np.stack([np.arange(count) % side, np.arange(count) // side], axis=1)
+    uvs = (cells[:, None, :] + np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])) / side
+    mesh = bpy.data.meshes.new("Temp_luxmeter_Probes")
+    mesh.from_pydata(positions.reshape(-1, 3).tolist(), [], np.arange(count * 4).reshape(-1, 4).tolist())
+    mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", uvs.reshape(-1).astype(np.float32))
+    return mesh
+
+def perform_lux_measurements_baked(context, sensors):
+    """Measures all sensors with a single Cycles bake. Returns the raw lux of each sensor.
+    Any failure is raised as a RuntimeError after the window scene is restored and the
+    temporary data removed, so the caller can fall back to the renders"""
+    if not sensors: return []
+    original_scene = context.scene
+    original_window_scene = context.window.scene
+
+    side = math.ceil(math.sqrt(len(sensors)))
+    temp_scene, temp_mesh, temp_probe, temp_mat, temp_image = None, None, None, None, None
+    try:
+        temp_scene = new_lux_scene(original_scene)
+        context.window.scene = temp_scene
+        temp_mesh = build_lux_probe_mesh(sensors, side)
+        temp_probe = bpy.data.objects.new("Temp_luxmeter_Probes", temp_mesh)
+        temp_scene.collection.objects.link(temp_probe)
+        # The probes only receive light: they must not shadow or reflect onto each other
+        for attr in ('visible_diffuse', 'visible_glossy', 'visible_transmission', 'visible_volume_scatter', 'visible_shadow'):
+            setattr(temp_probe, attr, False)
+        temp_image = bpy.data.images.new("SA_Toolkit_Temp_Bake", width=side, height=side, alpha=False, float_buffer=True)
+        temp_mat = bpy.data.materials.new(name="Temp_White_Material"); temp_mat.use_nodes = True
+        nodes = temp_mat.node_tree.nodes; nodes.clear()
+        node_diffuse = nodes.new(type='ShaderNodeBsdfDiffuse'); node_diffuse.inputs['Color'].default_value = (1.0, 1.0, 1.0, 1)
+        node_output = nodes.new(type='ShaderNodeOutputMaterial')
+        temp_mat.node_tree.links.new(node_diffuse.outputs['BSDF'], node_output.inputs['Surface'])
+        node_image = nodes.new(type='ShaderNodeTexImage'); node_image.image = temp_image
+        nodes.active = node_image
+        temp_mesh.materials.append(temp_mat)
+
+        view_layer = temp_scene.view_layers[0]
+        for obj in list(view_layer.objects.selected): obj.select_set(False, view_layer=view_layer)
+        temp_probe.select_set(True, view_layer=view_layer)
+        view_layer.objects.active = temp_probe
+        temp_scene.render.engine = 'CYCLES'
+        temp_scene.cycles.samples = LUX_SAMPLES
+        temp_scene.render.bake.margin = 0
+        bpy.ops.object.bake(type='DIFFUSE', pass_filter={'DIRECT', 'INDIRECT'}, margin=0, use_clear=True, target='IMAGE_TEXTURES')
+
+        pixels = np.empty(side * side * 4, dtype=np.float32)
+        temp_image.pixels.foreach_get(pixels)
+        rgb = pixels.reshape(-1, 4)[:len(sensors), :3]
+        return [lux_from_luminance(value) for value in (rgb @ LUMINANCE_WEIGHTS).tolist()]
+    except Exception as e:
+        # Bake errors, missing node sockets and removed IDs all fall back to the renders
+        raise RuntimeError(f"Batched bake failed ({e})") from e
     finally:
-        original_scene.render.engine = original_engine
         if original_window_scene:
             context.window.scene = original_window_scene
-        if temp_plane: bpy.data.objects.remove(temp_plane, do_unlink=True)
-        if temp_camera: bpy.data.objects.remove(temp_camera, do_unlink=True)
+        if temp_probe: bpy.data.objects.remove(temp_probe, do_unlink=True)
+        if temp_mesh: bpy.data.meshes.remove(temp_mesh)
         if temp_mat: bpy.data.materials.remove(temp_mat)
-        if temp_comp_tree: bpy.data.node_groups.remove(temp_comp_tree, do_unlink=True)
+        if temp_image: bpy.data.images.remove(temp_image)
         if temp_scene: bpy.data.scenes.remove(temp_scene)
-    return final_lux
 
 def on_ev_compensation_change(self, context):
     props = context.scene.analysis_toolkit_props
@@ -151,12 +358,20 @@ def on_ev_compensation_change(self, context):
     for result in props.lux_meter_results:
         compensated_lux = result.raw_lux * (2**new_ev_comp)
         result.lux = compensated_lux
+        if result.raw_lux_error >= 0.0: result.lux_error = result.raw_lux_error * (2**new_ev_comp)
         lux_values.append(compensated_lux)
 
+    update_lux_statistics(props, lux_values)
+
+def update_lux_statistics(props, lux_values=None):
+    # Average/min/max of the results; -1 when there are none
+    if lux_values is None: lux_values = [result.lux for result in props.lux_meter_results]
     if lux_values:
         props.lux_meter_avg_lux = sum(lux_values) / len(lux_values)
         props.lux_meter_min_lux = min(lux_values)
         props.lux_meter_max_lux = max(lux_values)
+    else:
+        props.lux_meter_avg_lux = props.lux_meter_min_lux = props.lux_meter_max_lux = -1.0
 
 # --- Speedometer ---
 _speedo_cache = {}
@@ -317,32 +532,264 @@ def sutherland_hodgman_clipper_with_uvs(polygon_with_uvs, clip_rect):
     clipped = clip_against_edge(clipped, 1, False); clipped = clip_against_edge(clipped, 1, True)
     return clipped
 
-def calculate_texel_density(context):
-    if not hasattr(context.scene, 'analysis_toolkit_props'): return "Properties not found."
-    props = context.scene.analysis_toolkit_props.texel_density_calculator
-    obj = props.target_object
-    cam = context.scene.camera
-    scene = context.scene
+def extract_mesh_arrays(mesh, require_uvs=True):
+    # Without require_uvs, a mesh without UV map gets zero UVs (for projector UVs)
+    uv_layer = mesh.uv_layers.active
+    if not uv_layer and require_uvs: return None
+    n_verts, n_loops, n_faces = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+    positions = np.empty(n_verts * 3, dtype=np.float32); mesh.vertices.foreach_get("co", positions)
+    loop_verts = np.empty(n_loops, dtype=np.int32); mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_start = np.empty(n_faces, dtype=np.int32); mesh.polygons.foreach_get("loop_start", loop_start)
+    loop_total = np.empty(n_faces, dtype=np.int32); mesh.polygons.foreach_get("loop_total", loop_total)
+    normals = np.empty(n_faces * 3, dtype=np.float32); mesh.polygons.foreach_get("normal", normals)
+    material_index = np.empty(n_faces, dtype=np.int32); mesh.polygons.foreach_get("material_index", material_index)
+    uvs = np.zeros(n_loops * 2, dtype=np.float32)
+    if uv_layer: uv_layer.data.foreach_get("uv", uvs)
+    mesh.calc_loop_triangles()
+    n_tris = len(mesh.loop_triangles)
+    tri_loops = np.empty(n_tris * 3, dtype=np.int32); mesh.loop_triangles.foreach_get("loops", tri_loops)
+    tri_polys = np.empty(n_tris, dtype=np.int32); mesh.loop_triangles.foreach_get("polygon_index", tri_polys)
+    return texel_engine.MeshArrays(
+        positions.reshape(-1, 3).astype(np.float64), loop_verts, loop_start, loop_total,
+        uvs.reshape(-1, 2).astype(np.float64), normals.reshape(-1, 3).astype(np.float64),
+        tri_loops.reshape(-1, 3), tri_polys, material_index=material_index)
+
+def extract_object_arrays(eval_obj, require_uvs=True):
+    mesh = eval_obj.to_mesh()
+    try: return extract_mesh_arrays(mesh, require_uvs)
+    finally: eval_obj.to_mesh_clear()
+
+# Static mesh arrays per (mesh name, object name if it has modifiers), so camera and
+# transform changes only re-run the projection. Entries are dropped by on_texel_depsgraph_update.
+_texel_arrays_cache = {}
+
+def texel_cache_key(obj):
+    return (obj.data.name_full, obj.name_full if obj.modifiers else None)
+
+def get_cached_object_arrays(obj, eval_obj, require_uvs=True):
+    key = texel_cache_key(obj)
+    arrays = _texel_arrays_cache.get(key)
+    if arrays is None:
+        arrays = extract_object_arrays(eval_obj, require_uvs)
+        if arrays is not None: _texel_arrays_cache[key] = arrays
+    return arrays
+
+# --- Texel Density Projector ---
+# A second camera whose frame defines the texture space (camera projection / matte painting).
+# The projected arrays are kept for the last (mesh arrays, positions, projector matrix), so
+# frames where the projector and the object did not move reuse them.
+_texel_projector_cache = {}
+
+def uses_projector(props):
+    return props.target_mode == 'OBJECT' and props.uv_source == 'PROJECTOR'
+
+def has_texel_uvs(props, obj):
+    # UV map or projector camera, depending on the UV source
+    if uses_projector(props): return props.projector_camera is not None
+    return bool(obj.data.uv_layers)
+
+def texel_projector_arrays(scene, projector, eval_obj, arrays):
+    matrix = (camera_projection_matrix(scene, projector) @ np.array(eval_obj.matrix_world)).tobytes()
+    cache = _texel_projector_cache
+    if cache.get('arrays') is not arrays or cache.get('positions') is not arrays.positions or cache.get('matrix') != matrix:
+        projected = texel_engine.projector_arrays(arrays, np.frombuffer(matrix).reshape(4, 4), render_resolution(scene))
+        cache.update(arrays=arrays, positions=arrays.positions, matrix=matrix, projected=projected)
+    return cache['projected']
+
+def get_texel_object_arrays(scene, props, obj, eval_obj):
+    """Mesh arrays of a single target; in projector mode the UVs are the projector's frame coordinates"""
+    if not uses_projector(props): return get_cached_object_arrays(obj, eval_obj)
+    arrays = get_cached_object_arrays(obj, eval_obj, require_uvs=False)
+    return texel_projector_arrays(scene, props.projector_camera, eval_obj, arrays) if arrays is not None else None
+
+def invalidate_texel_cache(id_data):
+    if isinstance(id_data, bpy.types.Object):
+        names = {id_data.name_full}
+        if id_data.data: names.add(id_data.data.name_full)
+    else:
+        names = {id_data.name_full}
+    for cache in (_texel_arrays_cache, _texel_occluder_cache):
+        for key in [key for key in cache if key[0] in names or key[1] in names]:
+            del cache[key]
+
+# Modifiers whose result depends on the frame even without animated settings
+TIME_DEPENDENT_MODIFIERS = {'BUILD', 'OCEAN', 'EXPLODE', 'PARTICLE_SYSTEM', 'PARTICLE_INSTANCE', 'MESH_SEQUENCE_CACHE', 'FLUID', 'DYNAMIC_PAINT'}
+# Geometry Nodes that read the frame or other objects
+TIME_DEPENDENT_NODES = {'GeometryNodeInputSceneTime', 'GeometryNodeSimulationInput', 'GeometryNodeObjectInfo',
+                        'GeometryNodeCollectionInfo', 'GeometryNodeSelfObject', 'GeometryNodeInputActiveCamera'}
+
+def animation_curves(id_data):
+    # F-Curves of the ID's active action (legacy or layered) and its drivers
+    anim = getattr(id_data, 'animation_data', None)
+    if anim is None: return []
+    curves = list(anim.drivers)
+    action = anim.action
+    if action is None: return curves
+    if getattr(action, 'layers', None):
+        # Layered actions (Blender 4.4+): only the channels of the ID's slot
+        slot = getattr(anim, 'action_slot', None)
+        for layer in action.layers:
+            for strip in layer.strips:
+                channelbag = strip.channelbag(slot) if slot is not None else None
+                if channelbag is not None: curves.extend(channelbag.fcurves)
+    elif hasattr(action, 'fcurves'): curves.extend(action.fcurves)
+    return curves
+
+def is_animated(id_data, path_prefix=""):
+    return any(curve.data_path.startswith(path_prefix) for curve in animation_curves(id_data))
+
+def node_tree_is_time_dependent(tree, visited=None):
+    # Animated node values, or nodes (also in nested groups) that follow the frame or other objects
+    visited = set() if visited is None else visited
+    if tree is None or tree.name_full in visited: return False
+    visited.add(tree.name_full)
+    if is_animated(tree): return True
+    for node in tree.nodes:
+        if node.bl_idname in TIME_DEPENDENT_NODES: return True
+        if getattr(node, 'node_tree', None) is not None and node_tree_is_time_dependent(node.node_tree, visited): return True
+    return False
+
+def modifier_is_time_dependent(mod):
+    if mod.type in TIME_DEPENDENT_MODIFIERS: return True
+    # A referenced object can move (a Boolean cutter, an Array offset object...)
+    for prop in mod.bl_rna.properties:
+        if prop.type == 'POINTER' and prop.fixed_type.identifier in {'Object', 'Collection'} and getattr(mod, prop.identifier) is not None: return True
+    if mod.type == 'NODES':
+        if any(isinstance(mod[key], (bpy.types.Object, bpy.types.Collection)) for key in mod.keys()): return True
+        return node_tree_is_time_dependent(mod.node_group)
+    return False
+
+def has_animated_geometry(scene, obj):
+    """True if the evaluated geometry can change from frame to frame: deform modifiers, shape keys,
+    animated or driven modifier settings, and modifiers that follow the frame or other objects
+    (see modifier_is_time_dependent). Static generators such as Subdivision or Bevel do not count."""
+    if obj.is_deform_modified(scene, 'PREVIEW') or obj.data.shape_keys is not None: return True
+    if not obj.modifiers: return False
+    if is_animated(obj, 'modifiers['): return True
+    return any(modifier_is_time_dependent(mod) for mod in obj.modifiers)
+
+def update_deformed_positions(arrays, eval_obj):
+    # Re-reads positions and normals only; returns False if the topology changed
+    mesh = eval_obj.to_mesh()
+    try:
+        if (len(mesh.vertices) != len(arrays.positions) or len(mesh.polygons) != arrays.face_count
+                or len(mesh.loops) != len(arrays.loop_verts)): return False
+        positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32); mesh.vertices.foreach_get("co", positions)
+        normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32); mesh.polygons.foreach_get("normal", normals)
+    finally: eval_obj.to_mesh_clear()
+    positions = positions.reshape(-1, 3).astype(np.float64)
+    if not np.array_equal(positions, arrays.positions):
+        arrays.positions = positions
+        arrays.normals = normals.reshape(-1, 3).astype(np.float64)
+    return True
+
+def render_resolution(scene):
+    # Output size in pixels, including the resolution percentage
     render = scene.render
+    return render.resolution_x * render.resolution_percentage // 100, render.resolution_y * render.resolution_percentage // 100
 
-    if not all([obj, cam, obj.data.uv_layers]): return "Prerequisites not met."
+def camera_projection_matrix(scene, cam):
+    # World -> (X, Y, depth, W) in render pixels, equivalent to world_to_camera_view * resolution
+    res_x, res_y = render_resolution(scene)
+    frame = cam.data.view_frame(scene=scene)
+    min_x, max_x = frame[2].x, frame[1].x
+    min_y, max_y = frame[1].y, frame[0].y
+    sx = res_x / (max_x - min_x)
+    sy = res_y / (max_y - min_y)
+    if cam.data.type == 'ORTHO':
+        proj = np.array([[sx, 0.0, 0.0, -min_x * sx], [0.0, sy, 0.0, -min_y * sy], [0.0, 0.0, -1.0, 0.0], [0.0, 0.0, 0.0, 1.0]])
+    else:
+        d = -frame[0].z
+        proj = np.array([[d * sx, 0.0, min_x * sx, 0.0], [0.0, d * sy, min_y * sy, 0.0], [0.0, 0.0, -1.0, 0.0], [0.0, 0.0, -1.0, 0.0]])
+    return proj @ np.array(cam.matrix_world.normalized().inverted())
 
-    depsgraph = context.evaluated_depsgraph_get()
-    eval_obj = obj.evaluated_get(depsgraph)
+def camera_view_direction(cam):
+    return np.array(cam.matrix_world.to_quaternion() @ Vector((0.0, 0.0, -1.0)))
+
+def is_anisotropic(props):
+    # Max Axis mode: ratios are the squared density along the most stretched direction
+    return props.density_mode == 'ANISOTROPIC'
+
+def texel_numpy_job(context, props, cam, obj, eval_obj, arrays):
+    """Main-thread part of the single-object NumPy path: reads everything from bpy and returns
+    work(cull_stats) -> (density ratios, screen areas) per face. The work only uses NumPy, so
+    it can run on a worker thread (see submit_texel_job). work(cull_stats, progressive=True) returns a
+    texel_engine.ProgressiveDensity to be evaluated in slices instead (see start_texel_progressive)."""
+    scene = context.scene
+    cam_matrix = camera_projection_matrix(scene, cam)
+    world = np.array(eval_obj.matrix_world)
+    matrix = cam_matrix @ world
+    view_dir, resolution, anisotropic = camera_view_direction(cam), render_resolution(scene), is_anisotropic(props)
+    occluders = texel_occluder_meshes(context, props, cam_matrix, {obj.name_full}) if props.use_occlusion else None
+    occlusion_scale, analyze_islands = props.occlusion_scale, props.analyze_islands
+
+    def work(cull_stats=None, progressive=False):
+        face_mask = None
+        if occluders is not None:
+            meshes = occluders + [(arrays.positions, matrix, arrays.loop_verts[arrays.tri_loops])]
+            face_mask = texel_engine.DepthBuffer.build(resolution, occlusion_scale, meshes).visible_faces(arrays, matrix)
+        if progressive: return texel_engine.ProgressiveDensity(arrays, matrix, view_dir, resolution, face_mask, cull_stats, anisotropic, world=world)
+        result = texel_engine.face_density(arrays, matrix, view_dir, resolution, face_mask, cull_stats, anisotropic=anisotropic, world=world)
+        if analyze_islands: arrays.islands # Cached on the arrays for texel_island_data
+        return result
+    return work
+
+def texel_density_numpy(context, props, cam, obj, eval_obj, arrays, cull_stats=None):
+    # Per-face (density ratios, screen areas)
+    return texel_numpy_job(context, props, cam, obj, eval_obj, arrays)(cull_stats)
+
+def texel_density_streaming(context, props, cam, eval_obj, cull_stats=None):
+    """Bounded-memory variant for very large meshes: reads the evaluated mesh and its loop triangles
+    once into compact float32/int32 buffers (no cached arrays) and folds fixed-size face chunks into
+    a DensityAccumulator. Returns the accumulator, or None without a UV map"""
+    scene = context.scene
     mesh = eval_obj.to_mesh()
+    try:
+        uv_layer = mesh.uv_layers.active
+        if not uv_layer: return None
+        n_verts, n_loops, n_faces = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+        positions = np.empty(n_verts * 3, dtype=np.float32); mesh.vertices.foreach_get("co", positions)
+        loop_verts = np.empty(n_loops, dtype=np.int32); mesh.loops.foreach_get("vertex_index", loop_verts)
+        loop_start = np.empty(n_faces, dtype=np.int32); mesh.polygons.foreach_get("loop_start", loop_start)
+        loop_total = np.empty(n_faces, dtype=np.int32); mesh.polygons.foreach_get("loop_total", loop_total)
+        normals = np.empty(n_faces * 3, dtype=np.float32); mesh.polygons.foreach_get("normal", normals)
+        uvs = np.empty(n_loops * 2, dtype=np.float32); uv_layer.data.foreach_get("uv", uvs)
+        mesh.calc_loop_triangles()
+        n_tris = len(mesh.loop_triangles)
+        tri_loops = np.empty(n_tris * 3, dtype=np.int32); mesh.loop_triangles.foreach_get("loops", tri_loops)
+        tri_polys = np.empty(n_tris, dtype=np.int32); mesh.loop_triangles.foreach_get("polygon_index", tri_polys)
+    finally: eval_obj.to_mesh_clear()
+    world = np.array(eval_obj.matrix_world)
+    matrix = camera_projection_matrix(scene, cam) @ world
+    return texel_engine.stream_face_density(
+        positions.reshape(-1, 3), loop_verts, loop_start, loop_total, uvs.reshape(-1, 2), normals.reshape(-1, 3),
+        matrix, camera_view_direction(cam), render_resolution(scene), texel_engine.DensityAccumulator(), cull_stats=cull_stats,
+        anisotropic=is_anisotropic(props), world=world, tri_loops=tri_loops.reshape(-1, 3), tri_polys=tri_polys)
 
+def texel_geometry_key(scene, cam, obj, eval_obj, props, arrays):
+    """Everything the per-face pass depends on: mesh arrays (replaced when the geometry changes),
+    object matrix, camera projection (transform, lens, sensor, shift) and resolution.
+    None with occlusion, since other objects can move independently."""
+    if props.use_occlusion: return None
+    return (obj.name_full, arrays, np.array(eval_obj.matrix_world).tobytes(),
+            camera_projection_matrix(scene, cam).tobytes(), render_resolution(scene), props.analyze_islands, props.analyze_textures, props.density_mode)
+
+def texel_density_bmesh(scene, cam, eval_obj, mesh):
+    # Reference implementation (per-face Python loop)
+    res_x, res_y = render_resolution(scene)
     bm = bmesh.new(); bm.from_mesh(mesh)
     uv_layer = bm.loops.layers.uv.active
     
     if not uv_layer:
-        eval_obj.to_mesh_clear(); bm.free()
-        return "Active UV layer not found."
+        bm.free()
+        return None
 
     max_density_ratio = 0.0
-    clip_rect = (0, render.resolution_x, 0, render.resolution_y)
+    clip_rect = (0, res_x, 0, res_y)
+    # Normals are local: test them against the view direction in object space, like the NumPy engines
+    cam_direction = Vector(texel_engine.local_view_direction(camera_view_direction(cam), np.array(eval_obj.matrix_world)))
 
     for face in bm.faces:
-        cam_direction = cam.matrix_world.to_quaternion() @ Vector((0.0, 0.0, -1.0))
         if face.normal.dot(cam_direction) > 0: continue
         
         world_coords = [eval_obj.matrix_world @ loop.vert.co for loop in face.loops]
@@ -354,7 +801,7 @@ def calculate_texel_density(context):
         poly_with_uvs = []
         for i in range(len(screen_coords_3d)):
             p = screen_coords_3d[i]; uv = uv_coords[i]
-            poly_with_uvs.append((p.x * render.resolution_x, p.y * render.resolution_y, uv.x, uv.y))
+            poly_with_uvs.append((p.x * res_x, p.y * res_y, uv.x, uv.y))
         
         clipped_poly_with_uvs = sutherland_hodgman_clipper_with_uvs(poly_with_uvs, clip_rect)
         if len(clipped_poly_with_uvs) < 3: continue
@@ -370,20 +817,367 @@ def calculate_texel_density(context):
         current_density_ratio = screen_area_px / uv_area
         if current_density_ratio > max_density_ratio: max_density_ratio = current_density_ratio
 
-    eval_obj.to_mesh_clear(); bm.free()
+    bm.free()
+    return max_density_ratio
+
+def calculate_texel_density(context):
+    """Returns 'SUCCESS', 'RUNNING' (a background job will apply the result) or an error message"""
+    if not hasattr(context.scene, 'analysis_toolkit_props'): return "Properties not found."
+    props = context.scene.analysis_toolkit_props.texel_density_calculator
+    if props.target_mode != 'OBJECT' or is_multi_camera(props): cancel_texel_job()
+    if props.target_mode != 'OBJECT': return calculate_texel_density_multi(context)
+    if is_multi_camera(props): return calculate_texel_density_cameras(context)
+    obj = props.target_object
+    cam = context.scene.camera
+    scene = context.scene
+
+    if not obj or not cam or not has_texel_uvs(props, obj): return "Prerequisites not met."
+
+    depsgraph = context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    # A new calculation supersedes a pending background job
+    cancel_texel_job()
+    # Projector UVs only exist as arrays, so projector mode always takes the NumPy path
+    engine = 'NUMPY' if uses_projector(props) else props.engine
+    if engine == 'BMESH':
+        mesh = eval_obj.to_mesh()
+        try: max_density_ratio = texel_density_bmesh(scene, cam, eval_obj, mesh)
+        finally: eval_obj.to_mesh_clear()
+        if max_density_ratio is None: return "Active UV layer not found."
+        clear_texel_statistics(props)
+    elif engine == 'STREAMING':
+        cull_stats = {}
+        accumulator = texel_density_streaming(context, props, cam, eval_obj, cull_stats)
+        if accumulator is None: return "Active UV layer not found."
+        # The histogram bins stand in for the faces: no UDIM tiles, islands or materials
+        store_texel_statistics(*accumulator.samples(), None)
+        apply_texel_cull_stats(props, cull_stats)
+        max_density_ratio = apply_texel_density_statistics(props)
+    else:
+        arrays = get_texel_object_arrays(scene, props, obj, eval_obj)
+        if arrays is None: return "Active UV layer not found."
+        key = texel_geometry_key(scene, cam, obj, eval_obj, props, arrays)
+        if key is None or _texel_stats_cache.get('key') != key:
+            work = texel_numpy_job(context, props, cam, obj, eval_obj, arrays)
+            materials = texel_material_data(props, [(slot_materials(obj), arrays, None)])
+            cull_stats = {}
+
+            def finish(scene, result):
+                props = scene.analysis_toolkit_props.texel_density_calculator
+                ratios, areas = result
+                store_texel_statistics(ratios, areas, arrays.tiles, key=key, islands=texel_island_data(scene, props, arrays), materials=materials)
+                apply_texel_cull_stats(props, cull_stats)
+                apply_texel_density_result(props, apply_texel_density_statistics(props))
+                props.result_peak_frame = -1
+
+            if props.use_progressive:
+                start_texel_progressive(scene, work(cull_stats, progressive=True), finish)
+                return 'RUNNING' if is_texel_progressive_running() else 'SUCCESS'
+            if props.use_background:
+                submit_texel_job(scene, lambda: work(cull_stats), finish)
+                return 'RUNNING'
+            finish(scene, work(cull_stats))
+            return 'SUCCESS'
+        # Unchanged inputs only re-derive the statistics
+        max_density_ratio = apply_texel_density_statistics(props)
+
+    apply_texel_density_result(props, max_density_ratio)
+    props.result_peak_frame = -1
+    return 'SUCCESS'
+
+def calculate_texel_density_range(context):
+    """Peak required resolution over props.range_start_frame..range_end_frame.
+    Returns (status, evaluated frame count, skipped frame count)"""
+    if not hasattr(context.scene, 'analysis_toolkit_props'): return "Properties not found.", 0, 0
+    scene = context.scene
+    props = scene.analysis_toolkit_props.texel_density_calculator
+    obj = props.target_object
+    if not obj or not scene.camera or not has_texel_uvs(props, obj): return "Prerequisites not met.", 0, 0
+    frame_start, frame_end = props.range_start_frame, props.range_end_frame
+    if frame_end < frame_start: return "Invalid frame range.", 0, 0
+    cancel_texel_job()
+
+    resolution = render_resolution(scene)
+    # Rigid objects only need new matrices per frame; animated ones re-read positions, or
+    # everything once the evaluated topology changes
+    deforming = has_animated_geometry(scene, obj)
+    original_frame = scene.frame_current
+    projector = props.projector_camera if uses_projector(props) else None
+    arrays = None
+    last_matrix, last_positions, last_uvs = None, None, None
+    max_density_ratio, peak_frame = 0.0, -1
+    evaluated, skipped = 0, 0
+    # Worst case of every face over the range, for the statistics (topology changes start a new run)
+    face_max, face_areas, runs, run_arrays = None, None, [], []
+    cull_stats = {}
+    try:
+        for frame in range(frame_start, frame_end + 1):
+            scene.frame_set(frame)
+            cam = scene.camera
+            if not cam: continue
+            eval_obj = obj.evaluated_get(context.evaluated_depsgraph_get())
+            if arrays is None and not deforming:
+                arrays = get_cached_object_arrays(obj, eval_obj, require_uvs=projector is None)
+                if arrays is None: return "Active UV layer not found.", evaluated, skipped
+            elif deforming and (arrays is None or not update_deformed_positions(arrays, eval_obj)):
+                arrays = extract_object_arrays(eval_obj, require_uvs=projector is None)
+                if arrays is None: return "Active UV layer not found.", evaluated, skipped
+                last_matrix = None
+            # One batched projection per frame, reused while the projector and the object are still
+            target = texel_projector_arrays(scene, projector, eval_obj, arrays) if projector else arrays
+
+            cam_matrix = camera_projection_matrix(scene, cam)
+            world = np.array(eval_obj.matrix_world)
+            matrix = cam_matrix @ world
+            # With occlusion, other objects may move while the target and camera are still
+            if (not props.use_occlusion and last_matrix is not None and np.array_equal(matrix, last_matrix)
+                    and arrays.positions is last_positions and target.uvs is last_uvs):
+                skipped += 1
+                continue
+            last_matrix, last_positions, last_uvs = matrix, arrays.positions, target.uvs
+
+            face_mask = texel_occlusion_masks(context, props, cam_matrix, [(obj, arrays, matrix)])[0] if props.use_occlusion else None
+            ratios, areas = texel_engine.face_density(target, matrix, camera_view_direction(cam), resolution, face_mask, cull_stats, anisotropic=is_anisotropic(props), world=world)
+            evaluated += 1
+            frame_max = float(ratios.max()) if len(ratios) else 0.0
+            if frame_max > max_density_ratio: max_density_ratio, peak_frame = frame_max, frame
+            if face_max is None or len(face_max) != len(ratios):
+                face_max, face_areas = ratios.copy(), areas.copy()
+                runs.append((face_max, face_areas, target.tiles))
+                run_arrays.append(target)
+            else:
+                higher = ratios > face_max
+                face_max[higher] = ratios[higher]; face_areas[higher] = areas[higher]
+    finally:
+        scene.frame_set(original_frame)
+
+    if runs:
+        # Islands need one topology over the whole range
+        islands = texel_island_data(scene, props, run_arrays[0]) if len(runs) == 1 else None
+        store_texel_statistics(*(np.concatenate(run) for run in zip(*runs)), islands=islands,
+                               materials=texel_material_data(props, [(slot_materials(obj), run, None) for run in run_arrays]))
+        max_density_ratio = apply_texel_density_statistics(props)
+    apply_texel_density_result(props, max_density_ratio)
+    apply_texel_cull_stats(props, cull_stats)
+    props.result_peak_frame = peak_frame
+    return 'SUCCESS', evaluated, skipped
+
+def get_target_objects(context, props):
+    if props.target_mode == 'COLLECTION': return list(props.target_collection.all_objects) if props.target_collection else []
+    if props.target_mode == 'SELECTION': return list(context.selected_objects)
+    return [props.target_object] if props.target_object else []
+
+def get_texel_density_targets(context, props):
+    objects = get_target_objects(context, props)
+    # Instancers of any type are resolved through the depsgraph (see calculate_texel_density_instances)
+    if props.use_instances and props.target_mode != 'OBJECT': return list(objects)
+    return [obj for obj in objects if obj.type == 'MESH' and obj.data.uv_layers]
+
+def calculate_texel_density_multi(context):
+    scene = context.scene
+    props = scene.analysis_toolkit_props.texel_density_calculator
+    if props.use_instances: return calculate_texel_density_instances(context)
+    cam = scene.camera
+    targets = get_texel_density_targets(context, props)
+    if not cam or not targets: return "Prerequisites not met."
+
+    # Main thread: extract arrays once per evaluated mesh
+    depsgraph = context.evaluated_depsgraph_get()
+    cam_matrix = camera_projection_matrix(scene, cam)
+    resolution = render_resolution(scene)
+    cull_stats = {}
+    objects, jobs, worlds, culled = [], [], [], []
+    for obj in targets:
+        eval_obj = obj.evaluated_get(depsgraph)
+        world = np.array(eval_obj.matrix_world)
+        matrix = cam_matrix @ world
+        # Object level on the evaluated bounds, so objects outside the frustum are never extracted
+        bounds = np.array(eval_obj.bound_box)
+        if texel_engine.boxes_outside(bounds.min(axis=0)[None], bounds.max(axis=0)[None], matrix, resolution)[0]:
+            face_count = len(eval_obj.data.polygons)
+            texel_engine.add_cull_stats(cull_stats, face_count, objects=face_count)
+            culled.append((obj.name, face_count))
+            continue
+        arrays = get_cached_object_arrays(obj, eval_obj)
+        if arrays is None: continue
+        objects.append(obj)
+        jobs.append((arrays, matrix))
+        worlds.append(world)
+    if not jobs and not culled: return "Active UV layer not found."
+    names = [obj.name for obj in objects]
+    face_masks = None
+    if props.use_occlusion and jobs:
+        face_masks = texel_occlusion_masks(context, props, cam_matrix, [(obj, arrays, matrix) for obj, (arrays, matrix) in zip(objects, jobs)])
+
+    pool_warnings = []
+    results = texel_engine.face_densities(jobs, camera_view_direction(cam), resolution, use_pool=props.use_process_pool, face_masks=face_masks, cull_stats=cull_stats,
+                                         anisotropic=is_anisotropic(props), warnings=pool_warnings, worlds=worlds)
+
+    # Main thread: write back (per-object results are rebuilt from the statistics)
+    face_counts = [arrays.face_count for arrays, _matrix in jobs]
+    store_texel_statistics(
+        np.concatenate([np.zeros(0)] + [ratios for ratios, _areas in results]),
+        np.concatenate([np.zeros(0)] + [areas for _ratios, areas in results]),
+        np.concatenate([np.zeros((0, 2), dtype=np.int64)] + [arrays.tiles for arrays, _matrix in jobs]),
+        np.repeat(np.arange(len(jobs)), face_counts),
+        list(zip(names, face_counts)) + culled,
+        materials=texel_material_data(props, [(slot_materials(obj), arrays, None) for obj, (arrays, _matrix) in zip(objects, jobs)]))
+    apply_texel_density_result(props, apply_texel_density_statistics(props))
+    apply_texel_cull_stats(props, cull_stats)
+    props.result_peak_frame = -1
+    # The result is complete; the warning only tells that the pool could not be used
+    return "Process pool unavailable; objects were evaluated in-process." if pool_warnings else 'SUCCESS'
+
+def get_instance_arrays(depsgraph, obj):
+    # Instances of a real mesh object share its evaluated mesh and use the persistent cache;
+    # geometry generated by an instancer (e.g. geometry nodes) is read directly
+    original = obj.original
+    if original.type == 'MESH':
+        eval_obj = original.evaluated_get(depsgraph)
+        if eval_obj.data.as_pointer() == obj.data.as_pointer(): return get_cached_object_arrays(original, eval_obj)
+    return extract_mesh_arrays(obj.data)
+
+def calculate_texel_density_instances(context):
+    """Collection / Selection mode including instances (collection instances, particles, geometry
+    nodes). Mesh arrays are extracted once per unique mesh and all instance matrices of that mesh are
+    projected in batches, so many instances of one mesh cost one extraction"""
+    scene = context.scene
+    props = scene.analysis_toolkit_props.texel_density_calculator
+    cam = scene.camera
+    owners = {obj.name_full for obj in get_texel_density_targets(context, props)}
+    if not cam or not owners: return "Prerequisites not met."
+
+    # Group the instance matrices by evaluated mesh; instance items are only valid during iteration
+    depsgraph = context.evaluated_depsgraph_get()
+    meshes = {}
+    for instance in depsgraph.object_instances:
+        obj = instance.object
+        if obj.type != 'MESH': continue
+        owner = instance.parent if instance.is_instance else obj
+        if owner is None or owner.original.name_full not in owners: continue
+        entry = meshes.get(obj.data.as_pointer())
+        if entry is None:
+            arrays = get_instance_arrays(depsgraph, obj) if obj.data.uv_layers else None
+            entry = meshes[obj.data.as_pointer()] = (obj.name, arrays, slot_materials(obj), [])
+        if entry[1] is not None: entry[3].append(np.array(instance.matrix_world))
+    meshes = [entry for entry in meshes.values() if entry[1] is not None and entry[3]]
+    if not meshes: return "Active UV layer not found."
+
+    cam_matrix = camera_projection_matrix(scene, cam)
+    view_dir = camera_view_direction(cam)
+    resolution = render_resolution(scene)
+    meshes = [(name, arrays, materials, np.array(worlds), cam_matrix @ np.array(worlds)) for name, arrays, materials, worlds in meshes]
+    depth_buffer = None
+    if props.use_occlusion:
+        # Only instances that can reach the frame are rasterized
+        targets = []
+        for _name, arrays, _materials, _worlds, matrices in meshes:
+            order, starts, chunk_min, chunk_max = arrays.chunks
+            outside = texel_engine.boxes_outside(chunk_min.min(axis=0)[None], chunk_max.max(axis=0)[None], matrices, resolution)
+            targets += [(arrays, matrix) for matrix in matrices[~outside]]
+        depth_buffer = texel_depth_buffer(context, props, cam_matrix, targets, owners)
+
+    cull_stats = {}
+    ratios, areas, tiles, groups, objects, material_targets = [], [], [], [], [], []
+    for name, arrays, materials, worlds, matrices in meshes:
+        view_dirs = np.broadcast_to(view_dir, (len(worlds), 3))
+        face_masks = None
+        if depth_buffer is not None:
+            face_masks = lambda index, arrays=arrays, matrices=matrices: depth_buffer.visible_faces(arrays, matrices[index])
+        mesh_faces = []
+        for _index, faces, face_ratios, face_areas in texel_engine.instance_face_densities(arrays, matrices, view_dirs, resolution, face_masks, cull_stats, is_anisotropic(props), worlds):
+            ratios.append(face_ratios); areas.append(face_areas); mesh_faces.append(faces)
+        faces = np.concatenate([np.zeros(0, dtype=np.int64)] + mesh_faces)
+        tiles.append(arrays.tiles[faces])
+        groups.append(np.full(len(faces), len(objects)))
+        objects.append((f"{name} ×{len(worlds)}" if len(worlds) > 1 else name, arrays.face_count))
+        material_targets.append((materials, arrays, faces))
 
+    store_texel_statistics(
+        np.concatenate([np.zeros(0)] + ratios), np.concatenate([np.zeros(0)] + areas),
+        np.concatenate([np.zeros((0, 2), dtype=np.int64)] + tiles), np.concatenate(groups), objects,
+        materials=texel_material_data(props, material_targets))
+    apply_texel_density_result(props, apply_texel_density_statistics(props))
+    apply_texel_cull_stats(props, cull_stats)
+    props.result_peak_frame = -1
+    return 'SUCCESS'
+
+def is_multi_camera(props):
+    # Several cameras are only evaluated for one object at the current frame; Frame Range mode
+    # already follows camera markers through scene.camera
+    return props.target_mode == 'OBJECT' and props.calc_mode == 'CURRENT' and props.camera_source != 'ACTIVE'
+
+def get_texel_density_cameras(context, props):
+    if props.camera_source == 'COLLECTION':
+        objects = props.camera_collection.all_objects if props.camera_collection else []
+    elif props.camera_source == 'MARKERS':
+        objects = [marker.camera for marker in sorted(context.scene.timeline_markers, key=lambda marker: marker.frame) if marker.camera]
+    else:
+        objects = [context.scene.camera] if context.scene.camera else []
+    cameras = []
+    for obj in objects:
+        if obj.type == 'CAMERA' and obj not in cameras: cameras.append(obj)
+    return cameras
+
+def texel_camera_densities(context, props, obj, eval_obj, arrays, cameras, cull_stats=None):
+    # Per-face (density ratios, screen areas) for every camera, from one batched projection
+    scene = context.scene
+    world = np.array(eval_obj.matrix_world)
+    cam_matrices = [camera_projection_matrix(scene, cam) for cam in cameras]
+    matrices = np.array([cam_matrix @ world for cam_matrix in cam_matrices])
+    face_masks = None
+    if props.use_occlusion:
+        face_masks = [texel_occlusion_masks(context, props, cam_matrix, [(obj, arrays, matrix)])[0] for cam_matrix, matrix in zip(cam_matrices, matrices)]
+    return texel_engine.camera_face_densities(arrays, matrices, [camera_view_direction(cam) for cam in cameras], render_resolution(scene), face_masks, cull_stats, is_anisotropic(props),
+                                              [world] * len(cameras))
+
+def calculate_texel_density_cameras(context):
+    scene = context.scene
+    props = scene.analysis_toolkit_props.texel_density_calculator
+    obj = props.target_object
+    cameras = get_texel_density_cameras(context, props)
+    if not obj or not cameras or not has_texel_uvs(props, obj): return "Prerequisites not met."
+
+    eval_obj = obj.evaluated_get(context.evaluated_depsgraph_get())
+    arrays = get_texel_object_arrays(scene, props, obj, eval_obj)
+    if arrays is None: return "Active UV layer not found."
+    cull_stats = {}
+    results = texel_camera_densities(context, props, obj, eval_obj, arrays, cameras, cull_stats)
+
+    # Overall statistics cover the screen area seen by all cameras; the per-camera table
+    # lists the faces each camera sees
+    store_texel_statistics(
+        np.concatenate([ratios for ratios, _areas in results]),
+        np.concatenate([areas for _ratios, areas in results]),
+        np.tile(arrays.tiles, (len(cameras), 1)),
+        np.repeat(np.arange(len(cameras)), arrays.face_count),
+        [(cam.name, int(np.count_nonzero(ratios))) for cam, (ratios, _areas) in zip(cameras, results)],
+        results_collection='camera_results', islands=texel_island_data(scene, props, arrays, len(cameras)),
+        materials=texel_material_data(props, [(slot_materials(obj), arrays, np.tile(np.arange(arrays.face_count), len(cameras)))]))
+    apply_texel_density_result(props, apply_texel_density_statistics(props))
+    apply_texel_cull_stats(props, cull_stats)
+    props.result_peak_frame = -1
+    return 'SUCCESS'
+
+def required_texel_resolution(density_ratio, pixel_ratio_percentage):
+    # Returns (effective resolution, power-of-two resolution)
+    if density_ratio <= 0: return 0.0, 0
+    target_resolution = math.sqrt(density_ratio) * (pixel_ratio_percentage / 100.0)
+    final_resolution = 2**math.ceil(math.log2(target_resolution)) if target_resolution > 0 else 0
+    return target_resolution, final_resolution
+
+def apply_texel_density_result(props, max_density_ratio):
+    props.result_density_ratio = max_density_ratio
     if max_density_ratio == 0:
         props.result_effective_resolution = "N/A"
         props.result_resolution = translate("Calculation failed (off-screen)")
         props.result_udim_tiles = -1 
         props.result_coverage = ""
-        return 'SUCCESS'
+        props.result_projection_resolution = ""
+        return
 
-    required_res_100 = math.sqrt(max_density_ratio)
-    target_resolution = required_res_100 * (props.pixel_ratio_percentage / 100.0)
+    target_resolution, final_resolution = required_texel_resolution(max_density_ratio, props.pixel_ratio_percentage)
     props.result_effective_resolution = f"{target_resolution:.0f} x {target_resolution:.0f} px"
-    
-    final_resolution = 2**math.ceil(math.log2(target_resolution)) if target_resolution > 0 else 0
     props.result_resolution = f"{final_resolution} x {final_resolution} px"
     
     if target_resolution > 0:
@@ -396,10 +1190,576 @@ def calculate_texel_density(context):
     tile_pixels = udim_res**2
     num_tiles = math.ceil(required_total_pixels / tile_pixels) if tile_pixels > 0 else 0
     props.result_udim_tiles = num_tiles
+    props.result_projection_resolution = projection_image_resolution(props.id_data, target_resolution) if uses_projector(props) else ""
+
+def projection_image_resolution(scene, target_resolution):
+    # Projector UVs are in units of the frame height, and the image has the render aspect ratio
+    res_x, res_y = render_resolution(scene)
+    width = target_resolution * res_x / res_y
+    return f"{width:.0f} x {target_resolution:.0f} px ({target_resolution / res_y:.2f}x)"
+
+# --- Texel Density Occlusion ---
+# Triangles of occluding meshes, keyed like _texel_arrays_cache (no UV map needed)
+_texel_occluder_cache = {}
+
+def extract_object_triangles(eval_obj):
+    # (positions, triangle vertices) of the evaluated mesh
+    mesh = eval_obj.to_mesh()
+    try:
+        mesh.calc_loop_triangles()
+        positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32); mesh.vertices.foreach_get("co", positions)
+        tri_verts = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32); mesh.loop_triangles.foreach_get("vertices", tri_verts)
+    finally: eval_obj.to_mesh_clear()
+    return positions.reshape(-1, 3).astype(np.float64), tri_verts.reshape(-1, 3)
+
+def get_cached_occluder_triangles(obj, eval_obj):
+    key = texel_cache_key(obj)
+    occluder = _texel_occluder_cache.get(key)
+    if occluder is None:
+        occluder = extract_object_triangles(eval_obj)
+        _texel_occluder_cache[key] = occluder
+    return occluder
+
+def get_texel_occluders(context, props):
+    if props.occluder_source == 'COLLECTION':
+        objects = props.occluder_collection.all_objects if props.occluder_collection else []
+    else:
+        objects = context.scene.objects
+    return [obj for obj in objects if obj.type == 'MESH' and obj.visible_get()]
+
+def texel_occluder_meshes(context, props, cam_matrix, target_names=None):
+    # (positions, matrix, triangle vertices) of the occluders; target_names are left out
+    depsgraph = context.evaluated_depsgraph_get()
+    meshes = []
+    for obj in get_texel_occluders(context, props):
+        if target_names and obj.name_full in target_names: continue
+        eval_obj = obj.evaluated_get(depsgraph)
+        positions, tri_verts = get_cached_occluder_triangles(obj, eval_obj)
+        meshes.append((positions, cam_matrix @ np.array(eval_obj.matrix_world), tri_verts))
+    return meshes
+
+def texel_depth_buffer(context, props, cam_matrix, targets, target_names=None):
+    # Depth buffer of the occluders and the [(arrays, matrix)] targets
+    meshes = texel_occluder_meshes(context, props, cam_matrix, target_names)
+    meshes += [(arrays.positions, matrix, arrays.loop_verts[arrays.tri_loops]) for arrays, matrix in targets]
+    return texel_engine.DepthBuffer.build(render_resolution(context.scene), props.occlusion_scale, meshes)
+
+def texel_occlusion_masks(context, props, cam_matrix, targets):
+    """Per-face visibility masks for [(obj, arrays, matrix)] from a software depth buffer.
+    The targets always occlude themselves and each other."""
+    depth_buffer = texel_depth_buffer(context, props, cam_matrix, [(arrays, matrix) for _obj, arrays, matrix in targets],
+                                      {obj.name_full for obj, _arrays, _matrix in targets})
+    return [depth_buffer.visible_faces(arrays, matrix) for _obj, arrays, matrix in targets]
+
+# --- Texel Density Statistics ---
+TEXEL_BASIS_PERCENTILES = {'MAX': 100.0, 'P99': 99.0, 'P95': 95.0}
+_texel_stats_cache = {}
+
+def udim_tile_name(u, v):
+    if 0 <= u < 10 and v >= 0: return str(1001 + u + 10 * v)
+    return f"({u}, {v})"
+
+def store_texel_statistics(ratios, areas, tiles, groups=None, objects=None, key=None, results_collection='object_results', islands=None, materials=None):
+    # Keeps the faces that contribute (on screen, valid UVs) so settings changes can re-derive.
+    # objects names the groups, listed in results_collection.
+    # key identifies the geometric inputs (see texel_geometry_key) for reuse by the next calculation.
+    # islands and materials come from texel_island_data and texel_material_data
+    keep = ratios > 0
+    _texel_stats_cache.clear()
+    _texel_stats_cache.update(ratios=ratios[keep], areas=areas[keep], tiles=None if tiles is None else tiles[keep],
+                              groups=None if groups is None else groups[keep], objects=objects, key=key,
+                              results_collection=results_collection)
+    if islands is not None:
+        face_island, *island_info = islands
+        _texel_stats_cache.update(islands=face_island[keep], island_info=island_info)
+    if materials is not None:
+        face_material, material_info = materials
+        _texel_stats_cache.update(materials=face_material[keep], material_info=material_info)
+
+# --- Texel Density UV Islands ---
+ISLAND_RESULT_LIMIT = 50
+# Full per-island table of the last calculation, see get_texel_island_table
+_texel_island_table = {}
+
+def texel_island_data(scene, props, arrays, repeat=1):
+    """Island inputs for store_texel_statistics: per-face island ids (tiled for repeat cameras),
+    island count, UV area and face count per island, and the screen pixels the areas relate to"""
+    if not props.analyze_islands: return None
+    face_island, island_count = arrays.islands
+    res_x, res_y = render_resolution(scene)
+    return (np.tile(face_island, repeat), island_count,
+            np.bincount(face_island, weights=arrays.uv_areas, minlength=island_count),
+            np.bincount(face_island, minlength=island_count), res_x * res_y * repeat)
+
+def get_texel_island_table():
+    """Per-island results of the last calculation as NumPy arrays (index, face_count, density_ratio,
+    resolution, uv_coverage, screen_coverage, wasted_texels), for scripting re-packing decisions"""
+    return dict(_texel_island_table)
+
+def apply_texel_island_statistics(props, texture_resolution):
+    # Required resolution, screen coverage and texels wasted by each island at the recommended texture size
+    _texel_island_table.clear()
+    props.island_results.clear()
+    if 'islands' not in _texel_stats_cache:
+        props.result_island_count = -1
+        return
+    island_count, uv_areas, face_counts, frame_pixels = _texel_stats_cache['island_info']
+    scale = props.pixel_ratio_percentage / 100.0
+    percentile = TEXEL_BASIS_PERCENTILES.get(props.resolution_basis, 100.0)
+    ratios, screen_areas = texel_engine.island_statistics(
+        _texel_stats_cache['ratios'], _texel_stats_cache['areas'], _texel_stats_cache['islands'], island_count, percentile)
+    resolutions = np.sqrt(ratios) * scale
+    # Texels the island gets at the texture size minus the texels it needs (all of them when unseen)
+    wasted = uv_areas * (texture_resolution**2 - np.minimum(resolutions, texture_resolution)**2)
+    _texel_island_table.update(
+        index=np.arange(island_count), face_count=face_counts, density_ratio=ratios, resolution=resolutions,
+        uv_coverage=uv_areas * 100.0, screen_coverage=screen_areas / frame_pixels * 100.0, wasted_texels=wasted)
+    props.result_island_count = island_count
+    texture_pixels = texture_resolution**2
+    for index in np.argsort(-wasted, kind='stable')[:ISLAND_RESULT_LIMIT].tolist():
+        item = props.island_results.add()
+        item.name = str(index)
+        item.face_count = int(face_counts[index])
+        item.density_ratio = ratios[index]
+        item.screen_coverage = _texel_island_table['screen_coverage'][index]
+        item.wasted_share = wasted[index] / texture_pixels * 100.0 if texture_pixels > 0 else 0.0
+
+def apply_texel_cull_stats(props, cull_stats):
+    # Faces rejected by each culling level (summed over frames in Frame Range mode)
+    props.result_cull_faces = cull_stats.get('faces', 0)
+    props.result_cull_object = cull_stats.get('object', 0)
+    props.result_cull_chunk = cull_stats.get('chunk', 0)
+    props.result_cull_face = cull_stats.get('face', 0)
+
+def clear_texel_statistics(props):
+    _texel_stats_cache.clear()
+    props.result_cull_faces = -1
+    props.result_p50 = props.result_p95 = props.result_p99 = "N/A"
+    props.histogram_results.clear()
+    props.mip_results.clear()
+    props.tile_results.clear()
+    props.island_results.clear()
+    props.result_island_count = -1
+    props.texture_results.clear()
+    props.result_texture_savings = -1.0
+    _texel_island_table.clear()
+
+def apply_texel_density_statistics(props):
+    """Re-derives percentiles, histogram, UDIM tiles, per-object, per-island and per-texture results from the cached faces.
+    Statistics are weighted by screen area. Returns the density ratio of the resolution basis, or None"""
+    if not _texel_stats_cache: return None
+    ratios, areas = _texel_stats_cache['ratios'], _texel_stats_cache['areas']
+    scale = props.pixel_ratio_percentage / 100.0
+    percentile = TEXEL_BASIS_PERCENTILES.get(props.resolution_basis, 100.0)
+
+    p50, p95, p99 = texel_engine.weighted_percentiles(ratios, areas, (50.0, 95.0, 99.0))[:, 0]
+    props.result_p50, props.result_p95, props.result_p99 = (f"{math.sqrt(r) * scale:.0f} px" if r > 0 else "N/A" for r in (p50, p95, p99))
+
+    props.histogram_results.clear()
+    if len(ratios):
+        exponents, shares = texel_engine.resolution_histogram(ratios, areas, scale)
+        for i, (exponent, share) in enumerate(zip(exponents, shares)):
+            item = props.histogram_results.add()
+            item.name = f"{2**exponent} px"
+            if i == 0: item.name = "<= " + item.name
+            elif i == len(exponents) - 1: item.name = f"{2**exponent}+ px"
+            item.share = share
+
+    # Screen area by the mip level sampled from a texture of the reference size
+    props.mip_results.clear()
+    if len(ratios):
+        levels = np.clip(np.floor(texel_engine.mip_levels(ratios, int(props.heatmap_texture_size))), -1, 4).astype(np.int64) + 1
+        shares = np.bincount(levels, weights=areas, minlength=6) / areas.sum()
+        for level, share in enumerate(shares):
+            item = props.mip_results.add()
+            item.name = translate("Magnified") if level == 0 else f"Mip {level - 1}" + ("+" if level == 5 else "")
+            item.share = share
+
+    props.tile_results.clear()
+    tiles, tile_ratios, tile_areas = np.zeros((0, 2), dtype=np.int64), np.zeros(0), np.zeros(0)
+    if _texel_stats_cache['tiles'] is not None:
+        tiles, tile_ratios, tile_areas = texel_engine.tile_statistics(ratios, areas, _texel_stats_cache['tiles'], percentile)
+    total_area = tile_areas.sum()
+    for (u, v), tile_ratio, tile_area in sorted(zip(tiles.tolist(), tile_ratios, tile_areas), key=lambda item: (item[0][1], item[0][0])):
+        item = props.tile_results.add()
+        item.name = udim_tile_name(u, v)
+        item.density_ratio = tile_ratio
+        item.coverage = tile_area / total_area * 100.0 if total_area > 0 else 0.0
+
+    objects = _texel_stats_cache['objects']
+    if objects:
+        object_ratios = texel_engine.grouped_statistic(ratios, areas, _texel_stats_cache['groups'], len(objects), percentile)
+        results = getattr(props, _texel_stats_cache['results_collection'])
+        results.clear()
+        for (name, face_count), object_ratio in sorted(zip(objects, object_ratios), key=lambda item: -item[1]):
+            item = results.add()
+            item.name = name
+            item.density_ratio = object_ratio
+            item.face_count = face_count
+
+    basis_ratio = 0.0
+    if len(ratios):
+        basis_ratio = float(texel_engine.grouped_statistic(ratios, areas, np.zeros(len(ratios), dtype=np.intp), 1, percentile)[0])
+    apply_texel_island_statistics(props, required_texel_resolution(basis_ratio, props.pixel_ratio_percentage)[1])
+    apply_texel_texture_statistics(props)
+    return basis_ratio
+
+# --- Texel Density Textures ---
+def material_images(material):
+    # Images of the material's Image Texture nodes, including nested node groups
+    if not material or not material.use_nodes or not material.node_tree: return []
+    images, trees, seen = [], [material.node_tree], set()
+    while trees:
+        tree = trees.pop()
+        if tree.as_pointer() in seen: continue
+        seen.add(tree.as_pointer())
+        for node in tree.nodes:
+            if node.type == 'TEX_IMAGE' and node.image and node.image not in images: images.append(node.image)
+            elif node.type == 'GROUP' and node.node_tree: trees.append(node.node_tree)
+    return images
+
+def slot_materials(obj):
+    return [slot.material for slot in obj.material_slots]
+
+def texel_material_data(props, targets):
+    """Material inputs for store_texel_statistics from (slot materials, arrays, faces) targets, faces
+    being the face indices stored for the target (None for all): per-face material ids, and the
+    material names, image names per material and (width, height, bits per pixel) per image"""
+    if not props.analyze_textures: return None
+    material_ids, material_names, material_image_names, image_sizes = {}, [], [], {}
+    face_material = []
+    for materials, arrays, faces in targets:
+        slot_ids = []
+        for material in materials:
+            if material is None:
+                slot_ids.append(-1)
+                continue
+            if material.name_full not in material_ids:
+                material_ids[material.name_full] = len(material_names)
+                images = material_images(material)
+                material_names.append(material.name_full)
+                material_image_names.append([image.name_full for image in images])
+                for image in images: image_sizes[image.name_full] = (image.size[0], image.size[1], image.depth)
+            slot_ids.append(material_ids[material.name_full])
+        # Faces without a material, or with a slot index past the last slot, are left out (-1)
+        slot_ids = np.array(slot_ids + [-1])
+        ids = slot_ids[np.minimum(arrays.material_index, len(slot_ids) - 1)]
+        face_material.append(ids if faces is None else ids[faces])
+    return np.concatenate([np.zeros(0, dtype=np.int64)] + face_material), (material_names, material_image_names, image_sizes)
+
+def texel_texture_status(item, pixel_ratio_percentage):
+    # 'UNSEEN', 'UNDER' (smaller than required), 'OVER' (larger than the recommended size) or 'OK'
+    target_resolution, final_resolution = required_texel_resolution(item.density_ratio, pixel_ratio_percentage)
+    size = max(item.width, item.height)
+    if final_resolution == 0: return 'UNSEEN'
+    if size < target_resolution: return 'UNDER'
+    if size > final_resolution: return 'OVER'
+    return 'OK'
+
+def apply_texel_texture_statistics(props):
+    # Required resolution per material (one grouped pass over the face material ids), compared
+    # with the size of every image the material uses. Savings assume uncompressed images without mipmaps
+    props.texture_results.clear()
+    props.result_texture_savings = -1.0
+    if 'materials' not in _texel_stats_cache: return
+    material_names, material_image_names, image_sizes = _texel_stats_cache['material_info']
+    face_material = _texel_stats_cache['materials']
+    valid = face_material >= 0
+    percentile = TEXEL_BASIS_PERCENTILES.get(props.resolution_basis, 100.0)
+    material_ratios = texel_engine.grouped_statistic(
+        _texel_stats_cache['ratios'][valid], _texel_stats_cache['areas'][valid], face_material[valid], len(material_names), percentile)
+
+    # An image shared by several materials must satisfy the most demanding one
+    image_ratios, image_materials = {}, {}
+    for name, image_names, material_ratio in zip(material_names, material_image_names, material_ratios):
+        for image_name in image_names:
+            image_ratios[image_name] = max(image_ratios.get(image_name, 0.0), float(material_ratio))
+            image_materials.setdefault(image_name, []).append(name)
+
+    total_saved = 0.0
+    rows = []
+    for image_name, image_ratio in image_ratios.items():
+        width, height, depth = image_sizes[image_name]
+        if width <= 0 or height <= 0: continue  # Missing or unloaded image
+        _target_resolution, final_resolution = required_texel_resolution(image_ratio, props.pixel_ratio_percentage)
+        size = max(width, height)
+        saved = 0.0
+        if 0 < final_resolution < size:
+            saved = width * height * depth / 8.0 * (1.0 - (final_resolution / size)**2)
+        total_saved += saved
+        rows.append((image_name, width, height, image_ratio, saved))
+    for image_name, width, height, image_ratio, saved in sorted(rows, key=lambda row: (-row[4], -row[3])):
+        item = props.texture_results.add()
+        item.name = image_name
+        item.materials = ", ".join(image_materials[image_name])
+        item.width, item.height = width, height
+        item.density_ratio = image_ratio
+        item.saved_bytes = saved
+    props.result_texture_savings = total_saved
+
+# --- Tessellation Density ---
+def get_tessellation_targets(context, props):
+    # Same targets as the texel density, but no UV map is needed
+    return [obj for obj in get_target_objects(context, props) if obj.type == 'MESH']
+
+def tessellation_region_name(region):
+    # Regions are numbered from the bottom-left; names read from the top-left (A1 = top left)
+    row, column = divmod(region, texel_engine.REGION_GRID)
+    return f"{chr(ord('A') + column)}{texel_engine.REGION_GRID - row}"
+
+def calculate_tessellation_density(context):
+    """Triangles per screen pixel of every target, per object and per frame region, in one batched
+    pass per frame. Over a frame range each object and region keeps its densest frame.
+    Returns 'SUCCESS' or an error message"""
+    scene = context.scene
+    props = scene.analysis_toolkit_props.texel_density_calculator
+    targets = get_tessellation_targets(context, props)
+    if not scene.camera or not targets: return "Prerequisites not met."
+    use_range = props.tessellation_use_range
+    frames = range(props.range_start_frame, props.range_end_frame + 1) if use_range else [scene.frame_current]
+    if not frames: return "Invalid frame range."
+
+    resolution = render_resolution(scene)
+    # Cached triangles are only valid while the mesh does not deform over the range
+    deforming = {obj.name_full for obj in targets if use_range and has_animated_geometry(scene, obj)}
+    region_count = texel_engine.REGION_GRID**2
+    best = {name: [np.zeros(count, dtype=np.int64), np.zeros(count), np.zeros(count, dtype=np.int64), np.full(count, -1)]
+            for name, count in (('objects', len(targets)), ('regions', region_count))}
+    original_frame = scene.frame_current
+    try:
+        for frame in frames:
+            if use_range: scene.frame_set(frame)
+            cam = scene.camera
+            if not cam: continue
+            depsgraph = context.evaluated_depsgraph_get()
+            cam_matrix = camera_projection_matrix(scene, cam)
+            areas, objects, regions = [np.zeros(0)], [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+            for index, obj in enumerate(targets):
+                eval_obj = obj.evaluated_get(depsgraph)
+                matrix = cam_matrix @ np.array(eval_obj.matrix_world)
+                bounds = np.array(eval_obj.bound_box)
+                if texel_engine.boxes_outside(bounds.min(axis=0)[None], bounds.max(axis=0)[None], matrix, resolution)[0]: continue
+                positions, tri_verts = extract_object_triangles(eval_obj) if obj.name_full in deforming else get_cached_occluder_triangles(obj, eval_obj)
+                tri_areas, tri_regions = texel_engine.triangle_screen_areas(positions, matrix, tri_verts, resolution)
+                areas.append(tri_areas); regions.append(tri_regions)
+                objects.append(np.full(len(tri_areas), index))
+            areas = np.concatenate(areas)
+            for name, groups, count in (('objects', objects, len(targets)), ('regions', regions, region_count)):
+                counts, screen_areas, subpixel = texel_engine.tessellation_statistics(areas, np.concatenate(groups), count)
+                current = best[name]
+                density = np.divide(counts, screen_areas, out=np.zeros(count), where=screen_areas > 0)
+                best_density = np.divide(current[0], current[1], out=np.zeros(count), where=current[1] > 0)
+                denser = density > best_density
+                for values, new in zip(current, (counts, screen_areas, subpixel, np.full(count, frame))):
+                    values[denser] = new[denser]
+    finally:
+        if use_range: scene.frame_set(original_frame)
+
+    for name, collection, names in (('objects', props.tessellation_results, [obj.name for obj in targets]),
+                                    ('regions', props.tessellation_region_results, [tessellation_region_name(region) for region in range(region_count)])):
+        collection.clear()
+        counts, screen_areas, subpixel, peak_frames = best[name]
+        rows = zip(names, counts.tolist(), screen_areas.tolist(), subpixel.tolist(), peak_frames.tolist())
+        if name == 'objects': rows = sorted(rows, key=lambda row: -(row[1] / row[2] if row[2] > 0 else 0.0))
+        else: rows = sorted(rows, key=lambda row: row[0][1:] + row[0][0])  # A1, B1, ... row by row from the top
+        for item_name, count, screen_area, subpixel_count, peak_frame in rows:
+            item = collection.add()
+            item.name = item_name
+            item.triangle_count, item.screen_area, item.subpixel_count = count, screen_area, subpixel_count
+            item.frame = peak_frame if use_range else -1
+    total_area = sum(item.screen_area for item in props.tessellation_results)
+    total_count = sum(item.triangle_count for item in props.tessellation_results)
+    props.result_tessellation = f"{total_count / total_area:.3f}" if total_area > 0 else "0"
     return 'SUCCESS'
 
+def tessellation_advice_text(item, target_pixels):
+    ratio, levels = texel_engine.tessellation_advice(item.triangle_count, item.screen_area, target_pixels)
+    if ratio < 1.0: return translate("Decimate to {percent}%", percent=f"{ratio * 100:.0f}")
+    if levels > 0: return translate("Subdivide +{levels}", levels=levels)
+    return translate("OK") if item.triangle_count else translate("Off-screen")
+
+# --- Texel Density Background Jobs ---
+# One worker thread runs the NumPy work (which releases the GIL) so the viewport stays
+# responsive; a timer applies the result on the main thread. Only the latest job counts:
+# submitting or cancelling drops the previous one (a running job finishes, its result is discarded).
+_texel_executor = None
+_texel_job = {}
+
+def submit_texel_job(scene, work, finish):
+    """Runs work() on the worker thread, then finish(scene, result) on the main thread"""
+    global _texel_executor
+    cancel_texel_job()
+    if _texel_executor is None: _texel_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TexelDensity")
+    _texel_job.update(future=_texel_executor.submit(work), scene=scene.name, finish=finish)
+    if not bpy.app.timers.is_registered(texel_job_timer): bpy.app.timers.register(texel_job_timer, first_interval=0.02)
+
+def cancel_texel_job():
+    future = _texel_job.get('future')
+    if future is not None: future.cancel()
+    _texel_job.clear()
+    _texel_progressive.clear()
+
+def is_texel_job_running():
+    return 'future' in _texel_job or is_texel_progressive_running()
+
+def texel_job_timer():
+    future = _texel_job.get('future')
+    if future is None: return None
+    if not future.done(): return 0.02
+    job = dict(_texel_job)
+    _texel_job.clear()
+    scene = bpy.data.scenes.get(job['scene'])
+    if scene is None or not hasattr(scene, 'analysis_toolkit_props'): return None
+    try: result = future.result()
+    except Exception as e:
+        print(f"Analysis Toolkit: background texel density failed ({e})")
+        return None
+    job['finish'](scene, result)
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas: area.tag_redraw()
+    return None
+
+def shutdown_texel_jobs():
+    global _texel_executor
+    cancel_texel_job()
+    for timer in (texel_job_timer, texel_progressive_timer):
+        if bpy.app.timers.is_registered(timer): bpy.app.timers.unregister(timer)
+    if _texel_executor is not None:
+        _texel_executor.shutdown(wait=False, cancel_futures=True)
+        _texel_executor = None
+    texel_engine.shutdown_pool()
+
+# --- Texel Density Progressive Calculation ---
+# Estimates the result from a growing stratified sample of faces: each timer tick evaluates
+# about PROGRESSIVE_SLICE_SECONDS of faces on the main thread and refreshes the estimate and
+# its confidence band. Once every face is done, finish receives the exact per-face result.
+PROGRESSIVE_SLICE_SECONDS = 0.05
+_texel_progressive = {}
+
+def start_texel_progressive(scene, density, finish):
+    """Evaluates the first slice immediately, then keeps refining density on a timer"""
+    cancel_texel_job()
+    _texel_progressive.update(density=density, scene=scene.name, finish=finish)
+    if texel_progressive_timer() is not None and not bpy.app.timers.is_registered(texel_progressive_timer):
+        bpy.app.timers.register(texel_progressive_timer, first_interval=0.01)
+
+def is_texel_progressive_running():
+    return 'density' in _texel_progressive
+
+def apply_texel_progressive_estimate(props, density):
+    percentile = TEXEL_BASIS_PERCENTILES.get(props.resolution_basis, 100.0)
+    estimate, low, high = density.estimate(percentile)
+    apply_texel_density_result(props, estimate)
+    props.result_progress = density.progress * 100.0
+    scale = props.pixel_ratio_percentage / 100.0
+    if percentile >= 100.0:
+        # The sample maximum can only grow
+        props.result_confidence = translate("At least {resolution}", resolution=f"{math.sqrt(low) * scale:.0f} px")
+    else:
+        props.result_confidence = f"{math.sqrt(low) * scale:.0f} - {math.sqrt(high) * scale:.0f} px"
+
+def texel_progressive_timer():
+    density = _texel_progressive.get('density')
+    if density is None: return None
+    scene = bpy.data.scenes.get(_texel_progressive['scene'])
+    if scene is None or not hasattr(scene, 'analysis_toolkit_props'):
+        _texel_progressive.clear()
+        return None
+    props = scene.analysis_toolkit_props.texel_density_calculator
+    finished = density.run(PROGRESSIVE_SLICE_SECONDS)
+    if finished:
+        finish = _texel_progressive['finish']
+        _texel_progressive.clear()
+        finish(scene, (density.ratios, density.areas))
+    else: apply_texel_progressive_estimate(props, density)
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas: area.tag_redraw()
+    return None if finished else 0.01
+
+# --- Texel Density Heatmap ---
+HEATMAP_ATTRIBUTE = "SS_Resolution"
+HEATMAP_COLOR_ATTRIBUTE = "SS_Resolution_Color"
+
+def heatmap_colors(values):
+    # Blue -> cyan -> green -> yellow -> red for values in 0..1 (RGBA)
+    stops = np.linspace(0.0, 1.0, 5)
+    colors = np.empty((len(values), 4), dtype=np.float32)
+    colors[:, 0] = np.interp(values, stops, [0.0, 0.0, 0.0, 1.0, 1.0])
+    colors[:, 1] = np.interp(values, stops, [0.0, 1.0, 1.0, 1.0, 0.0])
+    colors[:, 2] = np.interp(values, stops, [1.0, 1.0, 0.0, 0.0, 0.0])
+    colors[:, 3] = 1.0
+    return colors
+
+def write_texel_density_heatmap(context):
+    scene = context.scene
+    props = scene.analysis_toolkit_props.texel_density_calculator
+    obj = props.target_object
+    cameras = get_texel_density_cameras(context, props) if is_multi_camera(props) else [scene.camera] if scene.camera else []
+    if not obj or not cameras or not has_texel_uvs(props, obj): return "Prerequisites not met."
+    if obj.mode == 'EDIT': return "Leave Edit Mode to write the heatmap."
+
+    eval_obj = obj.evaluated_get(context.evaluated_depsgraph_get())
+    arrays = get_texel_object_arrays(scene, props, obj, eval_obj)
+    if arrays is None: return "Active UV layer not found."
+    mesh = obj.data
+    if arrays.face_count != len(mesh.polygons) or len(arrays.loop_verts) != len(mesh.loops):
+        return "Modifiers change the face count. Apply them to write a heatmap."
+
+    if len(cameras) > 1:
+        # Worst case of every face over all cameras
+        ratios = np.max([ratios for ratios, _areas in texel_camera_densities(context, props, obj, eval_obj, arrays, cameras)], axis=0)
+    else:
+        ratios, _areas = texel_density_numpy(context, props, cameras[0], obj, eval_obj, arrays)
+    values = np.sqrt(ratios) * (props.pixel_ratio_percentage / 100.0)
+    if props.heatmap_mode == 'RATIO':
+        # 1.0 = the chosen texture size is exactly enough; colors span 1/4x (blue) to 4x (red)
+        values /= int(props.heatmap_texture_size)
+        t = np.clip((np.log2(np.maximum(values, 1e-12)) + 2.0) / 4.0, 0.0, 1.0)
+    else:
+        peak = values.max() if len(values) else 0.0
+        t = values / peak if peak > 0 else np.zeros_like(values)
+    colors = heatmap_colors(t)
+    colors[ratios <= 0] = (0.1, 0.1, 0.1, 1.0)
+
+    attr = mesh.attributes.get(HEATMAP_ATTRIBUTE)
+    if attr and (attr.domain != 'FACE' or attr.data_type != 'FLOAT'):
+        mesh.attributes.remove(attr); attr = None
+    if attr is None: attr = mesh.attributes.new(HEATMAP_ATTRIBUTE, 'FLOAT', 'FACE')
+    attr.data.foreach_set("value", values.astype(np.float32))
+
+    color_attr = mesh.color_attributes.get(HEATMAP_COLOR_ATTRIBUTE)
+    if color_attr and (color_attr.domain != 'CORNER' or color_attr.data_type != 'FLOAT_COLOR'):
+        mesh.color_attributes.remove(color_attr); color_attr = None
+    if color_attr is None: color_attr = mesh.color_attributes.new(HEATMAP_COLOR_ATTRIBUTE, 'FLOAT_COLOR', 'CORNER')
+    color_attr.data.foreach_set("color", np.repeat(colors, arrays.loop_total, axis=0).ravel())
+    mesh.color_attributes.active_color = color_attr
+    mesh.update()
+    return 'SUCCESS'
+
+def on_texel_density_derived_change(self, context):
+    # Pixel ratio, UDIM size and resolution basis only re-derive from the stored geometric result
+    if not hasattr(context.scene, 'analysis_toolkit_props'): return
+    props = context.scene.analysis_toolkit_props.texel_density_calculator
+    density_ratio = apply_texel_density_statistics(props)
+    if density_ratio is None:
+        if props.result_density_ratio <= 0:
+            # Nothing calculated yet
+            if props.target_mode == 'OBJECT' and props.calc_mode == 'CURRENT' and props.target_object: calculate_texel_density(context)
+            return
+        density_ratio = props.result_density_ratio
+    apply_texel_density_result(props, density_ratio)
+
 def on_texel_density_property_change(self, context):
-    if hasattr(context.scene, 'analysis_toolkit_props') and context.scene.analysis_toolkit_props.texel_density_calculator.target_object:
+    if not hasattr(context.scene, 'analysis_toolkit_props'): return
+    props = context.scene.analysis_toolkit_props.texel_density_calculator
+    # Frame range and multi-object results are only refreshed on request (the scan can be long);
+    # settings changes just re-derive the displayed values from the stored ratio
+    if props.target_mode != 'OBJECT' or props.calc_mode == 'RANGE':
+        density_ratio = apply_texel_density_statistics(props)
+        if density_ratio is None: density_ratio = props.result_density_ratio
+        if density_ratio > 0: apply_texel_density_result(props, density_ratio)
+        return
+    if props.target_object:
         calculate_texel_density(context)
 
 # --- Lux/EV Converter ---
@@ -461,32 +1821,91 @@ def initial_calculation():
     return None
 
 _msgbus_owner = object()
-def on_resolution_change(*args):
-    context = bpy.context
-    if not context.scene or not hasattr(context.scene, 'analysis_toolkit_props'): return
+# Render and camera settings the texel density projection depends on
+TEXEL_MSGBUS_KEYS = (
+    (bpy.types.RenderSettings, "resolution_x"), (bpy.types.RenderSettings, "resolution_y"),
+    (bpy.types.RenderSettings, "resolution_percentage"), (bpy.types.Scene, "camera"),
+    (bpy.types.Camera, "type"), (bpy.types.Camera, "lens"), (bpy.types.Camera, "ortho_scale"),
+    (bpy.types.Camera, "sensor_width"), (bpy.types.Camera, "sensor_height"), (bpy.types.Camera, "sensor_fit"),
+    (bpy.types.Camera, "shift_x"), (bpy.types.Camera, "shift_y"),
+)
 
-    props_main = context.scene.analysis_toolkit_props
-    render = context.scene.render
-    if not props_main.texel_density_calculator.target_object or not context.scene.camera: return
-    if props_main.td_last_res_x == render.resolution_x and props_main.td_last_res_y == render.resolution_y: return
-    
-    props_main.td_last_res_x = render.resolution_x
-    props_main.td_last_res_y = render.resolution_y
-    calculate_texel_density(context)
+def on_resolution_change(*args):
+    # Fires for every step of a slider drag; the timer coalesces them into one recalculation
+    schedule_texel_update(0.1)
 
 def register_msgbus():
-    bpy.msgbus.subscribe_rna(key=(bpy.types.RenderSettings, "resolution_x"), owner=_msgbus_owner, args=(), notify=on_resolution_change)
-    bpy.msgbus.subscribe_rna(key=(bpy.types.RenderSettings, "resolution_y"), owner=_msgbus_owner, args=(), notify=on_resolution_change)
+    for key in TEXEL_MSGBUS_KEYS:
+        bpy.msgbus.subscribe_rna(key=key, owner=_msgbus_owner, args=(), notify=on_resolution_change)
 
 def unregister_msgbus():
     bpy.msgbus.clear_by_owner(_msgbus_owner)
 
+def texel_deferred_update():
+    context = bpy.context
+    if context.scene and hasattr(context.scene, 'analysis_toolkit_props'):
+        props = context.scene.analysis_toolkit_props.texel_density_calculator
+        # Frame range and multi-object results are only refreshed on request
+        if props.target_mode == 'OBJECT' and props.calc_mode == 'CURRENT' and props.target_object and (context.scene.camera or is_multi_camera(props)):
+            calculate_texel_density(context)
+    return None
+
+def schedule_texel_update(delay=0.05):
+    # The registered timer is the pending flag: timers are dropped on file load, a flag would not be
+    if bpy.app.timers.is_registered(texel_deferred_update): return
+    bpy.app.timers.register(texel_deferred_update, first_interval=delay)
+
+@persistent
+def on_texel_depsgraph_update(scene, depsgraph):
+    props = scene.analysis_toolkit_props.texel_density_calculator if hasattr(scene, 'analysis_toolkit_props') else None
+    live = props is not None and props.live_update and props.target_mode == 'OBJECT' and props.calc_mode == 'CURRENT' and props.target_object
+    projector = props.projector_camera if live and uses_projector(props) else None
+    needs_update = False
+    for update in depsgraph.updates:
+        id_orig = update.id.original
+        if update.is_updated_geometry and (_texel_arrays_cache or _texel_occluder_cache): invalidate_texel_cache(id_orig)
+        if not live: continue
+        if isinstance(id_orig, bpy.types.Object):
+            if not (update.is_updated_transform or update.is_updated_geometry): continue
+            if id_orig in (props.target_object, scene.camera) or (projector and id_orig == projector): needs_update = True
+            elif props.use_occlusion and id_orig.type == 'MESH': needs_update = True
+            elif props.camera_source != 'ACTIVE' and id_orig.type == 'CAMERA': needs_update = True
+        elif isinstance(id_orig, bpy.types.Camera):
+            if props.camera_source != 'ACTIVE' or (scene.camera and scene.camera.data == id_orig): needs_update = True
+            elif projector and projector.data == id_orig: needs_update = True
+    # Coalesce bursts of updates (e.g. while dragging the camera) into one recalculation
+    if needs_update: schedule_texel_update()
+
+@persistent
+def on_load_pre_handler(dummy):
+    # A modal lux measurement must not remove data of the file being closed
+    for session in list(_lux_sessions): session.detach()
+
+@persistent
+def on_undo_handler(scene, *args):
+    # Undo and redo (from the menu, the history or any shortcut) restore a state without the
+    # rig and the results of a running lux measurement, so it has to stop
+    global lux_undo_count
+    lux_undo_count += 1
+
 @persistent
 def on_load_handler(dummy):
+    cancel_texel_job()
+    _texel_arrays_cache.clear()
+    _texel_occluder_cache.clear()
+    _texel_projector_cache.clear()
+    _texel_stats_cache.clear()
+    # Subscriptions do not survive loading a file
+    unregister_msgbus(); register_msgbus()
     bpy.app.timers.register(initial_calculation)
 
 app_handlers = [
     (bpy.app.handlers.frame_change_post, speedo_realtime_update),
+    (bpy.app.handlers.frame_change_post, on_texel_depsgraph_update),
+    (bpy.app.handlers.depsgraph_update_post, on_texel_depsgraph_update),
+    (bpy.app.handlers.load_pre, on_load_pre_handler),
+    (bpy.app.handlers.undo_pre, on_undo_handler),
+    (bpy.app.handlers.redo_pre, on_undo_handler),
     (bpy.app.handlers.load_post, on_load_handler)
 ]
 
@@ -501,4 +1920,11 @@ def unregister():
     unregister_msgbus()
     for handler_list, handler_func in app_handlers:
         if handler_func in handler_list:
-            handler_list.remove(handler_func)
\ No newline at end of file
+            handler_list.remove(handler_func)
+    if bpy.app.timers.is_registered(texel_deferred_update):
+        bpy.app.timers.unregister(texel_deferred_update)
+    shutdown_texel_jobs()
+    _texel_arrays_cache.clear()
+    _texel_occluder_cache.clear()
+    _texel_projector_cache.clear()
+    _texel_stats_cache.clear()
\ No newline at end of file